@@ -1,21 +1,30 @@
 """PlantHub Integration für Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Dict, List, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    CONF_AUTO_SHARDS,
+    CONF_STREAMING,
     CONF_TOKEN,
+    CONF_TRANSPORT,
+    DATA_FLEET_OWNER,
     DEFAULT_NAME,
+    DEFAULT_SHARD,
+    DEFAULT_STREAMING,
     DEVICE_MANUFACTURER,
     DEVICE_MODEL,
     DEVICE_SW_VERSION,
     DOMAIN,
+    SIGNAL_PLANTS_UPDATED,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,6 +34,16 @@ PLATFORMS: list[str] = ["sensor"]
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the PlantHub component."""
+    # Services werden unabhängig von der YAML-Konfiguration registriert
+    from .services import async_setup_services
+
+    await async_setup_services(hass)
+
+    # WebSocket-Befehle planthub/snapshot und planthub/subscribe
+    from .websocket_api import async_setup_websocket_api
+
+    async_setup_websocket_api(hass)
+
     if DOMAIN not in config:
         return True
     
@@ -39,6 +58,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN][CONF_TOKEN] = token
     
     _LOGGER.info("PlantHub Token aus configuration.yaml geladen")
+
+    # Optional: API-Verkehr aufzeichnen oder aus einer Datei wiedergeben
+    if transport_config := config[DOMAIN].get(CONF_TRANSPORT):
+        import voluptuous as vol
+
+        from .transport import async_setup_transport
+
+        try:
+            async_setup_transport(hass, transport_config)
+        except vol.Invalid as err:
+            _LOGGER.error("Ungültige PlantHub Transport-Konfiguration: %s", err)
     return True
 
 
@@ -51,19 +81,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("PlantHub Token nicht verfügbar. Bitte konfiguriere den Token in configuration.yaml")
         return False
 
-    # Erstelle den Data Update Coordinator
+    # Erstelle je Shard einen Data Update Coordinator
     from .sensor import PlantHubDataUpdateCoordinator
-    
-    coordinator = PlantHubDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
-
-    # Speichere den Coordinator
+    from .sharding import group_plants
+
+    primary = None
+    coordinators = []
+    for shard, plants in group_plants(entry.data).items():
+        coordinator = PlantHubDataUpdateCoordinator(
+            hass,
+            entry,
+            shard=shard,
+            plants=plants,
+            backends=primary.backends if primary else None,
+            hedge=primary.hedge if primary else None,
+            fleet=primary.fleet if primary else None,
+        )
+        primary = primary or coordinator
+        coordinators.append(coordinator)
+    if len(coordinators) > 1:
+        _LOGGER.info(
+            "PlantHub Shards: %s",
+            {c.shard: [p["plant_id"] for p in c.plants] for c in coordinators},
+        )
+
+    await asyncio.gather(
+        *(coordinator.async_config_entry_first_refresh() for coordinator in coordinators)
+    )
+
+    # Aktive Health-Checks, falls mehrere Backends konfiguriert sind
+    entry.async_on_unload(primary.backends.async_start_health_checks(hass))
+
+    # Optional: Push-Updates per Stream, Polling nur noch als Rückfall
+    stream = None
+    if entry.data.get(CONF_STREAMING, DEFAULT_STREAMING):
+        from .stream import PlantHubStream
+
+        stream = PlantHubStream(hass, entry, coordinators)
+        entry.async_on_unload(stream.async_start())
+
+    # Speichere die Coordinatoren
     hass.data[DOMAIN][entry.entry_id] = {
-        "coordinator": coordinator,
+        "coordinators": coordinators,
+        "stream": stream,
     }
 
     # Erstelle Device Registry Einträge für alle konfigurierten Pflanzen
-    await _create_device_registry_entries(hass, entry, coordinator)
+    await _create_device_registry_entries(hass, entry, coordinators)
 
     # Device Registry Listener sind in Home Assistant 2025 nicht verfügbar
     # await _register_device_registry_listener(hass, entry)
@@ -98,8 +162,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Entferne Device Registry Einträge
         await _remove_device_registry_entries(hass, entry)
         
-        # Entferne den Coordinator
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Entferne die Coordinatoren
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        for coordinator in entry_data["coordinators"]:
+            await coordinator.async_shutdown()
+
+        # Die Flotten-Sensoren aller Einträge übernimmt ein verbleibender
+        # geladener Eintrag
+        if hass.data[DOMAIN].get(DATA_FLEET_OWNER) == entry.entry_id:
+            del hass.data[DOMAIN][DATA_FLEET_OWNER]
+            from .sensor import async_claim_fleet_sensors
+
+            for other_entry in hass.config_entries.async_entries(DOMAIN):
+                if other_entry.entry_id in hass.data[DOMAIN] and async_claim_fleet_sensors(
+                    hass, other_entry.entry_id
+                ):
+                    break
+
+        # WebSocket-Abonnenten melden die Pflanzen des Eintrags als entfernt
+        async_dispatcher_send(hass, SIGNAL_PLANTS_UPDATED, None)
 
     _LOGGER.info("PlantHub Integration erfolgreich entladen")
     return unload_ok
@@ -107,19 +188,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data and entry_data.get("applied_data") == entry.data:
+        # Änderung wurde bereits ohne Neuladen übernommen (automatisches Sharding)
+        return
     _LOGGER.info("Lade PlantHub Integration neu: %s", entry.data.get("name", DEFAULT_NAME))
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
 
 
 async def _create_device_registry_entries(
-    hass: HomeAssistant, entry: ConfigEntry, coordinator: Any
+    hass: HomeAssistant, entry: ConfigEntry, coordinators: List[Any]
 ) -> None:
     """Erstelle Device Registry Einträge für alle konfigurierten Pflanzen."""
     try:
         device_registry = dr.async_get(hass)
         
-        for plant_config in coordinator.plants:
+        for plant_config in (p for c in coordinators for p in c.plants):
             plant_id = plant_config["plant_id"]
             plant_name = plant_config["name"]
             
@@ -251,12 +336,8 @@ def _remove_plant_from_config(hass: HomeAssistant, entry: ConfigEntry, device_id
             
             _LOGGER.info("Pflanze %s erfolgreich aus der Konfiguration entfernt", plant_id)
             
-            # Aktualisiere den Coordinator
-            if entry.entry_id in hass.data.get(DOMAIN, {}):
-                coordinator = hass.data[DOMAIN][entry.entry_id].get("coordinator")
-                if coordinator:
-                    coordinator.plants = new_data.get("plants", [])
-                    _LOGGER.debug("Coordinator für Integration %s aktualisiert", entry.entry_id)
+            # Aktualisiere die Coordinatoren
+            _update_coordinator_plants(hass, entry, plant_id)
         
     except Exception as e:
         _LOGGER.error("Fehler beim Entfernen der Pflanze %s aus der Konfiguration: %s", plant_id, e)
@@ -283,12 +364,86 @@ async def _update_plant_config_from_entity(hass: HomeAssistant, entry: ConfigEnt
             
             _LOGGER.info("Entität %s entfernt, Pflanze %s aus Konfiguration entfernt", entity_id, entity.unique_id)
             
-            # Aktualisiere den Coordinator
-            if entry.entry_id in hass.data.get(DOMAIN, {}):
-                coordinator = hass.data[DOMAIN][entry.entry_id].get("coordinator")
-                if coordinator:
-                    coordinator.plants = new_data.get("plants", [])
-                    _LOGGER.debug("Coordinator für Integration %s aktualisiert", entry.entry_id)
+            # Aktualisiere die Coordinatoren
+            _update_coordinator_plants(hass, entry, entity.unique_id)
         
     except Exception as e:
         _LOGGER.error("Fehler beim Aktualisieren der Konfiguration nach Entitätsentfernung: %s", e)
+
+
+def _update_coordinator_plants(
+    hass: HomeAssistant, entry: ConfigEntry, plant_id: str, target: Optional[str] = None
+) -> None:
+    """Entferne eine Pflanze aus dem Coordinator ihres Shards.
+
+    Mit ``target`` wird sie stattdessen dem Coordinator dieses Shards
+    zugewiesen.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not entry_data:
+        return
+    moved = None
+    for coordinator in entry_data["coordinators"]:
+        remaining = [p for p in coordinator.plants if p["plant_id"] != plant_id]
+        if len(remaining) != len(coordinator.plants):
+            moved = next(p for p in coordinator.plants if p["plant_id"] == plant_id)
+            coordinator.set_plants(remaining)
+    if moved is not None and target is not None:
+        for coordinator in entry_data["coordinators"]:
+            if coordinator.shard == target:
+                coordinator.set_plants([*coordinator.plants, moved])
+    _LOGGER.debug("Coordinatoren für Integration %s aktualisiert", entry.entry_id)
+
+
+async def async_move_plants(
+    hass: HomeAssistant, entry: ConfigEntry, moves: Dict[str, str]
+) -> None:
+    """Verschiebe Pflanzen im automatischen Sharding in andere Shards.
+
+    Existieren alle Ziel-Shards bereits, werden die Pflanzen ohne Neuladen
+    zwischen den Coordinatoren umgehängt und nur ihre Entitäten neu
+    angelegt. Die Zuordnung wird gespeichert, ohne den Eintrag neu zu
+    laden. Nur für einen noch fehlenden Shard wird der Eintrag neu geladen.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not entry_data:
+        return
+    coordinators = {c.shard: c for c in entry_data["coordinators"]}
+    owners = {p["plant_id"]: c for c in coordinators.values() for p in c.plants}
+    moves = {
+        plant_id: target
+        for plant_id, target in moves.items()
+        if plant_id in owners and owners[plant_id].shard != target
+    }
+    if not moves:
+        return
+
+    _LOGGER.info("Automatisches Sharding: verschiebe Pflanzen %s", moves)
+    auto_shards = {**entry.data.get(CONF_AUTO_SHARDS, {}), **moves}
+    auto_shards = {p: s for p, s in auto_shards.items() if s != DEFAULT_SHARD}
+    new_data = {**entry.data, CONF_AUTO_SHARDS: auto_shards}
+
+    if not all(target in coordinators for target in moves.values()):
+        # Neuer Shard braucht einen eigenen Coordinator: Neuladen
+        hass.config_entries.async_update_entry(entry, data=new_data)
+        return
+
+    from .sensor import async_move_plant_entities
+
+    for plant_id, target in moves.items():
+        source = owners[plant_id]
+        plant_config = next(p for p in source.plants if p["plant_id"] == plant_id)
+        _update_coordinator_plants(hass, entry, plant_id, target)
+        await async_move_plant_entities(
+            hass, entry, plant_config, source, coordinators[target]
+        )
+    if entry_data.get("stream") is not None:
+        entry_data["stream"].async_update_owners()
+
+    entry_data["applied_data"] = new_data
+    hass.config_entries.async_update_entry(entry, data=new_data)
+    # Der neue Shard holt die Pflanzen sofort ab
+    for target in set(moves.values()):
+        await coordinators[target].async_request_plant_refresh(
+            [p for p, s in moves.items() if s == target]
+        )
@@ -0,0 +1,235 @@
+"""Backend-Auswahl, Failover und Health-Checks für PlantHub Integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Callable, Iterable, List, Optional
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    BACKEND_EWMA_ALPHA,
+    BACKEND_FAILURE_THRESHOLD,
+    BACKEND_HEALTH_CHECK_INTERVAL,
+    BACKEND_HEALTH_TIMEOUT,
+    HEDGE_BUDGET_BURST,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HTTP_INTERNAL_SERVER_ERROR,
+    WEBHOOK_BASE_URL,
+    WEBHOOK_ENDPOINT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_backend_urls(value: str | Iterable[str] | None) -> List[str]:
+    """Wandle eine komma- oder zeilengetrennte Liste in Backend-URLs um.
+
+    Wirft ValueError bei ungültigen URLs.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.replace("\n", ",").split(",")
+
+    urls: List[str] = []
+    for raw_url in value:
+        url = raw_url.strip().rstrip("/")
+        if not url:
+            continue
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"Ungültige Backend-URL: {raw_url}")
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+
+class Backend:
+    """Zustand eines einzelnen Backends."""
+
+    __slots__ = ("url", "latency", "failures", "healthy", "inflight", "last_failure")
+
+    def __init__(self, url: str) -> None:
+        """Initialize the backend state."""
+        self.url = url
+        self.latency: Optional[float] = None  # geglättete Antwortzeit in Sekunden
+        self.failures = 0
+        self.healthy = True
+        self.inflight = 0
+        self.last_failure = 0.0
+
+    @property
+    def score(self) -> float:
+        """Erwartete Wartezeit; kleinere Werte werden bevorzugt."""
+        # Unbekannte Backends zuerst ausprobieren
+        latency = self.latency or 0.0
+        return latency * (1 + self.inflight)
+
+
+class BackendPool:
+    """Verteilt Anfragen latenzbasiert auf gesunde Backends.
+
+    Gewählt wird das gesunde Backend mit der kleinsten geglätteten
+    Antwortzeit, gewichtet mit der Zahl laufender Anfragen. Schlägt eine
+    Anfrage fehl, versucht der Aufrufer sofort das nächste Backend.
+    Nach ``BACKEND_FAILURE_THRESHOLD`` Fehlern in Folge gilt ein Backend als
+    ungesund, bis ein aktiver Health-Check wieder erfolgreich ist.
+    """
+
+    def __init__(self, urls: Iterable[str]) -> None:
+        """Initialize the pool."""
+        self.backends = [Backend(url) for url in parse_backend_urls(list(urls))]
+        if not self.backends:
+            self.backends = [Backend(WEBHOOK_BASE_URL)]
+
+    @property
+    def urls(self) -> List[str]:
+        """Return the configured backend URLs."""
+        return [backend.url for backend in self.backends]
+
+    def select(self, exclude: Iterable[str] = ()) -> Optional[Backend]:
+        """Wähle das beste noch nicht versuchte Backend."""
+        excluded = set(exclude)
+        candidates = [b for b in self.backends if b.url not in excluded]
+        if not candidates:
+            return None
+        # Sind alle ungesund, wird trotzdem das am längsten fehlerfreie versucht
+        healthy = [b for b in candidates if b.healthy]
+        if not healthy:
+            return min(candidates, key=lambda b: b.last_failure)
+        return min(healthy, key=lambda b: b.score)
+
+    def record_success(self, backend: Backend, latency: float) -> None:
+        """Erfasse eine erfolgreiche Antwort."""
+        if backend.latency is None:
+            backend.latency = latency
+        else:
+            backend.latency += BACKEND_EWMA_ALPHA * (latency - backend.latency)
+        backend.failures = 0
+        if not backend.healthy:
+            _LOGGER.info("Backend %s ist wieder erreichbar", backend.url)
+        backend.healthy = True
+
+    def record_failure(self, backend: Backend) -> None:
+        """Erfasse einen Fehler und markiere das Backend ggf. als ungesund."""
+        backend.failures += 1
+        backend.last_failure = time.monotonic()
+        if backend.healthy and backend.failures >= BACKEND_FAILURE_THRESHOLD:
+            _LOGGER.warning(
+                "Backend %s nach %d Fehlern als ungesund markiert",
+                backend.url,
+                backend.failures,
+            )
+            backend.healthy = False
+
+    async def _async_check_backend(
+        self, session: aiohttp.ClientSession, backend: Backend
+    ) -> None:
+        """Prüfe ein einzelnes Backend aktiv.
+
+        Geprüft wird der Webhook selbst. Ein GET ohne Token wird dort je nach
+        Backend mit 401, 404 oder 405 beantwortet; jede Antwort unterhalb von
+        5xx zeigt, dass das Backend erreichbar ist und Anfragen bearbeitet.
+        """
+        started = time.monotonic()
+        try:
+            async with session.get(
+                f"{backend.url}{WEBHOOK_ENDPOINT}",
+                timeout=aiohttp.ClientTimeout(total=BACKEND_HEALTH_TIMEOUT),
+            ) as response:
+                ok = response.status < HTTP_INTERNAL_SERVER_ERROR
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Health-Check für %s fehlgeschlagen: %s", backend.url, err)
+            ok = False
+
+        if ok:
+            self.record_success(backend, time.monotonic() - started)
+        else:
+            self.record_failure(backend)
+
+    async def async_health_check(self, hass: HomeAssistant) -> None:
+        """Prüfe alle Backends parallel."""
+        session = async_get_clientsession(hass)
+        await asyncio.gather(
+            *(self._async_check_backend(session, backend) for backend in self.backends)
+        )
+
+    @callback
+    def async_start_health_checks(self, hass: HomeAssistant) -> Callable[[], None]:
+        """Starte periodische Health-Checks und gib die Abmelde-Funktion zurück."""
+        if len(self.backends) < 2:
+            # Ohne Alternative gibt es nichts umzuschalten
+            return lambda: None
+
+        async def _async_run(_now: object) -> None:
+            await self.async_health_check(hass)
+
+        return async_track_time_interval(
+            hass, _async_run, timedelta(seconds=BACKEND_HEALTH_CHECK_INTERVAL)
+        )
+
+
+class HedgePolicy:
+    """Entscheidet, wann eine Anfrage doppelt gesendet wird.
+
+    Die Frist ist das p95 der letzten ``window`` Antwortzeiten. Das Budget
+    ist ein Token-Bucket: jede Anfrage spart ``ratio`` Token an (höchstens
+    ``burst``), jede Hedge-Anfrage kostet ein Token. So bleibt die
+    Zusatzlast auch bei einem dauerhaft langsamen Backend begrenzt.
+    """
+
+    def __init__(
+        self,
+        window: int = HEDGE_LATENCY_WINDOW,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY,
+        ratio: float = HEDGE_BUDGET_RATIO,
+        burst: float = HEDGE_BUDGET_BURST,
+    ) -> None:
+        """Initialize the policy."""
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = 0.0
+        self._delay: Optional[float] = None
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def record(self, latency: float) -> None:
+        """Erfasse die Antwortzeit einer erfolgreichen Anfrage."""
+        self._latencies.append(latency)
+        self._delay = None
+
+    def delay(self) -> Optional[float]:
+        """Gib die Frist bis zur Hedge-Anfrage zurück (None: nicht hedgen)."""
+        if len(self._latencies) < self._min_samples:
+            return None
+        if self._delay is None:
+            ordered = sorted(self._latencies)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            self._delay = max(p95, self._min_delay)
+        return self._delay
+
+    def note_request(self) -> None:
+        """Spare für eine normale Anfrage Budget an."""
+        self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def try_acquire(self) -> bool:
+        """Verbrauche Budget für eine Hedge-Anfrage, falls vorhanden."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.hedged += 1
+        return True
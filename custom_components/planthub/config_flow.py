@@ -3,22 +3,88 @@ from __future__ import annotations
 
 import logging
 import voluptuous as vol
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    ATTRIBUTE_MODE_FULL,
+    ATTRIBUTE_MODE_LEAN,
+    CONF_ATTRIBUTE_MODE,
+    CONF_BACKEND_URLS,
+    CONF_DEADBAND_PREFIX,
+    CONF_ENTITY_MODE,
+    CONF_FLEET_SENSORS,
+    CONF_HEDGING,
+    CONF_MAX_STALENESS,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_SENSORS,
+    CONF_SHARD,
+    CONF_SHARD_INTERVALS,
+    CONF_SHARDING,
+    CONF_STATUS_HYSTERESIS,
+    CONF_STREAMING,
     CONF_TOKEN,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_ENTITY_MODE,
+    DEFAULT_FLEET_SENSORS,
+    DEFAULT_HEDGING,
+    DEFAULT_LEAN_SENSORS,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_SHARD,
+    DEFAULT_SHARDING,
+    DEFAULT_STATUS_HYSTERESIS,
+    DEFAULT_STREAMING,
     DOMAIN,
+    ENTITY_MODE_FULL,
+    ENTITY_MODE_LEAN,
+    SHARDING_AUTO,
+    SHARDING_GROUPS,
+    SHARDING_OFF,
+    WEBHOOK_BASE_URL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _async_validate_plant(
+    hass: HomeAssistant, plant_id: str, backend_urls: Optional[List[str]] = None
+) -> Optional[str]:
+    """Prüfe, ob die Pflanze über die API erreichbar ist.
+
+    Gibt einen Fehlerschlüssel für das Formular zurück oder None.
+    """
+    from .backends import BackendPool
+    from .webhook import (
+        PlantHubAuthError,
+        PlantHubConnectionError,
+        PlantHubWebhook,
+        PlantHubWebhookError,
+    )
+
+    try:
+        async with PlantHubWebhook(
+            hass,
+            hass.data[DOMAIN][CONF_TOKEN],
+            backends=BackendPool(backend_urls or [WEBHOOK_BASE_URL]),
+        ) as webhook:
+            await webhook.fetch_plant_data(plant_id)
+    except PlantHubAuthError:
+        return "invalid_auth"
+    except PlantHubConnectionError:
+        return "cannot_connect"
+    except PlantHubWebhookError as e:
+        _LOGGER.warning("Prüfung der Pflanze %s fehlgeschlagen: %s", plant_id, e)
+        return "plant_not_found"
+    return None
+
+
 class PlantHubConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for PlantHub."""
 
@@ -49,28 +115,50 @@ class PlantHubConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle adding the first plant step."""
-        if user_input is None:
+        from .backends import parse_backend_urls
+
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            try:
+                backend_urls = parse_backend_urls(user_input.get(CONF_BACKEND_URLS))
+            except ValueError:
+                errors[CONF_BACKEND_URLS] = "invalid_backend_url"
+            else:
+                backend_urls = backend_urls or [WEBHOOK_BASE_URL]
+                error = await _async_validate_plant(
+                    self.hass, user_input["plant_id"], backend_urls
+                )
+                if error:
+                    errors["base"] = error
+
+        if user_input is None or errors:
+            current = user_input or {}
             return self.async_show_form(
                 step_id="add_first_plant",
                 data_schema=vol.Schema(
                     {
-                        vol.Required("plant_id"): str,
-                        vol.Optional("plant_name"): str,
+                        vol.Required("plant_id", default=current.get("plant_id", "")): str,
+                        vol.Optional("plant_name", default=current.get("plant_name", "")): str,
+                        vol.Optional(
+                            CONF_BACKEND_URLS,
+                            default=current.get(CONF_BACKEND_URLS, WEBHOOK_BASE_URL),
+                        ): str,
                     }
                 ),
-                description_placeholders={},
+                errors=errors,
             )
 
         # Füge die erste Pflanze zur Konfiguration hinzu
         plant_config = {
             "plant_id": user_input["plant_id"],
-            "name": user_input.get("plant_name", user_input["plant_id"]),
+            "name": user_input.get("plant_name") or user_input["plant_id"],
         }
 
         # Speichere die Konfigurationsdaten
         self._config_data = {
             "scan_interval": 300,  # Standard: 5 Minuten
             "plants": [plant_config],
+            CONF_BACKEND_URLS: backend_urls,
         }
         
         # Konfiguration abschließen
@@ -101,6 +189,9 @@ class PlantHubConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class PlantHubOptionsFlow(config_entries.OptionsFlow):
     """Handle PlantHub options."""
 
+    # Pflanze, deren Sensoren im Schritt plant_sensors gewählt werden
+    _sensors_plant_id: Optional[str] = None
+
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -116,7 +207,9 @@ class PlantHubOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional("action", default="add"): vol.In({
                         "add": "Pflanze hinzufügen",
                         "remove": "Pflanze entfernen",
-                        "settings": "Einstellungen ändern"
+                        "settings": "Einstellungen ändern",
+                        "shards": "Shards festlegen",
+                        "sensors": "Sensoren einer Pflanze wählen",
                     })
                 }),
                 description_placeholders={
@@ -128,6 +221,10 @@ class PlantHubOptionsFlow(config_entries.OptionsFlow):
             return await self.async_step_add_plant()
         elif user_input["action"] == "remove":
             return await self.async_step_remove_plant()
+        elif user_input["action"] == "shards":
+            return await self.async_step_shards()
+        elif user_input["action"] == "sensors":
+            return await self.async_step_sensors()
         else:
             return await self.async_step_settings()
 
@@ -167,6 +264,21 @@ class PlantHubOptionsFlow(config_entries.OptionsFlow):
                 errors={"base": "plant_id_exists"}
             )
 
+        error = await _async_validate_plant(
+            self.hass,
+            new_plant["plant_id"],
+            self.config_entry.data.get(CONF_BACKEND_URLS),
+        )
+        if error:
+            return self.async_show_form(
+                step_id="add_plant",
+                data_schema=vol.Schema({
+                    vol.Required("plant_id", default=user_input["plant_id"]): str,
+                    vol.Optional("plant_name", default=user_input.get("plant_name", "")): str,
+                }),
+                errors={"base": error}
+            )
+
         new_data["plants"].append(new_plant)
         
         # Aktualisiere den Konfigurationseintrag
@@ -189,7 +301,9 @@ class PlantHubOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional("action", default="add"): vol.In({
                         "add": "Pflanze hinzufügen",
                         "remove": "Pflanze entfernen",
-                        "settings": "Einstellungen ändern"
+                        "settings": "Einstellungen ändern",
+                        "shards": "Shards festlegen",
+                        "sensors": "Sensoren einer Pflanze wählen",
                     })
                 }),
                 errors={"base": "no_plants_to_remove"}
@@ -222,23 +336,217 @@ class PlantHubOptionsFlow(config_entries.OptionsFlow):
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle changing settings."""
+        from .backends import parse_backend_urls
+        from .filters import FILTERED_METRICS
+
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            try:
+                backend_urls = parse_backend_urls(user_input.get(CONF_BACKEND_URLS))
+            except ValueError:
+                errors[CONF_BACKEND_URLS] = "invalid_backend_url"
+            else:
+                # Aktualisiere die Einstellungen
+                new_data = self.config_entry.data.copy()
+                new_data["scan_interval"] = user_input["scan_interval"]
+                new_data[CONF_ATTRIBUTE_MODE] = user_input[CONF_ATTRIBUTE_MODE]
+                new_data[CONF_ENTITY_MODE] = user_input[CONF_ENTITY_MODE]
+                new_data[CONF_MIN_PUBLISH_INTERVAL] = user_input[CONF_MIN_PUBLISH_INTERVAL]
+                new_data[CONF_BACKEND_URLS] = backend_urls or [WEBHOOK_BASE_URL]
+                new_data[CONF_HEDGING] = user_input[CONF_HEDGING]
+                new_data[CONF_MAX_STALENESS] = user_input[CONF_MAX_STALENESS]
+                new_data[CONF_STATUS_HYSTERESIS] = user_input[CONF_STATUS_HYSTERESIS]
+                new_data[CONF_STREAMING] = user_input[CONF_STREAMING]
+                new_data[CONF_FLEET_SENSORS] = user_input[CONF_FLEET_SENSORS]
+                for metric in FILTERED_METRICS:
+                    key = f"{CONF_DEADBAND_PREFIX}{metric}"
+                    new_data[key] = user_input[key]
+                
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, data=new_data
+                )
+                
+                return self.async_create_entry(title="", data={})
+
+        current = {**self.config_entry.data, **(user_input or {})}
+        backend_default = current.get(CONF_BACKEND_URLS) or [WEBHOOK_BASE_URL]
+        if not isinstance(backend_default, str):
+            backend_default = ", ".join(backend_default)
+
+        deadband_fields = {
+            vol.Optional(
+                f"{CONF_DEADBAND_PREFIX}{metric}",
+                default=current.get(f"{CONF_DEADBAND_PREFIX}{metric}", 0.0),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            for metric in FILTERED_METRICS
+        }
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    "scan_interval",
+                    default=current.get("scan_interval", 300),
+                ): int,
+                vol.Optional(
+                    CONF_ATTRIBUTE_MODE,
+                    default=current.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE),
+                ): vol.In([ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODE_LEAN]),
+                vol.Optional(
+                    CONF_ENTITY_MODE,
+                    default=current.get(CONF_ENTITY_MODE, DEFAULT_ENTITY_MODE),
+                ): vol.In([ENTITY_MODE_FULL, ENTITY_MODE_LEAN]),
+                **deadband_fields,
+                vol.Optional(
+                    CONF_MIN_PUBLISH_INTERVAL,
+                    default=current.get(
+                        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(CONF_BACKEND_URLS, default=backend_default): str,
+                vol.Optional(
+                    CONF_HEDGING, default=current.get(CONF_HEDGING, DEFAULT_HEDGING)
+                ): bool,
+                vol.Optional(
+                    CONF_MAX_STALENESS,
+                    default=current.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_STATUS_HYSTERESIS,
+                    default=current.get(CONF_STATUS_HYSTERESIS, DEFAULT_STATUS_HYSTERESIS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+                vol.Optional(
+                    CONF_STREAMING, default=current.get(CONF_STREAMING, DEFAULT_STREAMING)
+                ): bool,
+                vol.Optional(
+                    CONF_FLEET_SENSORS,
+                    default=current.get(CONF_FLEET_SENSORS, DEFAULT_FLEET_SENSORS),
+                ): bool,
+            }),
+            errors=errors,
+        )
+
+    async def async_step_shards(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Handle assigning plants to shards."""
+        from .sharding import format_shard_intervals, parse_shard_intervals
+
+        data = self.config_entry.data
+        plants = data.get("plants", [])
+        errors: Dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                intervals = parse_shard_intervals(user_input.get(CONF_SHARD_INTERVALS))
+            except ValueError:
+                errors[CONF_SHARD_INTERVALS] = "invalid_shard_intervals"
+            else:
+                new_data = data.copy()
+                new_data[CONF_SHARDING] = user_input[CONF_SHARDING]
+                new_data[CONF_SHARD_INTERVALS] = intervals
+                # Im Gruppen-Modus legt der Benutzer den Shard je Pflanze fest
+                new_data["plants"] = [
+                    {
+                        **plant,
+                        CONF_SHARD: user_input.get(plant["plant_id"], "").strip()
+                        or DEFAULT_SHARD,
+                    }
+                    for plant in plants
+                ]
+
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, data=new_data
+                )
+
+                return self.async_create_entry(title="", data={})
+
+        current = user_input or {}
+        shard_fields = {
+            vol.Optional(
+                plant["plant_id"],
+                default=current.get(plant["plant_id"], plant.get(CONF_SHARD, DEFAULT_SHARD)),
+            ): str
+            for plant in plants
+        }
+        return self.async_show_form(
+            step_id="shards",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_SHARDING,
+                    default=current.get(
+                        CONF_SHARDING, data.get(CONF_SHARDING, DEFAULT_SHARDING)
+                    ),
+                ): vol.In([SHARDING_OFF, SHARDING_AUTO, SHARDING_GROUPS]),
+                vol.Optional(
+                    CONF_SHARD_INTERVALS,
+                    default=current.get(
+                        CONF_SHARD_INTERVALS,
+                        format_shard_intervals(data.get(CONF_SHARD_INTERVALS, {})),
+                    ),
+                ): str,
+                **shard_fields,
+            }),
+            errors=errors,
+        )
+
+    async def async_step_sensors(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Handle selecting the plant whose sensors are chosen."""
+        plants = self.config_entry.data.get("plants", [])
+
         if user_input is None:
+            plant_options = {p["plant_id"]: f"{p['name']} ({p['plant_id']})" for p in plants}
+
             return self.async_show_form(
-                step_id="settings",
+                step_id="sensors",
                 data_schema=vol.Schema({
-                    vol.Optional(
-                        "scan_interval",
-                        default=self.config_entry.data.get("scan_interval", 300),
-                    ): int,
+                    vol.Required("plant_id"): vol.In(plant_options)
                 })
             )
 
-        # Aktualisiere die Einstellungen
-        new_data = self.config_entry.data.copy()
-        new_data["scan_interval"] = user_input["scan_interval"]
-        
-        self.hass.config_entries.async_update_entry(
-            self.config_entry, data=new_data
+        self._sensors_plant_id = user_input["plant_id"]
+        return await self.async_step_plant_sensors()
+
+    async def async_step_plant_sensors(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Handle choosing the sensors of a plant."""
+        from .sensor import SELECTABLE_SENSORS, SENSOR_DESCRIPTIONS
+
+        data = self.config_entry.data
+        plant_id = self._sensors_plant_id
+
+        if user_input is not None:
+            new_data = data.copy()
+            new_data["plants"] = [
+                {**plant, CONF_SENSORS: list(user_input[CONF_SENSORS])}
+                if plant["plant_id"] == plant_id
+                else plant
+                for plant in data.get("plants", [])
+            ]
+
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=new_data
+            )
+
+            return self.async_create_entry(title="", data={})
+
+        plant = next(p for p in data.get("plants", []) if p["plant_id"] == plant_id)
+        if CONF_SENSORS in plant:
+            selected = plant[CONF_SENSORS]
+        elif data.get(CONF_ENTITY_MODE, DEFAULT_ENTITY_MODE) == ENTITY_MODE_LEAN:
+            selected = list(DEFAULT_LEAN_SENSORS)
+        else:
+            selected = list(SELECTABLE_SENSORS)
+
+        sensor_options = {
+            key: SENSOR_DESCRIPTIONS[key].name or key for key in SELECTABLE_SENSORS
+        }
+        return self.async_show_form(
+            step_id="plant_sensors",
+            data_schema=vol.Schema({
+                vol.Optional(CONF_SENSORS, default=selected): cv.multi_select(sensor_options),
+            }),
+            description_placeholders={"plant_name": plant["name"]},
         )
-        
-        return self.async_create_entry(title="", data={})
@@ -8,16 +8,125 @@ DOMAIN: Final = "planthub"
 
 # Konfiguration
 CONF_TOKEN: Final = "token"
+CONF_ATTRIBUTE_MODE: Final = "attribute_mode"
+CONF_BACKEND_URLS: Final = "backend_urls"
+CONF_HEDGING: Final = "hedging"
+CONF_DEADBAND_PREFIX: Final = "deadband_"
+CONF_MIN_PUBLISH_INTERVAL: Final = "min_publish_interval"
+CONF_MAX_STALENESS: Final = "max_staleness"
+CONF_SHARDING: Final = "sharding"
+CONF_SHARD: Final = "shard"
+CONF_SHARD_INTERVALS: Final = "shard_intervals"
+CONF_AUTO_SHARDS: Final = "auto_shards"
+CONF_STATUS_HYSTERESIS: Final = "status_hysteresis"
+CONF_ENTITY_MODE: Final = "entity_mode"
+CONF_SENSORS: Final = "sensors"
+CONF_STREAMING: Final = "streaming"
+CONF_FLEET_SENSORS: Final = "fleet_sensors"
+
+# Attribut-Modi
+ATTRIBUTE_MODE_FULL: Final = "full"
+ATTRIBUTE_MODE_LEAN: Final = "lean"
+
+# Entitäts-Modi
+ENTITY_MODE_FULL: Final = "full"
+ENTITY_MODE_LEAN: Final = "lean"
+
+# Aufteilung der Pflanzen auf Coordinatoren
+SHARDING_OFF: Final = "off"
+SHARDING_AUTO: Final = "auto"
+SHARDING_GROUPS: Final = "groups"
+DEFAULT_SHARD: Final = "default"
+SLOW_SHARD: Final = "slow"
 
 # Standardwerte
 DEFAULT_NAME: Final = "PlantHub"
 DEFAULT_SCAN_INTERVAL: Final = 300  # 5 Minuten
+DEFAULT_ATTRIBUTE_MODE: Final = ATTRIBUTE_MODE_FULL
+DEFAULT_MIN_PUBLISH_INTERVAL: Final = 0  # Sekunden
+DEFAULT_HEDGING: Final = False
+DEFAULT_MAX_STALENESS: Final = 3600  # Sekunden
+DEFAULT_SHARDING: Final = SHARDING_OFF
+DEFAULT_STATUS_HYSTERESIS: Final = 2.0  # Prozentpunkte Bodenfeuchtigkeit
+DEFAULT_ENTITY_MODE: Final = ENTITY_MODE_FULL
+DEFAULT_STREAMING: Final = False
+DEFAULT_FLEET_SENSORS: Final = True
+# Sensoren einer Pflanze im Lean-Modus, solange nichts anderes gewählt ist
+DEFAULT_LEAN_SENSORS: Final = ("status", "soil_moisture")
 
 # Webhook-Konfiguration
 WEBHOOK_BASE_URL: Final = "http://govegan.local:5678"
 WEBHOOK_ENDPOINT: Final = "/webhook/v1/planthub"
+WEBHOOK_HISTORY_ENDPOINT: Final = "/webhook/v1/planthub/history"
+WEBHOOK_STREAM_ENDPOINT: Final = "/webhook/v1/planthub/stream"
 WEBHOOK_TIMEOUT: Final = 30  # Sekunden
 
+# Mehrere Backends (Failover und Lastverteilung)
+BACKEND_HEALTH_CHECK_INTERVAL: Final = 30  # Sekunden
+BACKEND_HEALTH_TIMEOUT: Final = 5  # Sekunden
+BACKEND_FAILURE_THRESHOLD: Final = 2  # Fehler in Folge bis "ungesund"
+BACKEND_EWMA_ALPHA: Final = 0.3  # Glättung der Antwortzeit
+
+# Push-Updates per Server-Sent Events
+STREAM_IDLE_TIMEOUT: Final = 60  # Sekunden ohne Daten/Keepalive bis zum Neuaufbau
+STREAM_RECONNECT_MIN: Final = 1  # Sekunden
+STREAM_RECONNECT_MAX: Final = 60  # Sekunden
+STREAM_POLL_INTERVAL: Final = 3600  # Sicherheits-Abfrage, solange der Stream steht
+
+# Versetzte Refresh-Phasen aller Coordinatoren
+DATA_SCHEDULER: Final = "scheduler"
+SCHEDULE_MIN_GAP_RATIO: Final = 0.5  # Mindestabstand zweier Refreshes (Anteil des Intervalls)
+
+# Kennzahlen über alle Pflanzen (Flotte)
+DATA_FLEET: Final = "fleet"
+DATA_FLEET_OWNER: Final = "fleet_owner"  # Eintrag mit den Sensoren aller Einträge
+
+# Zeitbudget eines Refreshs als Anteil des Abfrageintervalls
+REFRESH_DEADLINE_RATIO: Final = 0.8
+
+# hass.data-Schlüssel für Aufzeichnung/Wiedergabe des API-Verkehrs
+DATA_TRANSPORT: Final = "transport"
+CONF_TRANSPORT: Final = "transport"
+TRANSPORT_MODE_RECORD: Final = "record"
+TRANSPORT_MODE_REPLAY: Final = "replay"
+
+# Automatisches Sharding nach Antwortzeit und Fehlerquote je Pflanze
+AUTO_SHARD_LATENCY: Final = 5.0  # Sekunden
+AUTO_SHARD_FAILURE_RATE: Final = 0.5
+AUTO_SHARD_MIN_SAMPLES: Final = 5
+AUTO_SHARD_ALPHA: Final = 0.3
+
+# Profiling auf Abruf
+PROFILE_MAX_REFRESHES: Final = 20
+PROFILE_TOP_FUNCTIONS: Final = 40
+PROFILE_TOP_ALLOCATIONS: Final = 25
+
+# Tracing der Refreshes
+TRACE_BUFFER_SIZE: Final = 20  # aufbewahrte Traces je Coordinator
+
+# Hedged Requests
+HEDGE_LATENCY_WINDOW: Final = 200  # Antwortzeiten für das p95
+HEDGE_MIN_SAMPLES: Final = 20  # erst ab so vielen Antwortzeiten hedgen
+HEDGE_MIN_DELAY: Final = 0.05  # Sekunden
+HEDGE_BUDGET_RATIO: Final = 0.1  # höchstens ~10 % zusätzliche Anfragen
+HEDGE_BUDGET_BURST: Final = 5  # angesparte Hedge-Anfragen
+
+# Request-Bündelung (Single-Flight)
+SINGLE_FLIGHT_FRESHNESS: Final = 2.0  # Sekunden, in denen ein Ergebnis wiederverwendet wird
+
+# Services
+SERVICE_REFRESH: Final = "refresh"
+SERVICE_IMPORT_STATISTICS: Final = "import_statistics"
+SERVICE_PROFILE: Final = "profile"
+ATTR_PLANT_ID: Final = "plant_id"
+ATTR_START: Final = "start"
+ATTR_END: Final = "end"
+ATTR_REFRESHES: Final = "refreshes"
+REFRESH_DEBOUNCE_COOLDOWN: Final = 2.0  # Sekunden
+
+# Langzeitstatistiken
+STATISTICS_IMPORT_CHUNK_SIZE: Final = 500  # Stunden pro Import-Aufruf
+
 # Status
 STATUS_HEALTHY: Final = "healthy"
 STATUS_WARNING: Final = "warning"
@@ -41,6 +150,21 @@ HTTP_INTERNAL_SERVER_ERROR: Final = 500
 SOIL_MOISTURE_CRITICAL_THRESHOLD: Final = 30
 SOIL_MOISTURE_WARNING_THRESHOLD: Final = 50
 
+# Event bei echten Statuswechseln einer Pflanze
+EVENT_STATUS_CHANGED: Final = f"{DOMAIN}_status_changed"
+
+# Dispatcher-Signal nach jeder Aktualisierung (Argument: Coordinator oder
+# None, wenn ein Eintrag entladen wurde)
+SIGNAL_PLANTS_UPDATED: Final = f"{DOMAIN}_plants_updated"
+
+# Austrocknungs-Prognose
+FORECAST_WINDOW: Final = 48  # Messwerte pro Pflanze
+FORECAST_MIN_SAMPLES: Final = 6  # Mindestanzahl Messwerte für eine Prognose
+
+# Gleitende Kennzahlen
+ROLLING_WINDOW_HOURS: Final = 24
+ROLLING_CAPACITY: Final = 512  # Messwerte pro Pflanze (24 h bei 5 Minuten: 288)
+
 # Validation Ranges
 MIN_SOIL_MOISTURE: Final = 0
 MAX_SOIL_MOISTURE: Final = 100
@@ -49,3 +173,7 @@ MAX_AIR_HUMIDITY: Final = 100
 MIN_AIR_TEMPERATURE: Final = -50
 MAX_AIR_TEMPERATURE: Final = 100
 MIN_ILLUMINANCE: Final = 0
+MIN_BATTERY: Final = 0
+MAX_BATTERY: Final = 100
+MIN_CONDUCTIVITY: Final = 0
+MAX_CONDUCTIVITY: Final = 20000
@@ -0,0 +1,68 @@
+"""Diagnose-Daten für PlantHub Integration."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .fleet import get_fleet
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinators = hass.data[DOMAIN][entry.entry_id]["coordinators"]
+    # Backend-Pool und Hedge-Budget teilen sich alle Shards
+    primary = coordinators[0]
+
+    diagnostics: Dict[str, Any] = {
+        "entry": dict(entry.data),
+        "shards": [
+            {
+                "shard": coordinator.shard,
+                "update_interval": coordinator.update_interval.total_seconds(),
+                "refresh_phase": coordinator.refresh_phase(),
+                "plants": [p["plant_id"] for p in coordinator.plants],
+                "refresh": dict(coordinator.telemetry),
+                "carry_over": list(coordinator._carry_over),
+                # Wasserfall der letzten Refreshes, neuester zuletzt
+                "traces": coordinator.tracer.export(),
+                "plant_health": {
+                    plant_id: {
+                        "latency": round(health.latency, 3),
+                        "failure_rate": round(health.failure_rate, 3),
+                        "samples": health.samples,
+                    }
+                    for plant_id, health in coordinator.plant_health.items()
+                },
+            }
+            for coordinator in coordinators
+        ],
+        "backends": [
+            {
+                "url": backend.url,
+                "healthy": backend.healthy,
+                "latency": backend.latency,
+                "failures": backend.failures,
+            }
+            for backend in primary.backends.backends
+        ],
+    }
+    if primary.hedge is not None:
+        diagnostics["hedging"] = {
+            "delay": primary.hedge.delay(),
+            "hedged": primary.hedge.hedged,
+            "hedge_wins": primary.hedge.hedge_wins,
+        }
+    # Inkrementell gepflegte Kennzahlen des Eintrags und aller Einträge
+    diagnostics["fleet"] = {
+        "entry": primary.fleet.as_dict(),
+        "all_entries": get_fleet(hass).as_dict(),
+    }
+    stream = hass.data[DOMAIN][entry.entry_id].get("stream")
+    if stream is not None:
+        diagnostics["stream"] = stream.diagnostics()
+    return diagnostics
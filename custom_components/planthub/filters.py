@@ -0,0 +1,128 @@
+"""Publikationsfilter (Totband und Mindestintervall) für PlantHub Integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .const import (
+    CONF_DEADBAND_PREFIX,
+    CONF_MIN_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+)
+from .normalizer import FIELD_TABLE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Messwerte, die gefiltert veröffentlicht werden
+FILTERED_METRICS = tuple(spec.key for spec in FIELD_TABLE)
+
+
+class PublishFilter:
+    """Hält kleine oder zu häufige Änderungen eines Messwerts zurück.
+
+    Ein neuer Wert wird nur veröffentlicht, wenn er sich um mindestens das
+    Totband des Messwerts vom zuletzt veröffentlichten Wert unterscheidet
+    und seit der letzten Veröffentlichung das Mindestintervall vergangen ist.
+    Wechsel von oder zu ``None`` werden immer sofort veröffentlicht.
+
+    Überschreitet ein Wert das Totband, kommt aber vor Ablauf des
+    Mindestintervalls, wird er zurückgehalten und mit ``release``
+    nachgereicht, sobald das Intervall abgelaufen ist. Ein neuerer Wert
+    ersetzt oder verwirft den zurückgehaltenen.
+    """
+
+    def __init__(self, deadbands: Dict[str, float], min_interval: float) -> None:
+        """Initialize the filter."""
+        self._deadbands = deadbands
+        self._min_interval = min_interval
+        # (plant_id, metric) -> (veröffentlichter Wert, Zeitpunkt)
+        self._published: Dict[Tuple[str, str], Tuple[Optional[float], float]] = {}
+        # (plant_id, metric) -> wegen des Mindestintervalls zurückgehaltener Wert
+        self._held: Dict[Tuple[str, str], float] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> PublishFilter:
+        """Erstelle den Filter aus den Daten eines Konfigurationseintrags."""
+        deadbands = {
+            metric: float(config.get(f"{CONF_DEADBAND_PREFIX}{metric}", 0.0))
+            for metric in FILTERED_METRICS
+        }
+        min_interval = float(
+            config.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)
+        )
+        return cls(deadbands, min_interval)
+
+    def apply(
+        self, plant_id: str, plant_data: Optional[Dict[str, Any]], now: float
+    ) -> Tuple[Optional[Dict[str, Any]], FrozenSet[str]]:
+        """Filtere einen Messwert.
+
+        Gibt die zu veröffentlichenden Daten und die Menge der Messwerte
+        zurück, deren veröffentlichter Wert sich geändert hat.
+        """
+        changed = set()
+        published = dict(plant_data) if plant_data else None
+
+        for metric in FILTERED_METRICS:
+            value = plant_data.get(metric) if plant_data else None
+            key = (plant_id, metric)
+            previous = self._published.get(key)
+
+            if previous is None:
+                self._published[key] = (value, now)
+                changed.add(metric)
+                continue
+
+            last_value, last_time = previous
+            held = False
+            if value is None or last_value is None:
+                publish = value != last_value
+            else:
+                publish = (
+                    abs(value - last_value) >= self._deadbands.get(metric, 0.0)
+                    and value != last_value
+                )
+                if publish and now - last_time < self._min_interval:
+                    publish, held = False, True
+
+            if held:
+                self._held[key] = value
+            else:
+                self._held.pop(key, None)
+
+            if publish:
+                self._published[key] = (value, now)
+                changed.add(metric)
+            elif published is not None:
+                published[metric] = last_value
+
+        return published, frozenset(changed)
+
+    def next_release(self, now: float) -> Optional[float]:
+        """Sekunden bis zum nächsten nachzureichenden Wert (None: keiner)."""
+        if not self._held:
+            return None
+        due = min(self._published[key][1] for key in self._held) + self._min_interval
+        return max(due - now, 0.0)
+
+    def release(self, now: float) -> Dict[str, Dict[str, float]]:
+        """Veröffentliche zurückgehaltene Werte mit abgelaufenem Mindestintervall.
+
+        Gibt je Pflanze die nachgereichten Messwerte zurück.
+        """
+        released: Dict[str, Dict[str, float]] = {}
+        for key in list(self._held):
+            if now - self._published[key][1] < self._min_interval:
+                continue
+            value = self._held.pop(key)
+            self._published[key] = (value, now)
+            plant_id, metric = key
+            released.setdefault(plant_id, {})[metric] = value
+        return released
+
+    def forget(self, plant_ids: Iterable[str]) -> None:
+        """Verwerfe den Zustand von Pflanzen, die nicht mehr konfiguriert sind."""
+        keep = set(plant_ids)
+        for key in [k for k in self._published if k[0] not in keep]:
+            del self._published[key]
+            self._held.pop(key, None)
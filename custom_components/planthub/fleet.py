@@ -0,0 +1,165 @@
+"""Inkrementell gepflegte Kennzahlen über alle Pflanzen (Flotte)."""
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_FLEET, DOMAIN
+
+# Heap-Einträge werden erst ab diesem Anteil veralteter Einträge neu aufgebaut
+_COMPACT_RATIO = 2
+_COMPACT_MIN = 16
+
+
+class _Contribution(NamedTuple):
+    """Beitrag einer Pflanze zu den Kennzahlen."""
+
+    status: str
+    moisture: Optional[float]
+    reading: Optional[float]  # Zeitpunkt der Messung als Unix-Zeitstempel
+
+
+class FleetAggregate:
+    """Hält Status-Zählungen, Feuchte-Kennzahlen und älteste Messung.
+
+    Jede Pflanze trägt genau einen Beitrag bei. Ändert sich eine Pflanze,
+    wird ihr alter Beitrag abgezogen und der neue addiert; Zählungen,
+    Summe und Anzahl kosten O(1), Minimum und älteste Messung O(log n)
+    über Heaps mit verzögertem Löschen. Alle Abfragen lesen nur die
+    gepflegten Werte und durchlaufen nie alle Pflanzen.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._plants: Dict[str, _Contribution] = {}
+        self._status_counts: Counter[str] = Counter()
+        self._moisture_sum = 0.0
+        self._moisture_count = 0
+        # (Wert, Schlüssel); Einträge, die nicht mehr zum Beitrag passen,
+        # werden beim Lesen der Spitze verworfen
+        self._moisture_heap: List[Tuple[float, str]] = []
+        self._reading_heap: List[Tuple[float, str]] = []
+
+    def update(
+        self,
+        key: str,
+        status: str,
+        moisture: Optional[float],
+        reading: Optional[datetime],
+    ) -> bool:
+        """Setze den Beitrag einer Pflanze; gibt zurück, ob er sich geändert hat."""
+        contribution = _Contribution(
+            status, moisture, reading.timestamp() if reading is not None else None
+        )
+        previous = self._plants.get(key)
+        if previous == contribution:
+            return False
+        if previous is not None:
+            self._subtract(previous)
+
+        self._plants[key] = contribution
+        self._status_counts[status] += 1
+        if moisture is not None:
+            self._moisture_sum += moisture
+            self._moisture_count += 1
+            if previous is None or previous.moisture != moisture:
+                self._push(self._moisture_heap, moisture, key)
+        if contribution.reading is not None and (
+            previous is None or previous.reading != contribution.reading
+        ):
+            self._push(self._reading_heap, contribution.reading, key)
+        return True
+
+    def discard(self, key: str) -> None:
+        """Entferne den Beitrag einer Pflanze."""
+        previous = self._plants.pop(key, None)
+        if previous is not None:
+            self._subtract(previous)
+
+    def _subtract(self, contribution: _Contribution) -> None:
+        """Ziehe einen Beitrag von Zählungen und Summe ab."""
+        self._status_counts[contribution.status] -= 1
+        if not self._status_counts[contribution.status]:
+            del self._status_counts[contribution.status]
+        if contribution.moisture is not None:
+            self._moisture_count -= 1
+            if self._moisture_count:
+                self._moisture_sum -= contribution.moisture
+            else:
+                # Rundungsfehler der laufenden Summe nicht mitschleppen
+                self._moisture_sum = 0.0
+
+    def _push(self, heap: List[Tuple[float, str]], value: float, key: str) -> None:
+        """Lege einen Wert auf den Heap und räume veraltete Einträge auf."""
+        heapq.heappush(heap, (value, key))
+        if len(heap) > _COMPACT_RATIO * len(self._plants) + _COMPACT_MIN:
+            index = 1 if heap is self._moisture_heap else 2
+            heap[:] = [
+                (contribution[index], plant_key)
+                for plant_key, contribution in self._plants.items()
+                if contribution[index] is not None
+            ]
+            heapq.heapify(heap)
+
+    def _peek(self, heap: List[Tuple[float, str]], index: int) -> Optional[float]:
+        """Gib den kleinsten noch gültigen Wert eines Heaps zurück."""
+        while heap:
+            value, key = heap[0]
+            contribution = self._plants.get(key)
+            if contribution is not None and contribution[index] == value:
+                return value
+            heapq.heappop(heap)
+        return None
+
+    @property
+    def plants(self) -> int:
+        """Anzahl der Pflanzen mit Beitrag."""
+        return len(self._plants)
+
+    def count(self, status: str) -> int:
+        """Anzahl der Pflanzen mit einem Status."""
+        return self._status_counts.get(status, 0)
+
+    @property
+    def mean_moisture(self) -> Optional[float]:
+        """Mittlere Bodenfeuchtigkeit aller Pflanzen mit Messwert."""
+        if not self._moisture_count:
+            return None
+        return round(self._moisture_sum / self._moisture_count, 1)
+
+    @property
+    def min_moisture(self) -> Optional[float]:
+        """Niedrigste Bodenfeuchtigkeit."""
+        return self._peek(self._moisture_heap, 1)
+
+    @property
+    def oldest_reading(self) -> Optional[datetime]:
+        """Zeitpunkt der ältesten aktuellen Messung."""
+        timestamp = self._peek(self._reading_heap, 2)
+        if timestamp is None:
+            return None
+        return dt_util.utc_from_timestamp(timestamp)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Gib alle Kennzahlen für die Diagnose zurück."""
+        oldest = self.oldest_reading
+        return {
+            "plants": self.plants,
+            "status": dict(self._status_counts),
+            "mean_moisture": self.mean_moisture,
+            "min_moisture": self.min_moisture,
+            "oldest_reading": oldest.isoformat() if oldest else None,
+        }
+
+
+def get_fleet(hass: HomeAssistant) -> FleetAggregate:
+    """Hole die Kennzahlen aller Einträge aus hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_FLEET not in domain_data:
+        domain_data[DATA_FLEET] = FleetAggregate()
+    return domain_data[DATA_FLEET]
@@ -0,0 +1,176 @@
+"""Vektorisierte Austrocknungs-Prognose für PlantHub Integration."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    FORECAST_MIN_SAMPLES,
+    FORECAST_WINDOW,
+    SOIL_MOISTURE_CRITICAL_THRESHOLD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 16
+
+
+def reading_hours(plant_data: Dict[str, Any], fallback: float) -> float:
+    """Gib den Zeitpunkt eines Messwerts in Stunden seit Epoch zurück."""
+    timestamp = plant_data.get("last_update")
+    if isinstance(timestamp, datetime):
+        parsed: Optional[datetime] = timestamp
+    else:
+        parsed = dt_util.parse_datetime(str(timestamp)) if timestamp else None
+    if parsed is None:
+        return fallback
+    return dt_util.as_utc(parsed).timestamp() / 3600
+
+
+class MoistureForecaster:
+    """Schätzt für alle Pflanzen gleichzeitig, wann sie kritisch trocken sind.
+
+    Die letzten ``window`` Bodenfeuchte-Werte aller Pflanzen liegen in einem
+    zusammenhängenden NumPy-Array (eine Zeile pro Pflanze). Nach jedem
+    Coordinator-Update wird für alle Zeilen in einem vektorisierten Durchlauf
+    eine lineare Regression gerechnet und daraus die Zeit bis zum Erreichen
+    von ``critical`` abgeleitet.
+    """
+
+    def __init__(
+        self,
+        window: int = FORECAST_WINDOW,
+        critical: float = SOIL_MOISTURE_CRITICAL_THRESHOLD,
+        min_samples: int = FORECAST_MIN_SAMPLES,
+    ) -> None:
+        """Initialize the forecaster."""
+        self._window = window
+        self._critical = float(critical)
+        self._min_samples = min_samples
+        self._rows: Dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._allocate(_INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int) -> None:
+        """Lege die Arrays an bzw. vergrößere sie unter Erhalt der Daten."""
+        values = np.full((capacity, self._window), np.nan)
+        hours = np.full((capacity, self._window), np.nan)
+        cursor = np.zeros(capacity, dtype=np.intp)
+        last_hours = np.full(capacity, np.nan)
+        until_critical = np.full(capacity, np.nan)
+
+        if self._rows or self._free_rows:
+            used = self._values.shape[0]
+            values[:used] = self._values
+            hours[:used] = self._hours
+            cursor[:used] = self._cursor
+            last_hours[:used] = self._last_hours
+            until_critical[:used] = self._until_critical
+
+        self._values = values
+        self._hours = hours
+        self._cursor = cursor
+        self._last_hours = last_hours
+        self._until_critical = until_critical
+
+    def _row_for(self, plant_id: str) -> int:
+        """Gib die Array-Zeile einer Pflanze zurück und lege sie bei Bedarf an."""
+        row = self._rows.get(plant_id)
+        if row is not None:
+            return row
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = len(self._rows)
+            if row >= self._values.shape[0]:
+                self._allocate(self._values.shape[0] * 2)
+        self._rows[plant_id] = row
+        return row
+
+    def sync(self, plant_ids: Iterable[str]) -> None:
+        """Gib die Zeilen von Pflanzen frei, die nicht mehr konfiguriert sind."""
+        keep = set(plant_ids)
+        for plant_id in [p for p in self._rows if p not in keep]:
+            row = self._rows.pop(plant_id)
+            self._values[row] = np.nan
+            self._hours[row] = np.nan
+            self._cursor[row] = 0
+            self._last_hours[row] = np.nan
+            self._until_critical[row] = np.nan
+            self._free_rows.append(row)
+
+    def update(self, plants_data: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Übernimm neue Messwerte und aktualisiere alle Prognosen."""
+        now_hours = dt_util.utcnow().timestamp() / 3600
+
+        rows: list[int] = []
+        values: list[float] = []
+        hours: list[float] = []
+        for plant_id, plant_data in plants_data.items():
+            if not plant_data or plant_data.get("soil_moisture") is None:
+                continue
+            row = self._row_for(plant_id)
+            sample_hours = reading_hours(plant_data, now_hours)
+            # Derselbe Messwert erneut abgefragt: keine neue Stichprobe
+            if sample_hours == self._last_hours[row]:
+                continue
+            rows.append(row)
+            values.append(float(plant_data["soil_moisture"]))
+            hours.append(sample_hours)
+
+        if rows:
+            row_idx = np.asarray(rows, dtype=np.intp)
+            col_idx = self._cursor[row_idx]
+            self._values[row_idx, col_idx] = values
+            self._hours[row_idx, col_idx] = hours
+            self._last_hours[row_idx] = hours
+            self._cursor[row_idx] = (col_idx + 1) % self._window
+
+        self._fit(now_hours)
+
+    def _fit(self, now_hours: float) -> None:
+        """Berechne Steigung und Restzeit für alle Pflanzen in einem Durchlauf."""
+        used = len(self._rows) + len(self._free_rows)
+        if not used:
+            return
+
+        values = self._values[:used]
+        # Relativ zu jetzt rechnen, damit die Regression numerisch stabil bleibt
+        hours = self._hours[:used] - now_hours
+        mask = ~np.isnan(values)
+        count = mask.sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_t = np.nansum(hours, axis=1) / count
+            mean_y = np.nansum(values, axis=1) / count
+            dt = np.where(mask, hours - mean_t[:, None], 0.0)
+            dy = np.where(mask, values - mean_y[:, None], 0.0)
+            slope = (dt * dy).sum(axis=1) / (dt * dt).sum(axis=1)
+
+            latest_col = (self._cursor[:used] - 1) % self._window
+            latest = values[np.arange(used), latest_col]
+            latest_age = now_hours - self._last_hours[:used]
+
+            until = (latest - self._critical) / -slope - latest_age
+
+        drying = (count >= self._min_samples) & (slope < 0)
+        until = np.where(drying, np.maximum(until, 0.0), np.nan)
+        # Bereits kritisch trockene Pflanzen haben keine Restzeit mehr
+        until = np.where(latest <= self._critical, 0.0, until)
+        self._until_critical[:used] = until
+
+    def hours_until_critical(self, plant_id: str) -> Optional[float]:
+        """Gib die geschätzte Zeit in Stunden bis zur kritischen Feuchte zurück."""
+        row = self._rows.get(plant_id)
+        if row is None:
+            return None
+        value = self._until_critical[row]
+        if np.isnan(value):
+            return None
+        return round(float(value), 1)
@@ -0,0 +1,218 @@
+"""Deklarative Normalisierung der PlantHub API-Daten."""
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .const import (
+    MAX_AIR_HUMIDITY,
+    MAX_AIR_TEMPERATURE,
+    MAX_BATTERY,
+    MAX_CONDUCTIVITY,
+    MAX_SOIL_MOISTURE,
+    MIN_AIR_HUMIDITY,
+    MIN_AIR_TEMPERATURE,
+    MIN_BATTERY,
+    MIN_CONDUCTIVITY,
+    MIN_ILLUMINANCE,
+    MIN_SOIL_MOISTURE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Beschreibung eines Messwerts der API."""
+
+    key: str
+    aliases: Tuple[str, ...]
+    label: str
+    kind: type = float
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    unit: Optional[str] = None
+    device_class: Optional[str] = None
+    icon: Optional[str] = None
+
+
+# Alle bekannten Messwerte. Aliase werden in der angegebenen Reihenfolge
+# bevorzugt. Neue Messwerte hier eintragen, Sensoren entstehen automatisch.
+FIELD_TABLE: Tuple[FieldSpec, ...] = (
+    FieldSpec(
+        key="soil_moisture",
+        aliases=("soil_moisture", "moisture"),
+        label="Bodenfeuchtigkeit",
+        minimum=MIN_SOIL_MOISTURE,
+        maximum=MAX_SOIL_MOISTURE,
+        unit="%",
+        device_class="humidity",
+        icon="mdi:water-percent",
+    ),
+    FieldSpec(
+        key="air_temperature",
+        aliases=("air_temperature", "temperature"),
+        label="Lufttemperatur",
+        minimum=MIN_AIR_TEMPERATURE,
+        maximum=MAX_AIR_TEMPERATURE,
+        unit="°C",
+        device_class="temperature",
+        icon="mdi:thermometer",
+    ),
+    FieldSpec(
+        key="air_humidity",
+        aliases=("air_humidity", "humidity"),
+        label="Luftfeuchtigkeit",
+        minimum=MIN_AIR_HUMIDITY,
+        maximum=MAX_AIR_HUMIDITY,
+        unit="%",
+        device_class="humidity",
+        icon="mdi:air-humidifier",
+    ),
+    FieldSpec(
+        key="illuminance",
+        aliases=("light", "illuminance"),
+        label="Helligkeit",
+        minimum=MIN_ILLUMINANCE,
+        unit="lx",
+        device_class="illuminance",
+        icon="mdi:brightness-6",
+    ),
+    FieldSpec(
+        key="battery",
+        aliases=("battery", "battery_level"),
+        label="Batterie",
+        kind=int,
+        minimum=MIN_BATTERY,
+        maximum=MAX_BATTERY,
+        unit="%",
+        device_class="battery",
+        icon="mdi:battery",
+    ),
+    FieldSpec(
+        key="conductivity",
+        aliases=("conductivity", "soil_conductivity", "ec"),
+        label="Leitfähigkeit",
+        minimum=MIN_CONDUCTIVITY,
+        maximum=MAX_CONDUCTIVITY,
+        unit="µS/cm",
+        device_class="conductivity",
+        icon="mdi:flash-triangle-outline",
+    ),
+)
+
+# Messwerte mit eigenen, fest implementierten Sensorklassen
+CORE_FIELDS: Tuple[str, ...] = (
+    "soil_moisture",
+    "air_temperature",
+    "air_humidity",
+    "illuminance",
+)
+
+# Alias-Schlüssel für den Pflanzennamen
+_NAME_ALIASES = ("name", "plant_name")
+
+
+class PlantDataNormalizer:
+    """Aus der Feldtabelle kompilierter Normalisierer.
+
+    Beim Erstellen wird eine Alias-Tabelle (API-Schlüssel -> Feld und
+    Priorität) aufgebaut. ``normalize`` läuft danach genau einmal über die
+    Schlüssel des Payloads, konvertiert und prüft jedes bekannte Feld
+    einzeln und verwirft nur die Felder, die ungültig sind.
+    """
+
+    def __init__(self, fields: Tuple[FieldSpec, ...] = FIELD_TABLE) -> None:
+        """Compile the alias lookup table."""
+        self.fields = fields
+        self._lookup: Dict[str, Tuple[FieldSpec, int]] = {}
+        for spec in fields:
+            for priority, alias in enumerate(spec.aliases):
+                self._lookup.setdefault(alias, (spec, priority))
+        self._template = {spec.key: None for spec in fields}
+        # Schlüssel, die ``normalize`` auswertet (Feldprojektion der API)
+        self.projection: Tuple[str, ...] = (
+            *self._lookup,
+            *_NAME_ALIASES,
+            "last_updated",
+        )
+        self._projections: Dict[FrozenSet[str], Tuple[str, ...]] = {}
+
+    def projection_for(self, metrics: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+        """Gib die Feldprojektion für bestimmte Messwerte zurück (None = alle)."""
+        if metrics is None:
+            return self.projection
+        key = frozenset(metrics)
+        projection = self._projections.get(key)
+        if projection is None:
+            projection = self._projections[key] = (
+                *(alias for alias, (spec, _) in self._lookup.items() if spec.key in key),
+                *_NAME_ALIASES,
+                "last_updated",
+            )
+        return projection
+
+    def normalize(
+        self,
+        raw_data: Dict[str, Any],
+        plant_id: str,
+        source_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Normalisiere einen Payload in einem Durchlauf."""
+        normalized: Dict[str, Any] = {
+            "plant_id": plant_id,
+            "plant_name": plant_id,
+            **self._template,
+            "last_update": source_time,
+        }
+        # Feld -> Priorität des bisher verwendeten Alias
+        best: Dict[str, int] = {}
+        lookup = self._lookup
+
+        for raw_key, raw_value in raw_data.items():
+            entry = lookup.get(raw_key)
+            if entry is None:
+                if raw_key in _NAME_ALIASES and raw_value:
+                    normalized["plant_name"] = str(raw_value)
+                continue
+
+            spec, priority = entry
+            if raw_value is None or best.get(spec.key, len(spec.aliases)) <= priority:
+                continue
+
+            value = self._convert(spec, raw_value, plant_id)
+            if value is None:
+                continue
+            normalized[spec.key] = value
+            best[spec.key] = priority
+
+        return normalized
+
+    @staticmethod
+    def _convert(spec: FieldSpec, raw_value: Any, plant_id: str) -> Optional[float | int]:
+        """Konvertiere und prüfe einen einzelnen Wert."""
+        try:
+            value = float(raw_value)
+        except (ValueError, TypeError):
+            _LOGGER.debug("%s für Pflanze %s nicht numerisch: %r", spec.label, plant_id, raw_value)
+            return None
+
+        if not math.isfinite(value) or (
+            (spec.minimum is not None and value < spec.minimum)
+            or (spec.maximum is not None and value > spec.maximum)
+        ):
+            _LOGGER.warning(
+                "%s für Pflanze %s außerhalb des gültigen Bereichs [%s, %s]: %s",
+                spec.label,
+                plant_id,
+                spec.minimum,
+                spec.maximum,
+                value,
+            )
+            return None
+        if spec.kind is int:
+            return int(round(value))
+        return value
@@ -0,0 +1,201 @@
+"""Profiling der Refresh-Pipeline auf Abruf für PlantHub Integration."""
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import PROFILE_TOP_ALLOCATIONS, PROFILE_TOP_FUNCTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Gemeinsamer Kontextmanager, solange kein Profiler aktiv ist
+NULL_STAGE: ContextManager[None] = nullcontext()
+
+# Reihenfolge der Stufen im Bericht
+STAGES = ("refresh", "fetch", "network", "decode", "normalize", "entity_writes")
+
+# Allokationen außerhalb der Integration und die des Profilers selbst
+# gehören nicht in den Bericht
+_TRACE_FILTERS = (
+    tracemalloc.Filter(True, os.path.join(os.path.dirname(os.path.abspath(__file__)), "*")),
+    tracemalloc.Filter(False, os.path.abspath(__file__)),
+)
+
+# tracemalloc ist prozessweit; gleichzeitig laufende Refreshes (Shards,
+# Einträge) teilen sich einen Start und gestoppt wird nach dem letzten
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+
+def _acquire_tracemalloc() -> None:
+    """Melde einen Nutzer von tracemalloc an und starte es bei Bedarf."""
+    global _tracemalloc_users, _tracemalloc_started
+    if not _tracemalloc_users and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracemalloc_started = True
+    _tracemalloc_users += 1
+
+
+def _release_tracemalloc() -> None:
+    """Melde einen Nutzer ab; stoppe tracemalloc, wenn es unseres war."""
+    global _tracemalloc_users, _tracemalloc_started
+    _tracemalloc_users -= 1
+    if not _tracemalloc_users and _tracemalloc_started:
+        _tracemalloc_started = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def stage(profiler: Optional[RefreshProfiler], name: str) -> ContextManager[None]:
+    """Gib einen Zeitmesser für eine Stufe zurück (ohne Profiler: no-op)."""
+    if profiler is None:
+        return NULL_STAGE
+    return profiler.stage(name)
+
+
+class RefreshProfiler:
+    """Profiliert die nächsten N Refreshes eines Coordinators.
+
+    Pro Refresh werden die Stufen Netzwerk, JSON-Dekodierung,
+    Normalisierung und Zustands-Schreibvorgänge gemessen. Zusätzlich
+    laufen cProfile und tracemalloc nur während der Refreshes; die
+    Allokationen sind die Differenz der Snapshots vor und nach jedem
+    Refresh, beschränkt auf die Dateien der Integration. Ist kein
+    Profiler aktiv, hängt der Coordinator keinen an und die Pipeline
+    prüft lediglich auf ``None``.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str, refreshes: int) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self.name = name
+        self.remaining = refreshes
+        self._runs: List[Dict[str, float]] = []
+        self._current: Optional[Dict[str, float]] = None
+        self._profile = cProfile.Profile()
+        self._profile_used = False
+        # Summierte Differenz je Allokationsstelle: (Bytes, Blöcke)
+        self._allocations: Dict[tracemalloc.Traceback, Tuple[int, int]] = {}
+
+    @property
+    def done(self) -> bool:
+        """Return True when all requested refreshes were profiled."""
+        return self.remaining <= 0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Miss die Dauer einer Stufe des laufenden Refreshs."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._current is not None:
+                self._current[name] += time.perf_counter() - started
+
+    @contextmanager
+    def refresh(self) -> Iterator[None]:
+        """Profiliere einen vollständigen Refresh."""
+        _acquire_tracemalloc()
+        before = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+
+        self._current = defaultdict(float)
+        try:
+            # In Python ist nur ein aktiver Profiler je Thread erlaubt
+            self._profile.enable()
+            profiling = True
+        except ValueError:
+            _LOGGER.debug("cProfile bereits aktiv, Refresh nur mit Stufen-Zeiten")
+            profiling = False
+
+        try:
+            with self.stage("refresh"):
+                yield
+        finally:
+            if profiling:
+                self._profile.disable()
+                self._profile_used = True
+            # Ein fremder Aufrufer kann tracemalloc zwischendurch gestoppt haben
+            if tracemalloc.is_tracing():
+                after = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+                self._add_allocations(after.compare_to(before, "lineno"))
+            _release_tracemalloc()
+            self._runs.append(dict(self._current))
+            self._current = None
+            self.remaining -= 1
+
+    def _add_allocations(self, stats: List[tracemalloc.StatisticDiff]) -> None:
+        """Addiere die Allokations-Differenz eines Refreshs."""
+        for stat in stats:
+            size, count = self._allocations.get(stat.traceback, (0, 0))
+            self._allocations[stat.traceback] = (
+                size + stat.size_diff,
+                count + stat.count_diff,
+            )
+
+    def _render(self) -> str:
+        """Erzeuge den Bericht als Text."""
+        lines = [
+            f"PlantHub Profil: {self.name}",
+            f"Erstellt: {datetime.now().isoformat()}",
+            f"Refreshes: {len(self._runs)}",
+            "",
+            "Stufen (Sekunden)",
+            "Stufe            " + "".join(f"{f'#{i + 1}':>10}" for i in range(len(self._runs))) + "     Summe",
+        ]
+        for name in STAGES:
+            values = [run.get(name, 0.0) for run in self._runs]
+            lines.append(
+                f"{name:<17}" + "".join(f"{v:>10.4f}" for v in values) + f"{sum(values):>10.4f}"
+            )
+        lines.append("")
+        lines.append(
+            "Hinweis: 'network' enthält die Wartezeit auf das Backend, "
+            "'entity_writes' das Schreiben aller Entitätszustände."
+        )
+
+        lines += ["", f"Top {PROFILE_TOP_FUNCTIONS} Funktionen (kumulativ)"]
+        if self._profile_used:
+            buffer = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=buffer)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+            lines.append(buffer.getvalue())
+        else:
+            lines.append("(cProfile war durch einen anderen Profiler belegt)")
+
+        lines += [
+            "",
+            f"Top {PROFILE_TOP_ALLOCATIONS} Allokationen der Integration "
+            "(Differenz nach - vor jedem Refresh, summiert)",
+        ]
+        allocations = sorted(
+            self._allocations.items(), key=lambda item: abs(item[1][0]), reverse=True
+        )
+        for traceback, (size, count) in allocations[:PROFILE_TOP_ALLOCATIONS]:
+            if size or count:
+                lines.append(f"{traceback[0]}: {size / 1024:+.1f} KiB, {count:+d} Blöcke")
+        return "\n".join(lines) + "\n"
+
+    async def async_write_report(self) -> str:
+        """Schreibe den Bericht in das Konfigurationsverzeichnis."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = self.hass.config.path(f"planthub_profile_{self.name}_{timestamp}.txt")
+        report = self._render()
+
+        def _write() -> None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(report)
+
+        await self.hass.async_add_executor_job(_write)
+        _LOGGER.info("PlantHub Profil geschrieben: %s", path)
+        return path
@@ -0,0 +1,113 @@
+"""Speicherbegrenzte Ringpuffer für gleitende Kennzahlen."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Optional
+
+
+class RollingWindow:
+    """Ringpuffer fester Größe mit gleitendem Minimum, Maximum und Mittelwert.
+
+    Werte und Zeitstempel liegen in zwei ``array('d')`` fester Länge. Summe,
+    Minimum und Maximum werden bei jedem Messwert inkrementell nachgeführt
+    (Minimum und Maximum über monotone Deques, amortisiert O(1)), sodass
+    Abfragen weder den Puffer durchlaufen noch die Datenbank brauchen.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_max_age",
+        "_values",
+        "_times",
+        "_first",
+        "_next",
+        "_total",
+        "_min_seq",
+        "_max_seq",
+    )
+
+    def __init__(self, capacity: int, max_age: float) -> None:
+        """Initialize the window. ``max_age`` is given in hours."""
+        self._capacity = capacity
+        self._max_age = max_age
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        # Fortlaufende Sequenznummern; Position im Puffer ist seq % capacity
+        self._first = 0
+        self._next = 0
+        self._total = 0.0
+        self._min_seq: deque[int] = deque()
+        self._max_seq: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._next - self._first
+
+    def _evict_oldest(self) -> None:
+        """Entferne den ältesten Messwert."""
+        seq = self._first
+        self._total -= self._values[seq % self._capacity]
+        if self._min_seq and self._min_seq[0] == seq:
+            self._min_seq.popleft()
+        if self._max_seq and self._max_seq[0] == seq:
+            self._max_seq.popleft()
+        self._first += 1
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Füge einen Messwert hinzu (Zeitstempel in Stunden)."""
+        if len(self) and timestamp <= self._times[(self._next - 1) % self._capacity]:
+            # Derselbe oder ein älterer Messwert: nichts Neues
+            return
+
+        while len(self) and timestamp - self._times[self._first % self._capacity] > self._max_age:
+            self._evict_oldest()
+        if len(self) == self._capacity:
+            self._evict_oldest()
+
+        seq = self._next
+        pos = seq % self._capacity
+        self._values[pos] = value
+        self._times[pos] = timestamp
+        self._total += value
+        self._next += 1
+
+        while self._min_seq and self._values[self._min_seq[-1] % self._capacity] >= value:
+            self._min_seq.pop()
+        self._min_seq.append(seq)
+        while self._max_seq and self._values[self._max_seq[-1] % self._capacity] <= value:
+            self._max_seq.pop()
+        self._max_seq.append(seq)
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Return the minimum of the window."""
+        if not len(self):
+            return None
+        return self._values[self._min_seq[0] % self._capacity]
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Return the maximum of the window."""
+        if not len(self):
+            return None
+        return self._values[self._max_seq[0] % self._capacity]
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean of the window."""
+        if not len(self):
+            return None
+        return self._total / len(self)
+
+    @property
+    def rate_of_change(self) -> Optional[float]:
+        """Return the change per hour between oldest and newest sample."""
+        if len(self) < 2:
+            return None
+        first = self._first % self._capacity
+        last = (self._next - 1) % self._capacity
+        elapsed = self._times[last] - self._times[first]
+        if elapsed <= 0:
+            return None
+        return (self._values[last] - self._values[first]) / elapsed
@@ -0,0 +1,95 @@
+"""Versetzte Refresh-Phasen aller PlantHub Coordinatoren."""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, DOMAIN, SCHEDULE_MIN_GAP_RATIO
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RefreshScheduler:
+    """Verteilt die Refresh-Zeitpunkte aller Coordinatoren über ihr Intervall.
+
+    Coordinatoren mit gleichem Intervall bilden eine Gruppe. Innerhalb der
+    Gruppe erhält jeder Coordinator eine Phase, deren Abstand zur nächsten
+    seiner Pflanzenzahl entspricht; so verteilt sich die Last auf das
+    Backend gleichmäßig über das Intervall statt alle Einträge in derselben
+    Sekunde abzufragen. Beim Hinzufügen oder Entfernen eines Coordinators
+    werden alle Phasen neu berechnet.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        # key -> (Intervall in Sekunden, Gewicht)
+        self._members: Dict[str, Tuple[float, int]] = {}
+        self._phases: Dict[str, float] = {}
+
+    def register(self, key: str, interval: float, weight: int) -> None:
+        """Melde einen Coordinator an oder aktualisiere Intervall und Gewicht."""
+        member = (interval, max(weight, 1))
+        if self._members.get(key) == member:
+            return
+        self._members[key] = member
+        self._rebalance()
+
+    def unregister(self, key: str) -> None:
+        """Melde einen Coordinator ab."""
+        if self._members.pop(key, None) is not None:
+            self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Berechne die Phasen aller Gruppen neu."""
+        groups: Dict[float, List[str]] = defaultdict(list)
+        for key, (interval, _) in self._members.items():
+            groups[interval].append(key)
+
+        phases: Dict[str, float] = {}
+        for interval, keys in groups.items():
+            keys.sort()
+            total = sum(self._members[key][1] for key in keys)
+            position = 0
+            for key in keys:
+                weight = self._members[key][1]
+                # Mitte des Abschnitts, der dem Gewicht entspricht
+                phases[key] = interval * (position + weight / 2) / total
+                position += weight
+        self._phases = phases
+        _LOGGER.debug("Refresh-Phasen neu verteilt: %s", phases)
+
+    def phase(self, key: str) -> Optional[float]:
+        """Gib die Phase eines Coordinators in Sekunden zurück."""
+        return self._phases.get(key)
+
+    def next_refresh(
+        self, key: str, now: float, last_start: Optional[float] = None
+    ) -> Optional[float]:
+        """Gib den nächsten Refresh-Zeitpunkt auf der Phase zurück.
+
+        Zwischen dem Beginn zweier Refreshes liegt mindestens
+        ``SCHEDULE_MIN_GAP_RATIO`` des Intervalls, auch direkt nach einer
+        Neuverteilung. Gemessen wird ab ``last_start``, damit ein Refresh,
+        der einen Teil seines Zeitbudgets braucht, den nächsten Zyklus
+        nicht überspringt.
+        """
+        member = self._members.get(key)
+        if member is None:
+            return None
+        interval = member[0]
+        when = now + (self._phases[key] - now) % interval
+        reference = now if last_start is None else last_start
+        if when - reference < interval * SCHEDULE_MIN_GAP_RATIO:
+            when += interval
+        return when
+
+
+def get_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Hole den gemeinsamen Scheduler aus hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SCHEDULER not in domain_data:
+        domain_data[DATA_SCHEDULER] = RefreshScheduler()
+    return domain_data[DATA_SCHEDULER]
@@ -1,9 +1,12 @@
 """Sensor-Plattform für PlantHub Integration."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,10 +18,17 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfTemperature,
+    UnitOfTime,
     LIGHT_LUX,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -26,17 +36,58 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .const import (
+    ATTRIBUTE_MODE_LEAN,
+    CONF_ATTRIBUTE_MODE,
+    CONF_BACKEND_URLS,
+    CONF_ENTITY_MODE,
+    CONF_FLEET_SENSORS,
+    CONF_HEDGING,
+    CONF_MAX_STALENESS,
+    CONF_SENSORS,
+    CONF_SHARDING,
+    CONF_STATUS_HYSTERESIS,
     CONF_TOKEN,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_ENTITY_MODE,
+    DEFAULT_FLEET_SENSORS,
+    DEFAULT_HEDGING,
+    DEFAULT_LEAN_SENSORS,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_SHARDING,
+    DEFAULT_STATUS_HYSTERESIS,
     DEFAULT_NAME,
+    DEFAULT_SHARD,
+    ENTITY_MODE_LEAN,
+    DATA_FLEET_OWNER,
     DOMAIN,
+    EVENT_STATUS_CHANGED,
+    REFRESH_DEADLINE_RATIO,
+    SHARDING_AUTO,
+    SIGNAL_PLANTS_UPDATED,
+    REFRESH_DEBOUNCE_COOLDOWN,
+    ROLLING_CAPACITY,
+    ROLLING_WINDOW_HOURS,
     STATUS_CRITICAL,
     STATUS_HEALTHY,
     STATUS_UNKNOWN,
     STATUS_WARNING,
-    SOIL_MOISTURE_CRITICAL_THRESHOLD,
-    SOIL_MOISTURE_WARNING_THRESHOLD,
+    STREAM_POLL_INTERVAL,
+    WEBHOOK_BASE_URL,
 )
 
+from .backends import BackendPool, HedgePolicy
+from .filters import PublishFilter
+from .fleet import FleetAggregate, get_fleet
+from .forecast import MoistureForecaster, reading_hours
+from .normalizer import CORE_FIELDS, FIELD_TABLE, FieldSpec
+from .profiler import RefreshProfiler, stage
+from .rolling import RollingWindow
+from .scheduling import get_scheduler
+from .transport import scale_interval
+from .sharding import PlantHealth, shard_interval
+from .status import StatusTracker
+from .tracing import RefreshTracer, annotate, span
+
 _LOGGER = logging.getLogger(__name__)
 
 # Vollständige Sensor-Beschreibungen für moderne Home Assistant 2025 Standards
@@ -86,6 +137,54 @@ SENSOR_DESCRIPTIONS = {
         native_unit_of_measurement=LIGHT_LUX,
         entity_registry_visible_default=True,
     ),
+    "hours_until_critical": SensorEntityDescription(
+        key="hours_until_critical",
+        name="Zeit bis kritisch",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=1,
+        entity_registry_visible_default=True,
+    ),
+    "soil_moisture_min_24h": SensorEntityDescription(
+        key="soil_moisture_min_24h",
+        name="Bodenfeuchtigkeit Minimum 24 h",
+        icon="mdi:water-minus",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_visible_default=True,
+    ),
+    "soil_moisture_max_24h": SensorEntityDescription(
+        key="soil_moisture_max_24h",
+        name="Bodenfeuchtigkeit Maximum 24 h",
+        icon="mdi:water-plus",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_visible_default=True,
+    ),
+    "soil_moisture_mean_24h": SensorEntityDescription(
+        key="soil_moisture_mean_24h",
+        name="Bodenfeuchtigkeit Mittelwert 24 h",
+        icon="mdi:water-percent",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        entity_registry_visible_default=True,
+    ),
+    "soil_moisture_rate": SensorEntityDescription(
+        key="soil_moisture_rate",
+        name="Bodenfeuchtigkeit Änderungsrate",
+        icon="mdi:trending-down",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="%/h",
+        suggested_display_precision=2,
+        entity_registry_visible_default=True,
+    ),
     "plant_id": SensorEntityDescription(
         key="plant_id",
         name="Pflanzen-ID",
@@ -98,100 +197,921 @@ SENSOR_DESCRIPTIONS = {
 }
 
 
+def _metric_description(spec: FieldSpec) -> SensorEntityDescription:
+    """Erstelle die Sensor-Beschreibung eines Messwerts aus der Feldtabelle."""
+    device_class = None
+    if spec.device_class:
+        try:
+            device_class = SensorDeviceClass(spec.device_class)
+        except ValueError:
+            # Ältere Home Assistant Versionen kennen nicht alle Geräteklassen
+            _LOGGER.debug("Unbekannte Geräteklasse für %s: %s", spec.key, spec.device_class)
+
+    return SensorEntityDescription(
+        key=spec.key,
+        name=spec.label,
+        icon=spec.icon,
+        device_class=device_class,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=spec.unit,
+        entity_registry_visible_default=True,
+    )
+
+
+# Zusätzliche Messwerte der Feldtabelle erhalten generische Sensoren
+SENSOR_DESCRIPTIONS.update(
+    {spec.key: _metric_description(spec) for spec in FIELD_TABLE if spec.key not in CORE_FIELDS}
+)
+EXTRA_METRICS = tuple(spec.key for spec in FIELD_TABLE if spec.key not in CORE_FIELDS)
+
+
+def _fleet_count_description(status: str, name: str, icon: str) -> SensorEntityDescription:
+    """Erstelle die Beschreibung eines Flotten-Sensors für einen Status."""
+    return SensorEntityDescription(
+        key=f"fleet_{status}",
+        name=name,
+        icon=icon,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=None,
+        entity_registry_visible_default=True,
+    )
+
+
+# Flotten-Sensoren je Eintrag und über alle Einträge
+FLEET_DESCRIPTIONS = {
+    "fleet_healthy": _fleet_count_description(STATUS_HEALTHY, "Pflanzen gesund", "mdi:flower"),
+    "fleet_warning": _fleet_count_description(STATUS_WARNING, "Pflanzen mit Warnung", "mdi:flower-outline"),
+    "fleet_critical": _fleet_count_description(STATUS_CRITICAL, "Pflanzen kritisch", "mdi:alert"),
+    "fleet_unknown": _fleet_count_description(STATUS_UNKNOWN, "Pflanzen unbekannt", "mdi:help-circle"),
+    "fleet_soil_moisture_mean": SensorEntityDescription(
+        key="fleet_soil_moisture_mean",
+        name="Bodenfeuchtigkeit Mittelwert",
+        icon="mdi:water-percent",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        entity_registry_visible_default=True,
+    ),
+    "fleet_soil_moisture_min": SensorEntityDescription(
+        key="fleet_soil_moisture_min",
+        name="Bodenfeuchtigkeit Minimum",
+        icon="mdi:water-minus",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_visible_default=True,
+    ),
+    "fleet_oldest_reading": SensorEntityDescription(
+        key="fleet_oldest_reading",
+        name="Älteste Messung",
+        icon="mdi:clock-alert-outline",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        state_class=None,
+        native_unit_of_measurement=None,
+        entity_registry_visible_default=True,
+    ),
+}
+
+# Sensor-Schlüssel -> Kennzahl der FleetAggregate (konstanter Aufwand)
+FLEET_VALUES: Dict[str, Callable[[FleetAggregate], Any]] = {
+    "fleet_healthy": lambda fleet: fleet.count(STATUS_HEALTHY),
+    "fleet_warning": lambda fleet: fleet.count(STATUS_WARNING),
+    "fleet_critical": lambda fleet: fleet.count(STATUS_CRITICAL),
+    "fleet_unknown": lambda fleet: fleet.count(STATUS_UNKNOWN),
+    "fleet_soil_moisture_mean": lambda fleet: fleet.mean_moisture,
+    "fleet_soil_moisture_min": lambda fleet: fleet.min_moisture,
+    "fleet_oldest_reading": lambda fleet: fleet.oldest_reading,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Setze die PlantHub Sensor-Entitäten auf."""
-    coordinator: PlantHubDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][
-        "coordinator"
-    ]
-    
-    # Erstelle Sensor-Entitäten für alle konfigurierten Pflanzen
+    coordinators: List[PlantHubDataUpdateCoordinator] = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]["coordinators"]
+
+    # Abgewählte Sensoren nicht als verwaiste Einträge stehen lassen
+    _async_remove_deselected_entities(hass, config_entry, coordinators)
+
+    for coordinator in coordinators:
+        _async_setup_shard(config_entry, coordinator, async_add_entities)
+
+    _async_setup_fleet(hass, config_entry, coordinators[0].fleet, async_add_entities)
+
+    # Verstecke plant_id Entitäten (im Lean-Modus gibt es keine)
+    if coordinators[0].entity_mode != ENTITY_MODE_LEAN:
+        await _hide_plant_id_entities(
+            hass, [p["plant_id"] for c in coordinators for p in c.plants]
+        )
+
+
+@callback
+def _async_setup_shard(
+    config_entry: ConfigEntry,
+    coordinator: PlantHubDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Lege die Entitäten der Pflanzen eines Shards an."""
+    # Erstelle die gewählten Sensor-Entitäten aller Pflanzen des Shards
     entities = []
-    
     for plant_config in coordinator.plants:
-        plant_id = plant_config["plant_id"]
-        plant_name = plant_config["name"]
-        
-        # Status-Sensor
-        entities.append(PlantHubStatusSensor(coordinator, plant_id, plant_name))
-        
-        # Bodenfeuchtigkeit-Sensor
-        entities.append(PlantHubSoilMoistureSensor(coordinator, plant_id, plant_name))
-        
-        # Lufttemperatur-Sensor
-        entities.append(PlantHubAirTemperatureSensor(coordinator, plant_id, plant_name))
-        
-        # Luftfeuchtigkeit-Sensor
-        entities.append(PlantHubAirHumiditySensor(coordinator, plant_id, plant_name))
-        
-        # Helligkeit-Sensor
-        entities.append(PlantHubIlluminanceSensor(coordinator, plant_id, plant_name))
-        
-        # Versteckte plant_id Entität (nur für interne Zwecke)
-        entities.append(PlantHubPlantIdSensor(coordinator, plant_id, plant_name))
-    
+        entities.extend(_plant_entities(coordinator, plant_config))
     async_add_entities(entities)
-    
-    # Verstecke plant_id Entitäten
-    await _hide_plant_id_entities(hass, [p["plant_id"] for p in coordinator.plants])
+
+    # Sensoren für zusätzliche Messwerte (z.B. Batterie, Leitfähigkeit)
+    # entstehen, sobald die API den Messwert für eine Pflanze liefert
+    known_metrics: set[tuple[str, str]] = set()
+
+    @callback
+    def _async_add_metric_sensors() -> None:
+        """Lege Sensoren für neu gelieferte Messwerte an."""
+        # In einen anderen Shard verschobene Pflanzen nehmen ihre Sensoren mit
+        configured = {p["plant_id"] for p in coordinator.plants}
+        known_metrics.difference_update([k for k in known_metrics if k[0] not in configured])
+        new_entities = []
+        for plant_config in coordinator.plants:
+            plant_id = plant_config["plant_id"]
+            plant_data = coordinator.get_plant_data(plant_id)
+            if not plant_data:
+                continue
+            sensors = coordinator.enabled_sensors(plant_config)
+            for metric in EXTRA_METRICS:
+                if plant_data.get(metric) is None or (plant_id, metric) in known_metrics:
+                    continue
+                if sensors is not None and metric not in sensors:
+                    continue
+                known_metrics.add((plant_id, metric))
+                entity = PlantHubMetricSensor(coordinator, plant_id, plant_config["name"], metric)
+                coordinator.plant_entities.setdefault(plant_id, []).append(entity)
+                new_entities.append(entity)
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_metric_sensors()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_metric_sensors))
+
+
+def _plant_entities(
+    coordinator: PlantHubDataUpdateCoordinator, plant_config: Dict[str, Any]
+) -> List[BasePlantHubSensor]:
+    """Erstelle die gewählten Sensor-Entitäten einer Pflanze."""
+    plant_id = plant_config["plant_id"]
+    plant_name = plant_config["name"]
+    sensors = coordinator.enabled_sensors(plant_config)
+
+    entities = [
+        factory(coordinator, plant_id, plant_name)
+        for key, factory in SENSOR_FACTORIES.items()
+        if sensors is None or key in sensors
+    ]
+    # Versteckte plant_id Entität (nur für interne Zwecke); im
+    # Lean-Modus steht die plant_id bereits im Gerät
+    if coordinator.entity_mode != ENTITY_MODE_LEAN:
+        entities.append(PlantHubPlantIdSensor(coordinator, plant_id, plant_name))
+    coordinator.plant_entities.setdefault(plant_id, []).extend(entities)
+    return entities
+
+
+async def async_move_plant_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    plant_config: Dict[str, Any],
+    source: PlantHubDataUpdateCoordinator,
+    target: PlantHubDataUpdateCoordinator,
+) -> None:
+    """Lege die Entitäten einer Pflanze am Coordinator ihres neuen Shards neu an.
+
+    Unique IDs und damit Entity-IDs bleiben erhalten; Sensoren für
+    zusätzliche Messwerte legt der neue Shard beim nächsten Update an.
+    """
+    for entity in source.plant_entities.pop(plant_config["plant_id"], []):
+        if entity.hass is not None:
+            await entity.async_remove()
+    async_add_entities = hass.data[DOMAIN][config_entry.entry_id]["add_entities"]
+    async_add_entities(_plant_entities(target, plant_config))
+
+
+@callback
+def _async_setup_fleet(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    fleet: FleetAggregate,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Lege die Flotten-Sensoren des Eintrags und aller Einträge an."""
+    # Für die spätere Übernahme der Sensoren aller Einträge merken
+    hass.data[DOMAIN][config_entry.entry_id]["add_entities"] = async_add_entities
+
+    if config_entry.data.get(CONF_FLEET_SENSORS, DEFAULT_FLEET_SENSORS):
+        device_info = {
+            "identifiers": {(DOMAIN, f"fleet_{config_entry.entry_id}")},
+            "name": f"{config_entry.title} Übersicht",
+            "manufacturer": "PlantHub",
+            "model": "PlantHub Übersicht",
+        }
+        async_add_entities(
+            PlantHubFleetSensor(fleet, key, f"fleet_{config_entry.entry_id}_{key}", device_info)
+            for key in FLEET_DESCRIPTIONS
+        )
+
+    async_claim_fleet_sensors(hass, config_entry.entry_id)
+
+
+@callback
+def async_claim_fleet_sensors(hass: HomeAssistant, entry_id: str) -> bool:
+    """Lege die Flotten-Sensoren aller Einträge in diesem Eintrag an.
+
+    Genau ein geladener Eintrag stellt die Sensoren bereit. Wird er
+    entladen, übernimmt sie ein verbleibender Eintrag. Gibt zurück, ob
+    der Eintrag die Sensoren übernommen hat.
+    """
+    domain_data = hass.data[DOMAIN]
+    async_add_entities = domain_data.get(entry_id, {}).get("add_entities")
+    if domain_data.get(DATA_FLEET_OWNER) is not None or async_add_entities is None:
+        return False
+
+    domain_data[DATA_FLEET_OWNER] = entry_id
+    device_info = {
+        "identifiers": {(DOMAIN, "fleet")},
+        "name": "PlantHub Übersicht",
+        "manufacturer": "PlantHub",
+        "model": "PlantHub Übersicht",
+    }
+    async_add_entities(
+        PlantHubFleetSensor(get_fleet(hass), key, f"fleet_{key}", device_info)
+        for key in FLEET_DESCRIPTIONS
+    )
+    _LOGGER.debug("Flotten-Sensoren aller Einträge von Eintrag %s bereitgestellt", entry_id)
+    return True
+
+
+# Messwerte der Feldtabelle; Status, Prognose und Übersicht brauchen immer
+# die Bodenfeuchtigkeit
+_FIELD_KEYS = frozenset(spec.key for spec in FIELD_TABLE)
+_ALWAYS_FETCHED = frozenset({"soil_moisture"})
+
+# Sensor-Schlüssel der gleitenden Kennzahlen und zugehörige RollingWindow-Eigenschaft
+ROLLING_STATISTICS = {
+    "soil_moisture_min_24h": "minimum",
+    "soil_moisture_max_24h": "maximum",
+    "soil_moisture_mean_24h": "mean",
+    "soil_moisture_rate": "rate_of_change",
+}
 
 
 class PlantHubDataUpdateCoordinator(DataUpdateCoordinator):
     """Koordinierer für PlantHub Daten-Updates."""
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-        """Initialize the coordinator."""
-        # Hole scan_interval aus der Konfiguration und konvertiere zu timedelta
-        scan_interval_seconds = config_entry.data.get("scan_interval", 300)
-        update_interval = timedelta(seconds=scan_interval_seconds)
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        shard: str = DEFAULT_SHARD,
+        plants: Optional[List[Dict[str, Any]]] = None,
+        backends: Optional[BackendPool] = None,
+        hedge: Optional[HedgePolicy] = None,
+        fleet: Optional[FleetAggregate] = None,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Jeder Shard eines Eintrags hat einen eigenen Coordinator mit eigenem
+        Intervall; Backend-Pool, Hedge-Budget und Flotten-Kennzahlen teilen
+        sich alle Shards.
+        """
+        name = f"{DOMAIN}_{config_entry.data.get('name', DEFAULT_NAME)}"
+        if shard != DEFAULT_SHARD:
+            name = f"{name}_{shard}"
         
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN}_{config_entry.data.get('name', DEFAULT_NAME)}",
-            update_interval=update_interval,
+            name=name,
+            update_interval=scale_interval(hass, shard_interval(config_entry.data, shard)),
         )
         
         self.config_entry = config_entry
         self.hass = hass
+        self.shard = shard
         # Hole den Token aus hass.data statt aus config_entry
         self.token = hass.data[DOMAIN][CONF_TOKEN]
-        self.plants = config_entry.data.get("plants", [])  # Liste aller Pflanzen
+        self.attribute_mode = config_entry.data.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE)
+        self.entity_mode = config_entry.data.get(CONF_ENTITY_MODE, DEFAULT_ENTITY_MODE)
+        # Eine Geräte-Info je Pflanze, die sich alle Entitäten teilen
+        self._device_info: Dict[str, Dict[str, Any]] = {}
+        self.forecaster = MoistureForecaster()
+        self.rolling: Dict[str, RollingWindow] = {}
+        # Entitäten je Pflanze, damit sie beim Wechsel des Shards umziehen
+        self.plant_entities: Dict[str, List[Any]] = {}
+        # Pflanzen dieses Shards (ohne Sharding: alle Pflanzen)
+        self.set_plants(plants if plants is not None else config_entry.data.get("plants", []))
+
+        # Totband-Filter vor der Benachrichtigung der Entitäten
+        self.publish_filter = PublishFilter.from_config(config_entry.data)
+        # Timer für Werte, die der Filter wegen des Mindestintervalls zurückhält
+        self._unsub_held: Optional[Callable[[], None]] = None
+        self.backends = backends or BackendPool(
+            config_entry.data.get(CONF_BACKEND_URLS) or [WEBHOOK_BASE_URL]
+        )
+        if hedge is None and config_entry.data.get(CONF_HEDGING, DEFAULT_HEDGING):
+            hedge = HedgePolicy()
+        self.hedge = hedge
+
+        # Status mit Hysterese; Wechsel werden als Event gemeldet
+        self.status_tracker = StatusTracker(
+            config_entry.data.get(CONF_STATUS_HYSTERESIS, DEFAULT_STATUS_HYSTERESIS)
+        )
+
+        # Antwortzeit und Fehlerquote je Pflanze für das automatische Sharding
+        self.plant_health: Dict[str, PlantHealth] = {}
+        # plant_id -> geänderte Messwerte des letzten Updates (None = alle)
+        self._changed: Optional[Dict[str, FrozenSet[str]]] = None
+
+        # Versetzte Refresh-Phase, geteilt mit allen Einträgen
+        self._scheduler = get_scheduler(hass)
+        self._schedule_key = f"{config_entry.entry_id}:{shard}"
+        # Beginn des letzten Refreshs (loop.time) für den Mindestabstand
+        self._refresh_started: Optional[float] = None
+
+        # Flotten-Kennzahlen des Eintrags und aller Einträge, gepflegt je
+        # geänderter Pflanze
+        self.fleet = fleet or FleetAggregate()
+        self._domain_fleet = get_fleet(hass)
+
+        # Die letzten Refreshes als Traces für die Diagnose
+        self.tracer = RefreshTracer()
+
+        # Nur gesetzt, solange der Service planthub.profile aktiv ist
+        self.profiler: Optional[RefreshProfiler] = None
+
+        # Pflanzen, die beim letzten Refresh nicht mehr drankamen
+        self._carry_over: List[str] = []
+        # Vom automatischen Sharding gewünschte Wechsel: plant_id -> Shard
+        self._pending_moves: Dict[str, str] = {}
+        self.telemetry: Dict[str, Any] = {
+            "refreshes": 0,
+            "deadline_hits": 0,
+            "carried_over": 0,
+            "last_duration": None,
+            "last_deadline_hit": None,
+        }
+
+        # Last-known-good: Zeitpunkt der letzten erfolgreichen Abfrage
+        # (time.monotonic) und Pflanzen, die gerade aus dem Cache kommen
+        self.max_staleness = config_entry.data.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        self._fetched_at: Dict[str, float] = {}
+        self._stale: set[str] = set()
+
+        # Höchster bekannter Quell-Zeitstempel je Pflanze
+        self._watermarks: Dict[str, datetime] = {}
+
+        # Gezielte Refreshes einzelner Pflanzen werden gesammelt und entprellt
+        self._pending_refresh: set[str] = set()
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_pending_plants,
+        )
+
+    def async_arm_profiler(self, refreshes: int) -> None:
+        """Profiliere die nächsten ``refreshes`` Refreshes."""
+        self.profiler = RefreshProfiler(
+            self.hass, f"{self.config_entry.entry_id}_{self.shard}", refreshes
+        )
+        _LOGGER.info("Profiling für die nächsten %d Refreshes aktiviert", refreshes)
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh mit Trace, bei aktivem Profiler mit Messung aller Stufen."""
+        self._refresh_started = self.hass.loop.time()
+        profiler = self.profiler
+        if profiler is None:
+            with self.tracer.trace("refresh", shard=self.shard, plants=len(self.plants)):
+                await super()._async_refresh(*args, **kwargs)
+            self._async_schedule_moves()
+            return
+
+        with profiler.refresh(), self.tracer.trace(
+            "refresh", shard=self.shard, plants=len(self.plants)
+        ):
+            await super()._async_refresh(*args, **kwargs)
+        if profiler.done and self.profiler is profiler:
+            self.profiler = None
+            self.hass.async_create_task(profiler.async_write_report())
+        self._async_schedule_moves()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Plane den nächsten Refresh auf die zugewiesene Phase.
+
+        Die Planung selbst bleibt beim DataUpdateCoordinator; für diesen
+        Aufruf wird nur das Intervall auf den Abstand bis zur Phase gesetzt.
+        """
+        interval = self.update_interval
+        if interval is None:
+            super()._schedule_refresh()
+            return
+
+        self._scheduler.register(
+            self._schedule_key, interval.total_seconds(), len(self.plants)
+        )
+        now = self.hass.loop.time()
+        when = self._scheduler.next_refresh(self._schedule_key, now, self._refresh_started)
+        self.update_interval = timedelta(seconds=when - now)
+        try:
+            super()._schedule_refresh()
+        finally:
+            self.update_interval = interval
+
+    def refresh_phase(self) -> Optional[float]:
+        """Gib die Phase des Coordinators im Intervall zurück (Sekunden)."""
+        return self._scheduler.phase(self._schedule_key)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Benachrichtige die Entitäten (bei aktivem Profiler mit Messung)."""
+        with stage(self.profiler, "entity_writes"), span(
+            "publish", listeners=len(self._listeners)
+        ):
+            super().async_update_listeners()
+            # WebSocket-Abonnenten (planthub/subscribe) erhalten Deltas
+            async_dispatcher_send(self.hass, SIGNAL_PLANTS_UPDATED, self)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data from PlantHub API."""
         try:
-            from .webhook import PlantHubWebhook
-            
-            all_plants_data = {}
-            
-            async with PlantHubWebhook(self.hass, self.token) as webhook:
-                # Hole Daten für alle konfigurierten Pflanzen
-                for plant_config in self.plants:
-                    plant_id = plant_config["plant_id"]
-                    try:
-                        plant_data = await webhook.fetch_plant_data(plant_id)
-                        all_plants_data[plant_id] = plant_data
-                    except Exception as e:
-                        _LOGGER.error("Fehler beim Laden der Daten für Pflanze %s: %s", plant_id, e)
-                        all_plants_data[plant_id] = None
-                
-                return {
-                    "plants": all_plants_data,
-                    "last_update": datetime.now().isoformat(),
-                }
+            configured = [plant_config["plant_id"] for plant_config in self.plants]
+            # Übertrag aus dem letzten Refresh zuerst abfragen
+            carried = [p for p in self._carry_over if p in configured]
+            ordered = carried + [p for p in configured if p not in carried]
+
+            started = time.monotonic()
+            budget = self.update_interval.total_seconds() * REFRESH_DEADLINE_RATIO
+            fetched, self._carry_over = await self._async_fetch_plants(
+                ordered, deadline=started + budget
+            )
+            self._record_refresh(started, budget)
+
+            self.forecaster.sync(self._forecast_plants)
+            self.publish_filter.forget(configured)
+            self.status_tracker.forget(configured)
+            for plant_id in [p for p in self._watermarks if p not in configured]:
+                del self._watermarks[plant_id]
+            for plant_id in [p for p in self._fetched_at if p not in configured]:
+                del self._fetched_at[plant_id]
+            for plant_id in [p for p in self._device_info if p not in configured]:
+                del self._device_info[plant_id]
+            for plant_id in [p for p in self.plant_health if p not in configured]:
+                del self.plant_health[plant_id]
+            self._async_check_auto_shards()
+            self._stale.intersection_update(configured)
+
+            previous = self.data.get("plants", {}) if self.data else {}
+            self._serve_last_known_good(fetched, previous, revalidate=True)
+
+            self._update_derived(fetched)
+            self._changed = {}
+
+            # Pflanzen ohne neuen Messwert behalten ihre bisherigen Daten
+            all_plants_data = {plant_id: previous.get(plant_id) for plant_id in configured}
+            all_plants_data.update(self._apply_publish_filter(fetched))
+            self._async_update_status(all_plants_data)
+            return {
+                "plants": all_plants_data,
+                "last_update": datetime.now().isoformat(),
+            }
                 
         except Exception as e:
             _LOGGER.error("Fehler beim Aktualisieren der PlantHub-Daten: %s", e)
+            self._changed = None
+            # Noch gültige Messwerte weiter aus dem Cache ausliefern
+            previous = self.data.get("plants", {}) if self.data else {}
+            failed: Dict[str, Any] = {plant_id: None for plant_id in previous}
+            self._serve_last_known_good(failed, previous, revalidate=False)
+            # Pflanzen ohne gültige Daten zählen in der Flotte als unbekannt
+            for plant_id in failed:
+                self._update_fleet(plant_id, STATUS_UNKNOWN, None)
             return {
-                "plants": {},
+                "plants": {
+                    plant_id: previous[plant_id]
+                    for plant_id in previous
+                    if plant_id not in failed
+                },
                 "last_update": datetime.now().isoformat(),
                 "error": str(e),
             }
 
+    def _serve_last_known_good(
+        self, fetched: Dict[str, Any], previous: Dict[str, Any], revalidate: bool
+    ) -> None:
+        """Bediene fehlgeschlagene Pflanzen aus ihrem letzten gültigen Stand.
+
+        Fehlgeschlagene Pflanzen (None), deren letzter erfolgreicher Abruf
+        höchstens ``max_staleness`` Sekunden zurückliegt, werden aus
+        ``fetched`` entfernt und behalten so ihre bisherigen Daten. Mit
+        ``revalidate`` werden sie im Hintergrund erneut abgefragt.
+        """
+        now = time.monotonic()
+        stale: List[str] = []
+        for plant_id, plant_data in list(fetched.items()):
+            if plant_data is not None:
+                self._stale.discard(plant_id)
+                continue
+            fetched_at = self._fetched_at.get(plant_id)
+            if (
+                previous.get(plant_id) is None
+                or fetched_at is None
+                or now - fetched_at > self.max_staleness
+            ):
+                self._stale.discard(plant_id)
+                continue
+            del fetched[plant_id]
+            stale.append(plant_id)
+
+        if not stale:
+            return
+        self._stale.update(stale)
+        _LOGGER.debug("Liefere zwischengespeicherte Daten für Pflanzen: %s", stale)
+        if revalidate:
+            self.hass.async_create_task(self.async_request_plant_refresh(stale))
+
+    def data_age(self, plant_id: str) -> Optional[float]:
+        """Gib das Alter der Daten seit dem letzten erfolgreichen Abruf zurück."""
+        fetched_at = self._fetched_at.get(plant_id)
+        if fetched_at is None:
+            return None
+        return time.monotonic() - fetched_at
+
+    def is_stale(self, plant_id: str) -> bool:
+        """Prüfe, ob die Pflanze gerade aus dem Cache bedient wird."""
+        return plant_id in self._stale
+
+    @callback
+    def _async_check_auto_shards(self) -> None:
+        """Merke auffällige Pflanzen im Auto-Modus für einen Shard-Wechsel vor.
+
+        Verschoben wird erst nach dem Refresh, gesammelt für alle Pflanzen
+        (siehe ``_async_schedule_moves``).
+        """
+        if self.config_entry.data.get(CONF_SHARDING, DEFAULT_SHARDING) != SHARDING_AUTO:
+            return
+
+        for plant_id, health in self.plant_health.items():
+            target = health.desired_shard(self.shard)
+            if target is not None:
+                self._pending_moves[plant_id] = target
+
+    @callback
+    def _async_schedule_moves(self) -> None:
+        """Verschiebe die vorgemerkten Pflanzen außerhalb des Refreshs."""
+        if not self._pending_moves:
+            return
+        from . import async_move_plants
+
+        moves, self._pending_moves = self._pending_moves, {}
+        self.hass.async_create_task(async_move_plants(self.hass, self.config_entry, moves))
+
+    @callback
+    def _async_update_status(self, plants_data: Dict[str, Any]) -> None:
+        """Bewerte den Status neu und melde echte Wechsel auf dem Event-Bus."""
+        names = {p["plant_id"]: p["name"] for p in self.plants}
+        transitions = self.status_tracker.update(plants_data)
+        for plant_id, plant_data in plants_data.items():
+            self._update_fleet(plant_id, self.status_tracker.status(plant_id), plant_data)
+        for plant_id, old_status, new_status in transitions:
+            plant_data = plants_data.get(plant_id) or {}
+            _LOGGER.debug("Status von Pflanze %s: %s -> %s", plant_id, old_status, new_status)
+            self.hass.bus.async_fire(
+                EVENT_STATUS_CHANGED,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "plant_id": plant_id,
+                    "plant_name": names.get(plant_id, plant_id),
+                    "old_status": old_status,
+                    "new_status": new_status,
+                    "soil_moisture": plant_data.get("soil_moisture"),
+                },
+            )
+
+    def _update_fleet(
+        self, plant_id: str, status: str, plant_data: Optional[Dict[str, Any]]
+    ) -> None:
+        """Übernimm den Beitrag einer Pflanze in die Flotten-Kennzahlen."""
+        moisture = plant_data.get("soil_moisture") if plant_data else None
+        reading = plant_data.get("last_update") if plant_data else None
+        if not isinstance(reading, datetime):
+            reading = None
+        self.fleet.update(plant_id, status, moisture, reading)
+        self._domain_fleet.update(
+            f"{self.config_entry.entry_id}:{plant_id}", status, moisture, reading
+        )
+
+    def _record_refresh(self, started: float, budget: float) -> None:
+        """Erfasse Dauer und Fristüberschreitungen eines Refreshs."""
+        telemetry = self.telemetry
+        telemetry["refreshes"] += 1
+        telemetry["last_duration"] = round(time.monotonic() - started, 3)
+        if not self._carry_over:
+            return
+        telemetry["deadline_hits"] += 1
+        telemetry["carried_over"] += len(self._carry_over)
+        telemetry["last_deadline_hit"] = datetime.now().isoformat()
+        _LOGGER.warning(
+            "Refresh-Frist von %.0f s überschritten, %d Pflanzen werden im nächsten Durchlauf zuerst abgefragt",
+            budget,
+            len(self._carry_over),
+        )
+
+    def _update_derived(self, plants_data: Dict[str, Any]) -> None:
+        """Aktualisiere Prognose und gleitende Kennzahlen mit neuen Messwerten."""
+        self.forecaster.update(
+            {
+                plant_id: plant_data
+                for plant_id, plant_data in plants_data.items()
+                if plant_id in self._forecast_plants
+            }
+        )
+
+        for plant_id in [p for p in self.rolling if p not in self._rolling_plants]:
+            del self.rolling[plant_id]
+
+        for plant_id, plant_data in plants_data.items():
+            if plant_id not in self._rolling_plants:
+                continue
+            if not plant_data or plant_data.get("soil_moisture") is None:
+                continue
+            window = self.rolling.get(plant_id)
+            if window is None:
+                window = self.rolling[plant_id] = RollingWindow(
+                    ROLLING_CAPACITY, ROLLING_WINDOW_HOURS
+                )
+            timestamp = reading_hours(plant_data, datetime.now().timestamp() / 3600)
+            window.add(timestamp, plant_data["soil_moisture"])
+
+    def _apply_publish_filter(self, plants_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Wende Totband und Mindestintervall auf neue Messwerte an."""
+        now = time.monotonic()
+        published: Dict[str, Any] = {}
+        for plant_id, plant_data in plants_data.items():
+            published[plant_id], self._changed[plant_id] = self.publish_filter.apply(
+                plant_id, plant_data, now
+            )
+        self._schedule_held_publish(now)
+        return published
+
+    @callback
+    def _schedule_held_publish(self, now: float) -> None:
+        """Plane das Nachreichen zurückgehaltener Werte.
+
+        Pflanzen ohne neuen Messwert fehlen im nächsten Abruf; ohne Timer
+        bliebe ein zurückgehaltener Wert bis zur nächsten Messung unsichtbar.
+        """
+        if self._unsub_held is not None:
+            self._unsub_held()
+            self._unsub_held = None
+        delay = self.publish_filter.next_release(now)
+        if delay is not None:
+            self._unsub_held = async_call_later(self.hass, delay, self._async_publish_held)
+
+    @callback
+    def _async_publish_held(self, _now: datetime) -> None:
+        """Veröffentliche zurückgehaltene Werte, deren Mindestintervall abgelaufen ist."""
+        self._unsub_held = None
+        now = time.monotonic()
+        released = self.publish_filter.release(now)
+        data = dict(self.data or {})
+        plants = dict(data.get("plants", {}))
+        self._changed = {}
+        for plant_id, values in released.items():
+            if plants.get(plant_id) is None:
+                # Pflanze inzwischen ohne Daten: nichts nachzureichen
+                continue
+            plants[plant_id] = {**plants[plant_id], **values}
+            self._changed[plant_id] = frozenset(values)
+        self._schedule_held_publish(now)
+        if not self._changed:
+            return
+
+        self._async_update_status({plant_id: plants[plant_id] for plant_id in self._changed})
+        data["plants"] = plants
+        self.async_set_updated_data(data)
+
+    def updated_plants(self) -> Optional[Iterable[str]]:
+        """Gib die Pflanzen mit neuen Daten im letzten Update zurück (None = alle)."""
+        return None if self._changed is None else self._changed.keys()
+
+    def has_changed(self, plant_id: str, metrics: FrozenSet[str]) -> bool:
+        """Prüfe, ob sich einer der Messwerte beim letzten Update geändert hat."""
+        if self._changed is None:
+            return True
+        return not metrics.isdisjoint(self._changed.get(plant_id, ()))
+
+    async def _async_fetch_plants(
+        self, plant_ids: Iterable[str], deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Hole die Daten der angegebenen Pflanzen in einer Webhook-Session.
+
+        Pflanzen, deren Messwert nicht neuer als der zuletzt gesehene ist,
+        fehlen im Ergebnis; fehlgeschlagene Pflanzen sind None. Ist
+        ``deadline`` (``time.monotonic()``) erreicht, wird abgebrochen; die
+        nicht mehr abgefragten Pflanzen werden als zweiter Wert zurückgegeben.
+        """
+        from .webhook import PlantHubWebhook
+
+        plants_data: Dict[str, Any] = {}
+        plant_ids = list(plant_ids)
+
+        async with PlantHubWebhook(
+            self.hass,
+            self.token,
+            backends=self.backends,
+            hedge=self.hedge,
+            profiler=self.profiler,
+        ) as webhook, stage(self.profiler, "fetch"):
+            for index, plant_id in enumerate(plant_ids):
+                started = time.monotonic()
+                timeout = None if deadline is None else deadline - started
+                if timeout is not None and timeout <= 0:
+                    return plants_data, plant_ids[index:]
+                health = self.plant_health.get(plant_id)
+                if health is None:
+                    health = self.plant_health[plant_id] = PlantHealth()
+                try:
+                    with span("plant", plant_id=plant_id):
+                        plant_data = await asyncio.wait_for(
+                            webhook.fetch_plant_data(
+                                plant_id,
+                                since=self._watermarks.get(plant_id),
+                                fields=self.plant_fields.get(plant_id),
+                            ),
+                            timeout,
+                        )
+                        annotate(modified=plant_data is not None)
+                except asyncio.TimeoutError:
+                    # Frist abgelaufen: diese und alle folgenden Pflanzen übertragen
+                    return plants_data, plant_ids[index:]
+                except Exception as e:
+                    _LOGGER.error("Fehler beim Laden der Daten für Pflanze %s: %s", plant_id, e)
+                    health.record(time.monotonic() - started, failed=True)
+                    plants_data[plant_id] = None
+                    continue
+
+                health.record(time.monotonic() - started, failed=False)
+                # Auch "nicht neuer" bestätigt den bekannten Stand
+                self._fetched_at[plant_id] = time.monotonic()
+                if plant_data is None:
+                    # Messwert nicht neuer als der bekannte: nichts zu tun
+                    continue
+
+                source_time = plant_data.get("last_update")
+                if isinstance(source_time, datetime):
+                    self._watermarks[plant_id] = source_time
+                plants_data[plant_id] = plant_data
+
+        return plants_data, []
+
+    async def async_request_plant_refresh(self, plant_ids: Iterable[str]) -> None:
+        """Fordere einen entprellten Refresh für einzelne Pflanzen an.
+
+        Mehrere Aufrufe innerhalb der Cooldown-Zeit werden zu einem
+        einzigen Backend-Durchlauf zusammengefasst.
+        """
+        configured = {p["plant_id"] for p in self.plants}
+        requested = configured.intersection(plant_ids)
+        if not requested:
+            return
+
+        self._pending_refresh.update(requested)
+        await self._refresh_debouncer.async_call()
+
+    async def _async_refresh_pending_plants(self) -> None:
+        """Aktualisiere alle gesammelten Pflanzen und verteile das Ergebnis."""
+        plant_ids, self._pending_refresh = self._pending_refresh, set()
+        if not plant_ids:
+            return
+
+        _LOGGER.debug("Gezielter Refresh für Pflanzen: %s", sorted(plant_ids))
+        with self.tracer.trace("plant_refresh", shard=self.shard, plants=len(plant_ids)):
+            refreshed, _ = await self._async_fetch_plants(sorted(plant_ids))
+            self._async_publish_plants(refreshed)
+
+    @callback
+    def async_handle_push(self, plant_id: str, plant_data: Dict[str, Any]) -> None:
+        """Übernimm einen per Stream gelieferten Messwert einer Pflanze."""
+        if plant_id not in {p["plant_id"] for p in self.plants}:
+            return
+
+        source_time = plant_data.get("last_update")
+        if isinstance(source_time, datetime):
+            watermark = self._watermarks.get(plant_id)
+            if watermark is not None and source_time <= watermark:
+                return
+            self._watermarks[plant_id] = source_time
+        self._fetched_at[plant_id] = time.monotonic()
+        self._async_publish_plants({plant_id: plant_data})
+
+    @callback
+    def async_set_streaming(self, streaming: bool) -> None:
+        """Wechsle zwischen Sicherheitsintervall (Stream) und Polling.
+
+        Beim Rückfall auf Polling wird sofort abgefragt, um Messwerte aus
+        der Zeit des Abbruchs nachzuholen.
+        """
+        if streaming:
+            self.update_interval = timedelta(seconds=STREAM_POLL_INTERVAL)
+            # Bereits geplante Abfrage auf das neue Intervall verschieben
+            if self._listeners:
+                self._schedule_refresh()
+            return
+        self.update_interval = scale_interval(
+            self.hass, shard_interval(self.config_entry.data, self.shard)
+        )
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_publish_plants(self, refreshed: Dict[str, Any]) -> None:
+        """Verteile neue Messwerte einzelner Pflanzen an die Entitäten."""
+        data = dict(self.data or {})
+        plants = dict(data.get("plants", {}))
+        self._serve_last_known_good(refreshed, plants, revalidate=False)
+        self._update_derived(refreshed)
+        self._changed = {}
+
+        plants.update(self._apply_publish_filter(refreshed))
+        self._async_update_status({plant_id: plants[plant_id] for plant_id in refreshed})
+        data["plants"] = plants
+        data["last_update"] = datetime.now().isoformat()
+        self.async_set_updated_data(data)
+
+    async def async_shutdown(self) -> None:
+        """Beende den Coordinator und verwerfe ausstehende Refreshes."""
+        await super().async_shutdown()
+        self._refresh_debouncer.async_shutdown()
+        self._scheduler.unregister(self._schedule_key)
+        self._pending_refresh.clear()
+        if self._unsub_held is not None:
+            self._unsub_held()
+            self._unsub_held = None
+        self.profiler = None
+        # Pflanzen des Eintrags verlassen die Kennzahlen aller Einträge
+        for plant_config in self.plants:
+            self._domain_fleet.discard(f"{self.config_entry.entry_id}:{plant_config['plant_id']}")
+
+    def set_plants(self, plants: List[Dict[str, Any]]) -> None:
+        """Setze die Pflanzen des Shards und was für sie abgefragt wird."""
+        self.plants = plants
+        # Verlauf für Prognose und gleitende Kennzahlen nur für Pflanzen,
+        # deren gewählte Sensoren ihn brauchen
+        self._forecast_plants: set[str] = set()
+        self._rolling_plants: set[str] = set()
+        # Von der API angeforderte Messwerte je Pflanze (None = alle)
+        self.plant_fields: Dict[str, Optional[FrozenSet[str]]] = {}
+        for plant_config in plants:
+            sensors = self.enabled_sensors(plant_config)
+            self.plant_fields[plant_config["plant_id"]] = (
+                None if sensors is None else _ALWAYS_FETCHED | (sensors & _FIELD_KEYS)
+            )
+            if sensors is None or "hours_until_critical" in sensors:
+                self._forecast_plants.add(plant_config["plant_id"])
+            if sensors is None or not sensors.isdisjoint(ROLLING_STATISTICS):
+                self._rolling_plants.add(plant_config["plant_id"])
+
+    def enabled_sensors(self, plant_config: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        """Gib die gewählten Sensoren einer Pflanze zurück (None = alle).
+
+        Ohne Auswahl legt der Full-Modus alle Sensoren an, der Lean-Modus
+        nur ``DEFAULT_LEAN_SENSORS``.
+        """
+        sensors = plant_config.get(CONF_SENSORS)
+        if sensors is None:
+            if self.entity_mode != ENTITY_MODE_LEAN:
+                return None
+            sensors = DEFAULT_LEAN_SENSORS
+        return frozenset(sensors)
+
+    def device_info(self, plant_id: str, plant_name: str) -> Dict[str, Any]:
+        """Gib die gemeinsame Geräte-Info einer Pflanze zurück.
+
+        Das Dictionary wird von allen Entitäten der Pflanze geteilt und
+        darf nicht verändert werden.
+        """
+        info = self._device_info.get(plant_id)
+        if info is None:
+            info = self._device_info[plant_id] = {
+                "identifiers": {(DOMAIN, plant_id)},
+                "name": plant_name,  # Standardname, kann über Device Registry UI geändert werden
+                "manufacturer": "PlantHub",
+                "model": "PlantHub Sensor",
+                "sw_version": "1.0.0",
+            }
+        return info
+
     def get_plant_data(self, plant_id: str) -> Optional[Dict[str, Any]]:
         """Hole Daten für eine spezifische Pflanze."""
         if not self.data or "plants" not in self.data:
@@ -203,6 +1123,12 @@ class PlantHubDataUpdateCoordinator(DataUpdateCoordinator):
 class BasePlantHubSensor(CoordinatorEntity, SensorEntity):
     """Basis-Klasse für alle PlantHub Sensoren."""
 
+    # Ändert sich bei jedem Poll und würde sonst in jeder Recorder-Zeile landen
+    _unrecorded_attributes = frozenset({"last_update", "age"})
+
+    # Messwerte, von denen der Zustand des Sensors abhängt
+    watched_metrics: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         coordinator: PlantHubDataUpdateCoordinator,
@@ -226,14 +1152,10 @@ class BasePlantHubSensor(CoordinatorEntity, SensorEntity):
         # Wichtig: has_entity_name=True für UI-Umbenennung
         self._attr_has_entity_name = True
         
-        # Verknüpfe mit Device Registry
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, plant_id)},
-            "name": plant_name,  # Standardname, kann über Device Registry UI geändert werden
-            "manufacturer": "PlantHub",
-            "model": "PlantHub Sensor",
-            "sw_version": "1.0.0",
-        }
+        # Verknüpfe mit Device Registry (Geräte-Info teilen alle Entitäten)
+        self._attr_device_info = coordinator.device_info(plant_id, plant_name)
+        self._last_available: Optional[bool] = None
+        self._last_stale: Optional[bool] = None
 
     @property
     def name(self) -> str | None:
@@ -251,20 +1173,51 @@ class BasePlantHubSensor(CoordinatorEntity, SensorEntity):
             and "plants" in self.coordinator.data
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Schreibe den Zustand nur, wenn sich ein relevanter Messwert geändert hat."""
+        available = self.available
+        stale = self.coordinator.is_stale(self.plant_id)
+        changed = self._state_changed()
+        if available == self._last_available and stale == self._last_stale and not changed:
+            return
+        self._last_available = available
+        self._last_stale = stale
+        super()._handle_coordinator_update()
+
+    def _state_changed(self) -> bool:
+        """Prüfe, ob sich ein Messwert des Sensors beim letzten Update geändert hat."""
+        return self.coordinator.has_changed(self.plant_id, self.watched_metrics)
+
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
         plant_data = self.coordinator.get_plant_data(self.plant_id)
         if not plant_data:
             return {}
+
+        age = self.coordinator.data_age(self.plant_id)
+        freshness = {
+            "age": None if age is None else round(age),
+            "stale": self.coordinator.is_stale(self.plant_id),
+        }
+
+        # Im Lean-Modus stehen plant_id und Name nur noch im Device Registry
+        if self.coordinator.attribute_mode == ATTRIBUTE_MODE_LEAN:
+            return {"last_update": plant_data.get("last_update"), **freshness}
             
         return {
             "plant_id": self.plant_id,
             "plant_name": self.plant_name,
             "last_update": plant_data.get("last_update"),
+            **freshness,
         }
 
 
+_SOIL_MOISTURE_ONLY = frozenset({"soil_moisture"})
+_ALL_CORE_FIELDS = frozenset(CORE_FIELDS)
+
+
 class PlantHubStatusSensor(BasePlantHubSensor):
     """Status-Sensor für PlantHub Pflanzen."""
 
@@ -276,6 +1229,11 @@ class PlantHubStatusSensor(BasePlantHubSensor):
     ) -> None:
         """Initialize the status sensor."""
         super().__init__(coordinator, plant_id, plant_name, "status")
+        if coordinator.attribute_mode == ATTRIBUTE_MODE_LEAN:
+            self.watched_metrics = _SOIL_MOISTURE_ONLY
+        else:
+            # Im Full-Modus stehen alle Messwerte in den Attributen
+            self.watched_metrics = _ALL_CORE_FIELDS
 
     @property
     def native_value(self) -> StateType:
@@ -283,22 +1241,18 @@ class PlantHubStatusSensor(BasePlantHubSensor):
         plant_data = self.coordinator.get_plant_data(self.plant_id)
         if not plant_data:
             return STATUS_UNKNOWN
-            
-        soil_moisture = plant_data.get("soil_moisture")
-        if soil_moisture is None:
-            return STATUS_UNKNOWN
-            
-        if soil_moisture <= SOIL_MOISTURE_CRITICAL_THRESHOLD:
-            return STATUS_CRITICAL
-        elif soil_moisture <= SOIL_MOISTURE_WARNING_THRESHOLD:
-            return STATUS_WARNING
-        else:
-            return STATUS_HEALTHY
+
+        # Bewertung mit Hysterese übernimmt der Coordinator
+        return self.coordinator.status_tracker.status(self.plant_id)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
         attrs = super().extra_state_attributes
+        if self.coordinator.attribute_mode == ATTRIBUTE_MODE_LEAN:
+            # Die Messwerte haben eigene Sensoren und werden nicht dupliziert
+            return attrs
+
         plant_data = self.coordinator.get_plant_data(self.plant_id)
         if plant_data:
             attrs.update({
@@ -313,6 +1267,8 @@ class PlantHubStatusSensor(BasePlantHubSensor):
 class PlantHubSoilMoistureSensor(BasePlantHubSensor):
     """Bodenfeuchtigkeit-Sensor für PlantHub Pflanzen."""
 
+    watched_metrics = frozenset({"soil_moisture"})
+
     def __init__(
         self,
         coordinator: PlantHubDataUpdateCoordinator,
@@ -334,6 +1290,8 @@ class PlantHubSoilMoistureSensor(BasePlantHubSensor):
 class PlantHubAirTemperatureSensor(BasePlantHubSensor):
     """Lufttemperatur-Sensor für PlantHub Pflanzen."""
 
+    watched_metrics = frozenset({"air_temperature"})
+
     def __init__(
         self,
         coordinator: PlantHubDataUpdateCoordinator,
@@ -355,6 +1313,8 @@ class PlantHubAirTemperatureSensor(BasePlantHubSensor):
 class PlantHubAirHumiditySensor(BasePlantHubSensor):
     """Luftfeuchtigkeit-Sensor für PlantHub Pflanzen."""
 
+    watched_metrics = frozenset({"air_humidity"})
+
     def __init__(
         self,
         coordinator: PlantHubDataUpdateCoordinator,
@@ -376,6 +1336,8 @@ class PlantHubAirHumiditySensor(BasePlantHubSensor):
 class PlantHubIlluminanceSensor(BasePlantHubSensor):
     """Helligkeit-Sensor für PlantHub Pflanzen."""
 
+    watched_metrics = frozenset({"illuminance"})
+
     def __init__(
         self,
         coordinator: PlantHubDataUpdateCoordinator,
@@ -394,6 +1356,90 @@ class PlantHubIlluminanceSensor(BasePlantHubSensor):
         return plant_data.get("illuminance")
 
 
+class PlantHubMetricSensor(BasePlantHubSensor):
+    """Generischer Sensor für Messwerte aus der Feldtabelle."""
+
+    def __init__(
+        self,
+        coordinator: PlantHubDataUpdateCoordinator,
+        plant_id: str,
+        plant_name: str,
+        metric: str,
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(coordinator, plant_id, plant_name, metric)
+        self.watched_metrics = frozenset({metric})
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the metric value."""
+        plant_data = self.coordinator.get_plant_data(self.plant_id)
+        if not plant_data:
+            return None
+        return plant_data.get(self.sensor_type)
+
+
+class DerivedPlantHubSensor(BasePlantHubSensor):
+    """Basis für Sensoren, die aus dem Verlauf abgeleitet werden.
+
+    Prognose und gleitende Kennzahlen ändern sich mit jedem Messwert im
+    Verlauf (auch mit vom Totband zurückgehaltenen) und beim Verdrängen
+    alter Werte. Sie schreiben ihren Zustand daher, wenn sich der
+    abgeleitete Wert selbst geändert hat.
+    """
+
+    _last_value: StateType = None
+
+    def _state_changed(self) -> bool:
+        """Vergleiche den abgeleiteten Wert mit dem zuletzt geschriebenen."""
+        value = self.native_value
+        if value == self._last_value:
+            return False
+        self._last_value = value
+        return True
+
+
+class PlantHubHoursUntilCriticalSensor(DerivedPlantHubSensor):
+    """Prognose-Sensor: Stunden bis zur kritischen Bodenfeuchtigkeit."""
+
+    def __init__(
+        self,
+        coordinator: PlantHubDataUpdateCoordinator,
+        plant_id: str,
+        plant_name: str,
+    ) -> None:
+        """Initialize the forecast sensor."""
+        super().__init__(coordinator, plant_id, plant_name, "hours_until_critical")
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the estimated hours until the soil is critically dry."""
+        return self.coordinator.forecaster.hours_until_critical(self.plant_id)
+
+
+class PlantHubRollingMoistureSensor(DerivedPlantHubSensor):
+    """Gleitende 24-h-Kennzahl der Bodenfeuchtigkeit aus dem Ringpuffer."""
+
+    def __init__(
+        self,
+        coordinator: PlantHubDataUpdateCoordinator,
+        plant_id: str,
+        plant_name: str,
+        sensor_type: str,
+    ) -> None:
+        """Initialize the rolling statistic sensor."""
+        super().__init__(coordinator, plant_id, plant_name, sensor_type)
+        self._statistic = ROLLING_STATISTICS[sensor_type]
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the rolling statistic without querying the recorder."""
+        window = self.coordinator.rolling.get(self.plant_id)
+        if window is None:
+            return None
+        return getattr(window, self._statistic)
+
+
 class PlantHubPlantIdSensor(BasePlantHubSensor):
     """Versteckte plant_id Entität für interne Zwecke."""
 
@@ -412,6 +1458,110 @@ class PlantHubPlantIdSensor(BasePlantHubSensor):
         return self.plant_id
 
 
+class PlantHubFleetSensor(SensorEntity):
+    """Kennzahl über die Pflanzen eines Eintrags bzw. aller Einträge.
+
+    Liest nur die gepflegten Werte der FleetAggregate und schreibt den
+    Zustand, wenn sich die Kennzahl nach einem Update geändert hat.
+    """
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        fleet: FleetAggregate,
+        sensor_type: str,
+        unique_id: str,
+        device_info: Dict[str, Any],
+    ) -> None:
+        """Initialize the fleet sensor."""
+        self.fleet = fleet
+        self.entity_description = FLEET_DESCRIPTIONS[sensor_type]
+        self._value = FLEET_VALUES[sensor_type]
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+        self._attr_native_value = self._value(fleet)
+        self._plants = fleet.plants
+
+    async def async_added_to_hass(self) -> None:
+        """Melde den Sensor für Updates aller Coordinatoren an."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_PLANTS_UPDATED, self._async_plants_updated)
+        )
+
+    @callback
+    def _async_plants_updated(self, coordinator: Optional[Any]) -> None:
+        """Schreibe den Zustand, wenn sich die Kennzahl geändert hat."""
+        value = self._value(self.fleet)
+        if value == self._attr_native_value and self.fleet.plants == self._plants:
+            return
+        self._attr_native_value = value
+        self._plants = self.fleet.plants
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the number of plants in the aggregate."""
+        return {"plants": self._plants}
+
+
+# Sensor-Schlüssel -> Konstruktor (coordinator, plant_id, plant_name), in
+# der Reihenfolge, in der die Entitäten angelegt werden
+SENSOR_FACTORIES = {
+    "status": PlantHubStatusSensor,
+    "soil_moisture": PlantHubSoilMoistureSensor,
+    "air_temperature": PlantHubAirTemperatureSensor,
+    "air_humidity": PlantHubAirHumiditySensor,
+    "illuminance": PlantHubIlluminanceSensor,
+    # Prognose: Zeit bis zur kritischen Bodenfeuchtigkeit
+    "hours_until_critical": PlantHubHoursUntilCriticalSensor,
+    # Gleitende 24-h-Kennzahlen der Bodenfeuchtigkeit
+    **{
+        key: functools.partial(PlantHubRollingMoistureSensor, sensor_type=key)
+        for key in ROLLING_STATISTICS
+    },
+}
+
+# Per Option wählbare Sensoren einer Pflanze
+SELECTABLE_SENSORS = (*SENSOR_FACTORIES, *EXTRA_METRICS)
+
+
+@callback
+def _async_remove_deselected_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinators: List[PlantHubDataUpdateCoordinator],
+) -> None:
+    """Entferne Registry-Einträge von Sensoren, die nicht mehr gewählt sind."""
+    from homeassistant.helpers import entity_registry as er
+
+    unwanted = set()
+    for coordinator in coordinators:
+        lean = coordinator.entity_mode == ENTITY_MODE_LEAN
+        for plant_config in coordinator.plants:
+            plant_id = plant_config["plant_id"]
+            sensors = coordinator.enabled_sensors(plant_config)
+            if sensors is not None:
+                unwanted.update(
+                    f"{plant_id}_{key}" for key in SELECTABLE_SENSORS if key not in sensors
+                )
+            if lean:
+                unwanted.add(f"{plant_id}_plant_id")
+
+    if not config_entry.data.get(CONF_FLEET_SENSORS, DEFAULT_FLEET_SENSORS):
+        unwanted.update(f"fleet_{config_entry.entry_id}_{key}" for key in FLEET_DESCRIPTIONS)
+
+    if not unwanted:
+        return
+
+    entity_registry = er.async_get(hass)
+    for entry in er.async_entries_for_config_entry(entity_registry, config_entry.entry_id):
+        if entry.domain == "sensor" and entry.unique_id in unwanted:
+            entity_registry.async_remove(entry.entity_id)
+            _LOGGER.debug("Abgewählte Entität entfernt: %s", entry.entity_id)
+
+
 async def _hide_plant_id_entities(hass: HomeAssistant, plant_ids: list) -> None:
     """Verstecke plant_id Entitäten im Entity Registry."""
     try:
@@ -0,0 +1,182 @@
+"""Services für PlantHub Integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Set
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    ATTR_END,
+    ATTR_PLANT_ID,
+    ATTR_REFRESHES,
+    ATTR_START,
+    DOMAIN,
+    PROFILE_MAX_REFRESHES,
+    SERVICE_IMPORT_STATISTICS,
+    SERVICE_PROFILE,
+    SERVICE_REFRESH,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TARGET_SCHEMA: Dict[Any, Any] = {
+    vol.Optional(ATTR_PLANT_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids,
+}
+
+REFRESH_SCHEMA = vol.Schema(TARGET_SCHEMA)
+
+IMPORT_STATISTICS_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Optional(ATTR_REFRESHES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_REFRESHES)
+        ),
+    }
+)
+
+
+def async_get_coordinators(hass: HomeAssistant) -> List[Any]:
+    """Gib alle geladenen PlantHub Coordinatoren zurück."""
+    coordinators = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if entry_data and entry_data.get("coordinators"):
+            coordinators.extend(entry_data["coordinators"])
+    return coordinators
+
+
+def _plant_id_from_device(device: dr.DeviceEntry | None) -> str | None:
+    """Lese die plant_id aus den Identifiers eines Geräts."""
+    if device is None:
+        return None
+    for identifier in device.identifiers:
+        if identifier[0] == DOMAIN:
+            return identifier[1]
+    return None
+
+
+def async_resolve_plant_ids(hass: HomeAssistant, data: Dict[str, Any]) -> Set[str]:
+    """Löse plant_id-, device_id- und entity_id-Ziele in plant_ids auf."""
+    plant_ids: Set[str] = set(data.get(ATTR_PLANT_ID, []))
+
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+
+    for device_id in data.get(ATTR_DEVICE_ID, []):
+        plant_id = _plant_id_from_device(device_registry.async_get(device_id))
+        if plant_id is None:
+            raise ServiceValidationError(f"Gerät {device_id} ist kein PlantHub Gerät")
+        plant_ids.add(plant_id)
+
+    for entity_id in data.get(ATTR_ENTITY_ID, []):
+        entity = entity_registry.async_get(entity_id)
+        if entity is None or entity.platform != DOMAIN or entity.device_id is None:
+            raise ServiceValidationError(f"Entität {entity_id} ist keine PlantHub Entität")
+        plant_id = _plant_id_from_device(device_registry.async_get(entity.device_id))
+        if plant_id is None:
+            raise ServiceValidationError(f"Entität {entity_id} ist keiner Pflanze zugeordnet")
+        plant_ids.add(plant_id)
+
+    return plant_ids
+
+
+def _async_coordinators_for(hass: HomeAssistant, plant_ids: Iterable[str]) -> List[Any]:
+    """Finde die Coordinatoren, die mindestens eine der Pflanzen verwalten."""
+    wanted = set(plant_ids)
+    return [
+        coordinator
+        for coordinator in async_get_coordinators(hass)
+        if wanted.intersection(p["plant_id"] for p in coordinator.plants)
+    ]
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Registriere die PlantHub Services."""
+
+    async def _async_handle_refresh(call: ServiceCall) -> None:
+        """Aktualisiere gezielt die angegebenen Pflanzen."""
+        plant_ids = async_resolve_plant_ids(hass, call.data)
+        if not plant_ids:
+            raise ServiceValidationError("Keine Pflanzen für den Refresh angegeben")
+
+        coordinators = _async_coordinators_for(hass, plant_ids)
+        if not coordinators:
+            raise ServiceValidationError(
+                f"Keine geladene PlantHub Integration verwaltet {sorted(plant_ids)}"
+            )
+
+        _LOGGER.debug("Refresh-Service für Pflanzen %s angefordert", sorted(plant_ids))
+        for coordinator in coordinators:
+            await coordinator.async_request_plant_refresh(plant_ids)
+
+    async def _async_handle_import_statistics(call: ServiceCall) -> None:
+        """Importiere die API-Historie als Langzeitstatistik."""
+        from .statistics import async_import_plant_statistics
+
+        plant_ids = async_resolve_plant_ids(hass, call.data)
+        if not plant_ids:
+            raise ServiceValidationError("Keine Pflanzen für den Import angegeben")
+
+        for coordinator in _async_coordinators_for(hass, plant_ids):
+            for plant_config in coordinator.plants:
+                plant_id = plant_config["plant_id"]
+                if plant_id not in plant_ids:
+                    continue
+                await async_import_plant_statistics(
+                    hass,
+                    coordinator,
+                    plant_id,
+                    call.data[ATTR_START],
+                    call.data.get(ATTR_END),
+                )
+
+    async def _async_handle_profile(call: ServiceCall) -> None:
+        """Profiliere die nächsten Refreshes der betroffenen Coordinatoren."""
+        plant_ids = async_resolve_plant_ids(hass, call.data)
+        # Ohne Ziel werden alle geladenen Integrationen profiliert
+        coordinators = (
+            _async_coordinators_for(hass, plant_ids)
+            if plant_ids
+            else async_get_coordinators(hass)
+        )
+        if not coordinators:
+            raise ServiceValidationError("Keine geladene PlantHub Integration gefunden")
+
+        for coordinator in coordinators:
+            coordinator.async_arm_profiler(call.data[ATTR_REFRESHES])
+
+    if not hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        hass.services.async_register(
+            DOMAIN, SERVICE_REFRESH, _async_handle_refresh, schema=REFRESH_SCHEMA
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_IMPORT_STATISTICS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_STATISTICS,
+            _async_handle_import_statistics,
+            schema=IMPORT_STATISTICS_SCHEMA,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        hass.services.async_register(
+            DOMAIN, SERVICE_PROFILE, _async_handle_profile, schema=PROFILE_SCHEMA
+        )
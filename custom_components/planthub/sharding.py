@@ -0,0 +1,131 @@
+"""Aufteilung der Pflanzen eines Eintrags auf mehrere Coordinatoren."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Mapping, Optional
+
+from .const import (
+    AUTO_SHARD_ALPHA,
+    AUTO_SHARD_FAILURE_RATE,
+    AUTO_SHARD_LATENCY,
+    AUTO_SHARD_MIN_SAMPLES,
+    CONF_AUTO_SHARDS,
+    CONF_SHARD,
+    CONF_SHARD_INTERVALS,
+    CONF_SHARDING,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SHARD,
+    DEFAULT_SHARDING,
+    SHARDING_AUTO,
+    SHARDING_GROUPS,
+    SLOW_SHARD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_shard_intervals(value: str | Mapping[str, Any] | None) -> Dict[str, int]:
+    """Wandle ``name=sekunden, ...`` in ein Dictionary um.
+
+    Wirft ValueError bei ungültigen Einträgen.
+    """
+    if not value:
+        return {}
+    if isinstance(value, Mapping):
+        items = list(value.items())
+    else:
+        items = []
+        for part in value.replace("\n", ",").split(","):
+            if not part.strip():
+                continue
+            name, separator, seconds = part.partition("=")
+            if not separator:
+                raise ValueError(f"Ungültiges Shard-Intervall: {part}")
+            items.append((name, seconds))
+
+    intervals: Dict[str, int] = {}
+    for name, seconds in items:
+        name = str(name).strip()
+        interval = int(str(seconds).strip())
+        if not name or interval <= 0:
+            raise ValueError(f"Ungültiges Shard-Intervall: {name}={seconds}")
+        intervals[name] = interval
+    return intervals
+
+
+def format_shard_intervals(intervals: Mapping[str, int]) -> str:
+    """Gegenstück zu ``parse_shard_intervals`` für Formular-Standardwerte."""
+    return ", ".join(f"{name}={seconds}" for name, seconds in intervals.items())
+
+
+def plant_shard(config: Mapping[str, Any], plant_config: Mapping[str, Any]) -> str:
+    """Gib den Shard einer Pflanze gemäß Konfiguration zurück."""
+    mode = config.get(CONF_SHARDING, DEFAULT_SHARDING)
+    if mode == SHARDING_GROUPS:
+        return plant_config.get(CONF_SHARD) or DEFAULT_SHARD
+    if mode == SHARDING_AUTO:
+        return config.get(CONF_AUTO_SHARDS, {}).get(plant_config["plant_id"], DEFAULT_SHARD)
+    return DEFAULT_SHARD
+
+
+def group_plants(config: Mapping[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Teile die konfigurierten Pflanzen in Shards auf.
+
+    Der Standard-Shard existiert immer, auch ohne Pflanzen, damit jeder
+    Eintrag mindestens einen Coordinator hat.
+    """
+    shards: Dict[str, List[Dict[str, Any]]] = {DEFAULT_SHARD: []}
+    for plant_config in config.get("plants", []):
+        shards.setdefault(plant_shard(config, plant_config), []).append(plant_config)
+    return shards
+
+
+def shard_interval(config: Mapping[str, Any], shard: str) -> timedelta:
+    """Gib das Abfrageintervall eines Shards zurück."""
+    scan_interval = config.get("scan_interval", DEFAULT_SCAN_INTERVAL)
+    if shard == DEFAULT_SHARD:
+        return timedelta(seconds=scan_interval)
+    intervals = config.get(CONF_SHARD_INTERVALS, {})
+    return timedelta(seconds=intervals.get(shard, scan_interval))
+
+
+class PlantHealth:
+    """Geglättete Antwortzeit und Fehlerquote einer Pflanze."""
+
+    __slots__ = ("latency", "failure_rate", "samples")
+
+    def __init__(self) -> None:
+        """Initialize the health state."""
+        self.latency = 0.0
+        self.failure_rate = 0.0
+        self.samples = 0
+
+    def record(self, latency: float, failed: bool) -> None:
+        """Erfasse das Ergebnis einer Abfrage."""
+        if self.samples == 0:
+            self.latency = latency
+            self.failure_rate = float(failed)
+        else:
+            self.latency += AUTO_SHARD_ALPHA * (latency - self.latency)
+            self.failure_rate += AUTO_SHARD_ALPHA * (float(failed) - self.failure_rate)
+        self.samples += 1
+
+    def desired_shard(self, current: str) -> Optional[str]:
+        """Gib den Ziel-Shard zurück, falls die Pflanze wechseln soll.
+
+        Mit Hysterese: in den langsamen Shard ab ``AUTO_SHARD_LATENCY``
+        bzw. ``AUTO_SHARD_FAILURE_RATE``, zurück erst unter der Hälfte.
+        """
+        if self.samples < AUTO_SHARD_MIN_SAMPLES:
+            return None
+        if current == SLOW_SHARD:
+            if (
+                self.latency < AUTO_SHARD_LATENCY / 2
+                and self.failure_rate < AUTO_SHARD_FAILURE_RATE / 2
+            ):
+                return DEFAULT_SHARD
+            return None
+        if self.latency >= AUTO_SHARD_LATENCY or self.failure_rate >= AUTO_SHARD_FAILURE_RATE:
+            return SLOW_SHARD
+        return None
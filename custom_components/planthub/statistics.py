@@ -0,0 +1,145 @@
+"""Import von Langzeitstatistiken für PlantHub Integration."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_import_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    STATISTICS_IMPORT_CHUNK_SIZE,
+)
+from .sensor import SENSOR_DESCRIPTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sensoren, für die Langzeitstatistiken importiert werden
+STATISTIC_SENSOR_KEYS = (
+    "soil_moisture",
+    "air_temperature",
+    "air_humidity",
+    "illuminance",
+)
+
+
+def _hourly_buckets(
+    readings: List[Dict[str, Any]], key: str
+) -> Dict[datetime, List[float]]:
+    """Gruppiere die Messwerte eines Sensors nach Stunden."""
+    buckets: Dict[datetime, List[float]] = {}
+    for reading in readings:
+        value = reading.get(key)
+        timestamp = reading.get("last_update")
+        if value is None or not isinstance(timestamp, datetime):
+            continue
+        hour = dt_util.as_utc(timestamp).replace(minute=0, second=0, microsecond=0)
+        buckets.setdefault(hour, []).append(value)
+    return buckets
+
+
+def _build_statistics(buckets: Dict[datetime, List[float]]) -> List[StatisticData]:
+    """Berechne Mittel-, Minimal- und Maximalwerte je Stunde."""
+    return [
+        StatisticData(
+            start=hour,
+            mean=sum(values) / len(values),
+            min=min(values),
+            max=max(values),
+        )
+        for hour, values in sorted(buckets.items())
+    ]
+
+
+def _build_metadata(entity_id: str, key: str) -> StatisticMetaData:
+    """Erstelle die Metadaten für die Statistik eines Sensors."""
+    metadata = StatisticMetaData(
+        has_mean=True,
+        has_sum=False,
+        name=None,
+        source="recorder",
+        statistic_id=entity_id,
+        unit_of_measurement=SENSOR_DESCRIPTIONS[key].native_unit_of_measurement,
+    )
+    try:
+        from homeassistant.components.recorder.models import StatisticMeanType
+    except ImportError:
+        return metadata
+    metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+    return metadata
+
+
+async def async_import_plant_statistics(
+    hass: HomeAssistant,
+    coordinator: Any,
+    plant_id: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> int:
+    """Importiere die API-Historie einer Pflanze als Langzeitstatistik.
+
+    Die Werte werden stundenweise verdichtet und gebündelt über die
+    Statistik-API des Recorders geschrieben. Es entstehen dabei keine
+    state_changed-Events und keine Zustandszeilen.
+
+    Gibt die Anzahl der importierten Statistikzeilen zurück.
+    """
+    from .webhook import PlantHubWebhook
+
+    start = dt_util.as_utc(start)
+    end = dt_util.as_utc(end or dt_util.utcnow())
+    if start >= end:
+        _LOGGER.warning("Ungültiger Zeitraum für Pflanze %s: %s - %s", plant_id, start, end)
+        return 0
+
+    async with PlantHubWebhook(
+        hass, coordinator.token, backends=coordinator.backends
+    ) as webhook:
+        readings = await webhook.fetch_plant_history(
+            plant_id, start, end, fields=coordinator.plant_fields.get(plant_id)
+        )
+
+    entity_registry = er.async_get(hass)
+    imported = 0
+
+    for key in STATISTIC_SENSOR_KEYS:
+        entity_id = entity_registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{plant_id}_{key}"
+        )
+        if entity_id is None:
+            _LOGGER.debug("Keine Entität für %s/%s, Statistik übersprungen", plant_id, key)
+            continue
+
+        # Die laufende Stunde wird vom Recorder selbst verdichtet
+        current_hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        statistics = [
+            row
+            for row in _build_statistics(_hourly_buckets(readings, key))
+            if row["start"] < current_hour
+        ]
+        if not statistics:
+            continue
+
+        metadata = _build_metadata(entity_id, key)
+        for offset in range(0, len(statistics), STATISTICS_IMPORT_CHUNK_SIZE):
+            async_import_statistics(
+                hass,
+                metadata,
+                statistics[offset:offset + STATISTICS_IMPORT_CHUNK_SIZE],
+            )
+
+        imported += len(statistics)
+        _LOGGER.debug("%d Statistikzeilen für %s importiert", len(statistics), entity_id)
+
+    _LOGGER.info(
+        "Langzeitstatistik für Pflanze %s importiert: %d Messwerte, %d Stundenwerte",
+        plant_id,
+        len(readings),
+        imported,
+    )
+    return imported
@@ -0,0 +1,99 @@
+"""Statusbewertung mit Hysterese für PlantHub Integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .const import (
+    SOIL_MOISTURE_CRITICAL_THRESHOLD,
+    SOIL_MOISTURE_WARNING_THRESHOLD,
+    STATUS_CRITICAL,
+    STATUS_HEALTHY,
+    STATUS_UNKNOWN,
+    STATUS_WARNING,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Schweregrad der Status, für die Richtung eines Wechsels
+_SEVERITY = {STATUS_HEALTHY: 0, STATUS_WARNING: 1, STATUS_CRITICAL: 2}
+
+
+def evaluate_status(
+    soil_moisture: Optional[float], previous: Optional[str], hysteresis: float
+) -> str:
+    """Bewerte die Bodenfeuchtigkeit unter Berücksichtigung des Vorzustands.
+
+    Verschlechterungen greifen sofort an den Schwellwerten. Eine
+    Verbesserung gilt erst, wenn der Schwellwert um ``hysteresis``
+    überschritten wird, damit Werte um eine Schwelle nicht hin und her
+    schalten.
+    """
+    if soil_moisture is None:
+        return STATUS_UNKNOWN
+
+    if soil_moisture <= SOIL_MOISTURE_CRITICAL_THRESHOLD:
+        plain = STATUS_CRITICAL
+    elif soil_moisture <= SOIL_MOISTURE_WARNING_THRESHOLD:
+        plain = STATUS_WARNING
+    else:
+        plain = STATUS_HEALTHY
+
+    if previous not in _SEVERITY or _SEVERITY[plain] >= _SEVERITY[previous]:
+        return plain
+
+    # Verbesserung: Schwellwerte um die Hysterese anheben
+    if soil_moisture <= SOIL_MOISTURE_CRITICAL_THRESHOLD + hysteresis:
+        return STATUS_CRITICAL
+    if soil_moisture <= SOIL_MOISTURE_WARNING_THRESHOLD + hysteresis:
+        return STATUS_WARNING
+    return STATUS_HEALTHY
+
+
+class StatusTracker:
+    """Hält den Status aller Pflanzen und meldet echte Wechsel.
+
+    Fehlt ein Messwert (z.B. nach einer fehlgeschlagenen Abfrage ohne
+    Cache), ist der Status ``unknown``. Der letzte bekannte Status bleibt
+    dabei erhalten: Der nächste Messwert wird mit Hysterese gegen ihn
+    bewertet, und ein Umweg über ``unknown`` gilt nicht als Wechsel.
+    """
+
+    def __init__(self, hysteresis: float) -> None:
+        """Initialize the tracker."""
+        self._hysteresis = hysteresis
+        self._status: Dict[str, str] = {}
+        # Letzter Status mit Schweregrad (ohne unknown)
+        self._known: Dict[str, str] = {}
+
+    def status(self, plant_id: str) -> str:
+        """Gib den aktuellen Status einer Pflanze zurück."""
+        return self._status.get(plant_id, STATUS_UNKNOWN)
+
+    def update(
+        self, plants_data: Dict[str, Optional[Dict[str, Any]]]
+    ) -> List[Tuple[str, str, str]]:
+        """Bewerte neue Daten und gib die Wechsel (plant_id, alt, neu) zurück.
+
+        Die erste Bewertung einer Pflanze gilt nicht als Wechsel, ebenso
+        wenig fehlende Messwerte.
+        """
+        transitions = []
+        for plant_id, plant_data in plants_data.items():
+            moisture = plant_data.get("soil_moisture") if plant_data else None
+            if moisture is None:
+                self._status[plant_id] = STATUS_UNKNOWN
+                continue
+            previous = self._known.get(plant_id)
+            status = evaluate_status(moisture, previous, self._hysteresis)
+            self._status[plant_id] = self._known[plant_id] = status
+            if previous is not None and status != previous:
+                transitions.append((plant_id, previous, status))
+        return transitions
+
+    def forget(self, plant_ids: Iterable[str]) -> None:
+        """Verwerfe den Status von Pflanzen, die nicht mehr konfiguriert sind."""
+        keep = set(plant_ids)
+        for plant_id in [p for p in self._status if p not in keep]:
+            del self._status[plant_id]
+            self._known.pop(plant_id, None)
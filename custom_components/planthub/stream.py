@@ -0,0 +1,133 @@
+"""Push-Updates per Server-Sent Events mit Rückfall auf Polling."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import STREAM_RECONNECT_MAX, STREAM_RECONNECT_MIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PlantHubStream:
+    """Hält eine SSE-Verbindung je Eintrag und verteilt Push-Updates.
+
+    Solange der Stream steht, fragen die Coordinatoren nur noch im
+    Sicherheitsintervall ab. Bricht er ab, kehren sie sofort zum normalen
+    Polling zurück, bis die Verbindung mit dem letzten Cursor wieder
+    aufgebaut ist. Meldet das Backend, dass der Cursor nicht mehr
+    fortgesetzt werden kann, wird einmal vollständig abgefragt.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, coordinators: List[Any]
+    ) -> None:
+        """Initialize the stream."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.coordinators = coordinators
+        self.cursor: Optional[str] = None
+        self.connected = False
+        self._task: Optional[asyncio.Task] = None
+        # plant_id -> Coordinator, der die Pflanze gerade abfragt
+        self._owners: Dict[str, Any] = {}
+        self.async_update_owners()
+        self.telemetry: Dict[str, Any] = {
+            "connects": 0,
+            "disconnects": 0,
+            "resets": 0,
+            "events": 0,
+            "last_event": None,
+            "last_error": None,
+        }
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Starte den Stream und gib die Abmelde-Funktion zurück."""
+        self._task = self.config_entry.async_create_background_task(
+            self.hass, self._async_run(), f"planthub_stream_{self.config_entry.entry_id}"
+        )
+
+        @callback
+        def _async_stop() -> None:
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+        return _async_stop
+
+    @callback
+    def async_update_owners(self) -> None:
+        """Ordne Push-Updates nach einem Shard-Wechsel den neuen Coordinatoren zu."""
+        self._owners = {p["plant_id"]: c for c in self.coordinators for p in c.plants}
+
+    async def _async_run(self) -> None:
+        """Baue den Stream auf und nach Abbrüchen mit Backoff erneut auf."""
+        from .webhook import PlantHubStreamReset, PlantHubWebhook
+
+        backoff = STREAM_RECONNECT_MIN
+        primary = self.coordinators[0]
+        plant_ids = [p["plant_id"] for c in self.coordinators for p in c.plants]
+        # Vereinigung der Messwerte aller Pflanzen (None = alle)
+        plant_fields = [self._owners[p].plant_fields.get(p) for p in plant_ids]
+        fields = None if None in plant_fields else frozenset().union(*plant_fields)
+
+        while True:
+            try:
+                async with PlantHubWebhook(
+                    self.hass, primary.token, backends=primary.backends
+                ) as webhook:
+                    async for cursor, plant_data in webhook.stream_plant_updates(
+                        plant_ids, self.cursor, on_open=self._async_connected, fields=fields
+                    ):
+                        backoff = STREAM_RECONNECT_MIN
+                        self.cursor = cursor
+                        self.telemetry["events"] += 1
+                        self.telemetry["last_event"] = datetime.now().isoformat()
+                        owner = self._owners.get(plant_data["plant_id"])
+                        if owner is not None:
+                            owner.async_handle_push(plant_data["plant_id"], plant_data)
+                    error = "Stream vom Backend beendet"
+            except PlantHubStreamReset as e:
+                # Die Lücke seit dem Cursor schließt der Refresh beim
+                # Rückfall auf Polling; danach ohne Cursor neu verbinden
+                self.telemetry["resets"] += 1
+                self.cursor = None
+                error = str(e)
+            except Exception as e:
+                error = str(e)
+
+            self.telemetry["last_error"] = error
+            self._async_disconnected(error)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, STREAM_RECONNECT_MAX)
+
+    @callback
+    def _async_connected(self) -> None:
+        """Schalte die Coordinatoren auf das Sicherheitsintervall um."""
+        self.telemetry["connects"] += 1
+        self.connected = True
+        _LOGGER.info("PlantHub Stream verbunden (Cursor %s)", self.cursor)
+        for coordinator in self.coordinators:
+            coordinator.async_set_streaming(True)
+
+    @callback
+    def _async_disconnected(self, error: str) -> None:
+        """Kehre zum normalen Polling zurück."""
+        if not self.connected:
+            _LOGGER.debug("PlantHub Stream nicht verfügbar: %s", error)
+            return
+        self.connected = False
+        self.telemetry["disconnects"] += 1
+        _LOGGER.warning("PlantHub Stream unterbrochen, wechsle auf Polling: %s", error)
+        for coordinator in self.coordinators:
+            coordinator.async_set_streaming(False)
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Gib den Zustand des Streams für die Diagnose zurück."""
+        return {"connected": self.connected, "cursor": self.cursor, **self.telemetry}
@@ -0,0 +1,133 @@
+"""Tracing einzelner Refreshes für PlantHub Integration."""
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, ContextManager, Deque, Dict, Iterator, List, Optional
+
+from .const import TRACE_BUFFER_SIZE
+
+# Gerade offener Span; neue Tasks (z.B. Hedge-Anfragen) erben ihn
+_CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar("planthub_span", default=None)
+
+# Gemeinsamer Kontextmanager außerhalb eines Traces
+_NULL_SPAN: ContextManager[None] = nullcontext()
+
+
+class Span:
+    """Ein Abschnitt eines Traces mit Start, Ende und Attributen."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start", "end", "attrs")
+
+    def __init__(
+        self, trace: Trace, parent_id: Optional[int], name: str, attrs: Dict[str, Any]
+    ) -> None:
+        """Initialize the span."""
+        self.trace = trace
+        self.span_id = len(trace.spans)
+        self.parent_id = parent_id
+        self.name = name
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attrs = attrs
+        trace.spans.append(self)
+
+
+class Trace:
+    """Alle Spans eines Refreshs."""
+
+    __slots__ = ("started_at", "spans")
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.started_at = datetime.now()
+        self.spans: List[Span] = []
+
+    def export(self) -> Dict[str, Any]:
+        """Gib den Trace als Wasserfall (flache Span-Liste) zurück.
+
+        ``offset_ms`` ist der Beginn relativ zum Root-Span, ``parent`` die
+        ``id`` des umschließenden Spans. Noch offene Spans (z.B. abgebrochene
+        Hedge-Anfragen) haben keine Dauer.
+        """
+        origin = self.spans[0].start
+        spans = []
+        for span in self.spans:
+            spans.append(
+                {
+                    "id": span.span_id,
+                    "parent": span.parent_id,
+                    "name": span.name,
+                    "offset_ms": round((span.start - origin) * 1000, 3),
+                    "duration_ms": None
+                    if span.end is None
+                    else round((span.end - span.start) * 1000, 3),
+                    **span.attrs,
+                }
+            )
+        return {
+            "started": self.started_at.isoformat(),
+            "duration_ms": spans[0]["duration_ms"],
+            "spans": spans,
+        }
+
+
+@contextmanager
+def _open_span(parent: Span, name: str, attrs: Dict[str, Any]) -> Iterator[None]:
+    """Öffne einen Kind-Span unter ``parent``."""
+    span = Span(parent.trace, parent.span_id, name, attrs)
+    token = _CURRENT_SPAN.set(span)
+    try:
+        yield
+    except BaseException as err:
+        span.attrs["error"] = type(err).__name__
+        raise
+    finally:
+        span.end = time.perf_counter()
+        _CURRENT_SPAN.reset(token)
+
+
+def span(name: str, **attrs: Any) -> ContextManager[None]:
+    """Miss einen Abschnitt im laufenden Trace (ohne Trace: no-op)."""
+    parent = _CURRENT_SPAN.get()
+    if parent is None:
+        return _NULL_SPAN
+    return _open_span(parent, name, attrs)
+
+
+def annotate(**attrs: Any) -> None:
+    """Ergänze Attribute des gerade offenen Spans."""
+    current = _CURRENT_SPAN.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+class RefreshTracer:
+    """Hält die letzten Traces eines Coordinators in einem Ringpuffer."""
+
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialize the tracer."""
+        self._traces: Deque[Trace] = deque(maxlen=size)
+
+    @contextmanager
+    def trace(self, name: str, **attrs: Any) -> Iterator[None]:
+        """Zeichne einen Refresh als neuen Trace mit Root-Span auf."""
+        trace = Trace()
+        root = Span(trace, None, name, attrs)
+        token = _CURRENT_SPAN.set(root)
+        try:
+            yield
+        except BaseException as err:
+            root.attrs["error"] = type(err).__name__
+            raise
+        finally:
+            root.end = time.perf_counter()
+            _CURRENT_SPAN.reset(token)
+            self._traces.append(trace)
+
+    def export(self) -> List[Dict[str, Any]]:
+        """Gib alle gepufferten Traces zurück, den neuesten zuletzt."""
+        return [trace.export() for trace in self._traces]
@@ -0,0 +1,277 @@
+"""Austauschbare HTTP-Transporte (aiohttp, Aufzeichnung, Wiedergabe)."""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Deque, Dict, List, Mapping, Optional, Protocol, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DATA_TRANSPORT,
+    DOMAIN,
+    TRANSPORT_MODE_RECORD,
+    TRANSPORT_MODE_REPLAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required("mode"): vol.In([TRANSPORT_MODE_RECORD, TRANSPORT_MODE_REPLAY]),
+        vol.Required("path"): cv.string,
+        vol.Optional("speed", default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+
+@dataclass
+class TransportResponse:
+    """Antwort eines Transports vor Statusprüfung und Dekodierung."""
+
+    status: int
+    body: bytes
+    headers: Mapping[str, str]
+
+
+class Transport(Protocol):
+    """Schnittstelle für das Senden eines Requests an die PlantHub API.
+
+    Netzwerkfehler werden als ``aiohttp.ClientError`` bzw.
+    ``asyncio.TimeoutError`` gemeldet; Statusprüfung und Dekodierung
+    übernimmt der Webhook.
+    """
+
+    async def post(self, url: str, body: Dict[str, Any]) -> TransportResponse:
+        """Send a POST request and return the raw response."""
+        ...
+
+
+class AiohttpTransport:
+    """Transport über eine aiohttp-Session."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Initialize the transport."""
+        self._session = session
+
+    async def post(self, url: str, body: Dict[str, Any]) -> TransportResponse:
+        """Send a POST request and return the raw response."""
+        async with self._session.post(url, json=body) as response:
+            return TransportResponse(
+                status=response.status,
+                body=await response.read(),
+                headers=dict(response.headers),
+            )
+
+
+def _request_key(url: str, body: Dict[str, Any]) -> Tuple[str, Any]:
+    """Schlüssel eines Requests unabhängig vom Backend-Host."""
+    return urlsplit(url).path, body.get("plant_id")
+
+
+class TrafficRecorder:
+    """Schreibt Requests und Antworten als JSONL-Datei mit.
+
+    Jede Zeile enthält den Zeitversatz seit Start der Aufzeichnung, Pfad,
+    Request-Body, Status, Antwort-Body und Antwortzeit. Netzwerkfehler
+    werden statt Status und Antwort mit ``error`` (Typ) und ``message``
+    aufgezeichnet.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._started = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def wrap(self, transport: Transport) -> Transport:
+        """Umschließe einen Transport, sodass sein Verkehr aufgezeichnet wird."""
+        return RecordingTransport(transport, self)
+
+    async def async_record(self, record: Dict[str, Any]) -> None:
+        """Hänge einen Eintrag an die Datei an."""
+        record["offset"] = round(time.monotonic() - self._started, 3)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        def _append() -> None:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line)
+
+        async with self._lock:
+            await asyncio.get_running_loop().run_in_executor(None, _append)
+
+
+class RecordingTransport:
+    """Leitet Requests weiter und zeichnet sie auf."""
+
+    def __init__(self, inner: Transport, recorder: TrafficRecorder) -> None:
+        """Initialize the transport."""
+        self._inner = inner
+        self._recorder = recorder
+
+    async def post(self, url: str, body: Dict[str, Any]) -> TransportResponse:
+        """Send a POST request through the inner transport and record it."""
+        started = time.monotonic()
+        path, _ = _request_key(url, body)
+        try:
+            response = await self._inner.post(url, body)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            await self._recorder.async_record(
+                {
+                    "path": path,
+                    "request": body,
+                    "error": type(err).__name__,
+                    "message": str(err),
+                    "latency": round(time.monotonic() - started, 4),
+                }
+            )
+            raise
+        await self._recorder.async_record(
+            {
+                "path": path,
+                "request": body,
+                "status": response.status,
+                "body": response.body.decode("utf-8", errors="replace"),
+                "latency": round(time.monotonic() - started, 4),
+            }
+        )
+        return response
+
+
+class ReplayTransport:
+    """Spielt aufgezeichneten Verkehr aus einer JSONL-Datei wieder ab.
+
+    Requests werden über Pfad und plant_id den Aufzeichnungen zugeordnet.
+    Die Wiedergabe folgt einer eigenen Uhr, die ``speed``-mal so schnell
+    läuft wie die Aufzeichnung: Beantwortet wird mit dem letzten Eintrag,
+    dessen ``offset`` erreicht ist; am Ende beginnt die Uhr von vorn. Die
+    Abfrageintervalle der Coordinatoren werden entsprechend verkürzt
+    (``scale_interval``), sodass eine Stunde Verkehr bei 10x in sechs
+    Minuten abläuft. Antwortzeiten werden ebenfalls durch ``speed``
+    geteilt. Mit ``speed`` 0 werden die Einträge je Schlüssel ohne
+    Wartezeit der Reihe nach beantwortet. Aufgezeichnete Netzwerkfehler
+    werden erneut geworfen.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        """Initialize the transport."""
+        self.path = path
+        self.speed = speed
+        self._records: Optional[Dict[Tuple[str, Any], List[Dict[str, Any]]]] = None
+        self._offsets: Dict[Tuple[str, Any], List[float]] = {}
+        self._period = 0.0
+        self._started: Optional[float] = None
+        self._queues: Dict[Tuple[str, Any], Deque[Dict[str, Any]]] = {}
+        self._load_lock = asyncio.Lock()
+
+    def wrap(self, transport: Transport) -> Transport:
+        """Ersetze den Transport durch die Wiedergabe."""
+        return self
+
+    def _load(self) -> Dict[Tuple[str, Any], List[Dict[str, Any]]]:
+        """Lies die Aufzeichnung ein."""
+        records: Dict[Tuple[str, Any], List[Dict[str, Any]]] = defaultdict(list)
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = (record["path"], record.get("request", {}).get("plant_id"))
+                records[key].append(record)
+        for key, items in records.items():
+            items.sort(key=lambda record: record.get("offset", 0.0))
+            self._offsets[key] = [record.get("offset", 0.0) for record in items]
+        # Die Schleife läuft nach dem letzten Eintrag noch einen mittleren
+        # Abstand weiter, damit auch dieser beantwortet wird
+        total = sum(len(items) for items in records.values())
+        duration = max((offsets[-1] for offsets in self._offsets.values()), default=0.0)
+        self._period = duration * total / (total - 1) if total > 1 else 0.0
+        _LOGGER.info(
+            "Wiedergabe geladen: %s (%d Einträge)",
+            self.path,
+            sum(len(items) for items in records.values()),
+        )
+        return dict(records)
+
+    def _select(self, key: Tuple[str, Any], recorded: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wähle den Eintrag, der zur aktuellen Wiedergabezeit passt."""
+        if self.speed <= 0:
+            queue = self._queues.get(key)
+            if not queue:
+                queue = self._queues[key] = deque(recorded)
+            return queue.popleft()
+
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+        position = (now - self._started) * self.speed
+        if self._period > 0:
+            position %= self._period
+        index = bisect.bisect_right(self._offsets[key], position) - 1
+        return recorded[max(index, 0)]
+
+    async def post(self, url: str, body: Dict[str, Any]) -> TransportResponse:
+        """Beantworte einen Request aus der Aufzeichnung."""
+        if self._records is None:
+            async with self._load_lock:
+                if self._records is None:
+                    self._records = await asyncio.get_running_loop().run_in_executor(
+                        None, self._load
+                    )
+
+        key = _request_key(url, body)
+        recorded = self._records.get(key)
+        if not recorded:
+            raise aiohttp.ClientError(f"Keine Aufzeichnung für {key[0]} ({key[1]})")
+
+        record = self._select(key, recorded)
+
+        if self.speed > 0:
+            await asyncio.sleep(record.get("latency", 0.0) / self.speed)
+        if "error" in record:
+            if record["error"] in ("TimeoutError", "ServerTimeoutError"):
+                raise asyncio.TimeoutError(record.get("message"))
+            raise aiohttp.ClientError(f"{record['error']}: {record.get('message', '')}")
+        return TransportResponse(
+            status=record["status"],
+            body=record["body"].encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+
+
+def scale_interval(hass: HomeAssistant, interval: timedelta) -> timedelta:
+    """Verkürze ein Abfrageintervall um die Geschwindigkeit der Wiedergabe."""
+    transport = hass.data.get(DOMAIN, {}).get(DATA_TRANSPORT)
+    if isinstance(transport, ReplayTransport) and transport.speed > 0:
+        return interval / transport.speed
+    return interval
+
+
+def async_setup_transport(hass: HomeAssistant, config: Mapping[str, Any]) -> None:
+    """Richte Aufzeichnung oder Wiedergabe aus der YAML-Konfiguration ein.
+
+    Wirft ``vol.Invalid`` bei ungültiger Konfiguration.
+    """
+    config = TRANSPORT_SCHEMA(dict(config))
+    path = hass.config.path(config["path"])
+    if config["mode"] == TRANSPORT_MODE_RECORD:
+        hass.data[DOMAIN][DATA_TRANSPORT] = TrafficRecorder(path)
+        _LOGGER.warning("PlantHub Verkehr wird aufgezeichnet: %s", path)
+    else:
+        hass.data[DOMAIN][DATA_TRANSPORT] = ReplayTransport(path, config["speed"])
+        _LOGGER.warning(
+            "PlantHub läuft im Wiedergabe-Modus: %s (Geschwindigkeit %sx)",
+            path,
+            config["speed"],
+        )
@@ -3,16 +3,35 @@ from __future__ import annotations
 
 import aiohttp
 import asyncio
+import json
 import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+)
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    DATA_TRANSPORT,
+    DOMAIN,
+    SINGLE_FLIGHT_FRESHNESS,
+    STREAM_IDLE_TIMEOUT,
     WEBHOOK_BASE_URL,
     WEBHOOK_ENDPOINT,
+    WEBHOOK_HISTORY_ENDPOINT,
+    WEBHOOK_STREAM_ENDPOINT,
     WEBHOOK_TIMEOUT,
     HTTP_OK,
     HTTP_UNAUTHORIZED,
@@ -20,17 +39,23 @@ from .const import (
     HTTP_NOT_FOUND,
     HTTP_TOO_MANY_REQUESTS,
     HTTP_INTERNAL_SERVER_ERROR,
-    MIN_SOIL_MOISTURE,
-    MAX_SOIL_MOISTURE,
-    MIN_AIR_HUMIDITY,
-    MAX_AIR_HUMIDITY,
-    MIN_AIR_TEMPERATURE,
-    MAX_AIR_TEMPERATURE,
-    MIN_ILLUMINANCE,
 )
+from .backends import BackendPool, HedgePolicy
+from .normalizer import PlantDataNormalizer
+from .profiler import RefreshProfiler, stage
+from .tracing import annotate, span
+from .transport import AiohttpTransport, ReplayTransport, Transport, TransportResponse
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:  # ältere aiohttp-Versionen
+    HAS_BROTLI = False
+
+# Brotli nur anbieten, wenn aiohttp es auch dekodieren kann
+ACCEPT_ENCODING = "br, gzip, deflate" if HAS_BROTLI else "gzip, deflate"
+
 
 class PlantHubWebhookError(HomeAssistantError):
     """Base exception for PlantHub webhook errors."""
@@ -52,16 +77,130 @@ class PlantHubDataError(PlantHubWebhookError):
     """Data validation or processing error."""
 
 
-class HttpClientProtocol(Protocol):
-    """Protocol for HTTP client operations."""
-    
-    async def get(self, url: str) -> aiohttp.ClientResponse:
-        """Make GET request."""
-        ...
-    
-    async def post(self, url: str, json: Dict[str, Any]) -> aiohttp.ClientResponse:
-        """Make POST request with JSON body."""
-        ...
+class PlantHubStreamReset(PlantHubWebhookError):
+    """The backend can no longer resume from the given cursor."""
+
+
+class _OwnerCancelled(Exception):
+    """Der Aufrufer, der den gemeinsamen Request ausführte, wurde abgebrochen."""
+
+
+class SingleFlight:
+    """Bündelt gleichzeitige Anfragen für dieselbe Pflanze zu einem Request.
+
+    Alle Aufrufer, die während eines laufenden Requests dieselbe plant_id
+    anfragen, erhalten dasselbe Ergebnis. Ein gerade eingetroffenes Ergebnis
+    wird zusätzlich für ``freshness`` Sekunden wiederverwendet. Wird der
+    ausführende Aufrufer abgebrochen (Frist, Entladen), ist das kein Fehler
+    des Requests: der erste Wartende fragt selbst erneut an.
+    """
+
+    def __init__(self, freshness: float = SINGLE_FLIGHT_FRESHNESS) -> None:
+        """Initialize the single-flight registry."""
+        self._freshness = freshness
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._recent: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
+    async def run(
+        self, key: str, factory: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Führe ``factory`` aus oder schließe dich einem laufenden Request an."""
+        recent = self._recent.get(key)
+        if recent is not None and time.monotonic() - recent[0] <= self._freshness:
+            _LOGGER.debug("Verwende frisches Ergebnis für %s wieder", key)
+            return dict(recent[1])
+
+        while (future := self._inflight.get(key)) is not None:
+            _LOGGER.debug("Schließe mich laufendem Request für %s an", key)
+            try:
+                with span("queue", key=key):
+                    return dict(await asyncio.shield(future))
+            except _OwnerCancelled:
+                _LOGGER.debug("Request für %s abgebrochen, frage erneut an", key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.set_exception(_OwnerCancelled(key))
+            future.exception()  # Als abgerufen markieren
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()  # Als abgerufen markieren
+            raise
+        else:
+            self._recent[key] = (time.monotonic(), result)
+            future.set_result(result)
+            return dict(result)
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, key: str) -> None:
+        """Verwerfe ein zwischengespeichertes Ergebnis."""
+        self._recent.pop(key, None)
+
+
+def parse_source_timestamp(raw_data: Dict[str, Any]) -> Optional[datetime]:
+    """Lese den Zeitstempel der Messung aus den rohen API-Daten.
+
+    Unterstützt ISO-8601-Strings und Unix-Zeitstempel. Zeitstempel ohne
+    Zeitzone werden in der Zeitzone von Home Assistant interpretiert.
+    """
+    value = raw_data.get("last_updated")
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return dt_util.utc_from_timestamp(value)
+    parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        _LOGGER.debug("Ungültiger Zeitstempel in API-Daten: %s", value)
+        return None
+    return dt_util.as_utc(parsed)
+
+
+async def _iter_sse_events(
+    content: aiohttp.StreamReader,
+) -> AsyncIterator[Tuple[Optional[str], str, str]]:
+    """Zerlege einen Server-Sent-Events-Stream in (id, event, data).
+
+    Kommentarzeilen (Keepalive) werden übersprungen. Die ID gilt wie im
+    SSE-Standard bis zur nächsten ``id:``-Zeile weiter.
+    """
+    event_id: Optional[str] = None
+    event_type = "message"
+    data_lines: List[str] = []
+    async for raw_line in content:
+        line = raw_line.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data_lines:
+                yield event_id, event_type, "\n".join(data_lines)
+            event_type = "message"
+            data_lines = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "id":
+            event_id = value
+        elif field == "event":
+            event_type = value
+        elif field == "data":
+            data_lines.append(value)
+
+
+def _get_single_flight(hass: HomeAssistant) -> SingleFlight:
+    """Hole die gemeinsame Single-Flight-Registry aus hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "single_flight" not in domain_data:
+        domain_data["single_flight"] = SingleFlight()
+    return domain_data["single_flight"]
+
+
+# Einmal kompiliert und von allen Webhook-Instanzen geteilt
+_NORMALIZER = PlantDataNormalizer()
 
 
 class PlantHubWebhook:
@@ -71,30 +210,46 @@ class PlantHubWebhook:
         self, 
         hass: HomeAssistant, 
         token: str,
-        http_client: Optional[HttpClientProtocol] = None,
+        transport: Optional[Transport] = None,
         base_url: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        backends: Optional[BackendPool] = None,
+        hedge: Optional[HedgePolicy] = None,
+        profiler: Optional[RefreshProfiler] = None,
     ) -> None:
         """Initialize the webhook handler."""
         self.hass = hass
         self.token = token
-        self._http_client = http_client
-        self._base_url = base_url or WEBHOOK_BASE_URL
+        self._transport = transport
+        self._backends = backends or BackendPool([base_url or WEBHOOK_BASE_URL])
+        self._hedge = hedge
+        self._profiler = profiler
         self._timeout = timeout or WEBHOOK_TIMEOUT
         self.session: Optional[aiohttp.ClientSession] = None
+        self._single_flight = _get_single_flight(hass)
         self._headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "User-Agent": "HomeAssistant/PlantHub/1.0.0",
         }
 
     async def __aenter__(self) -> PlantHubWebhook:
         """Async context manager entry."""
-        if self._http_client is None:
+        if self._transport is None:
+            # Aufzeichnung bzw. Wiedergabe aus der YAML-Konfiguration
+            configured = self.hass.data.get(DOMAIN, {}).get(DATA_TRANSPORT)
+            if isinstance(configured, ReplayTransport):
+                self._transport = configured
+                return self
+
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=self._timeout),
                 headers=self._headers,
             )
+            self._transport = AiohttpTransport(self.session)
+            if configured is not None:
+                self._transport = configured.wrap(self._transport)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -102,108 +257,321 @@ class PlantHubWebhook:
         if self.session:
             await self.session.close()
 
-    async def fetch_plant_data(self, plant_id: str) -> Dict[str, Any]:
-        """Hole Daten für eine spezifische Pflanze."""
-        if not self.session and self._http_client is None:
+    async def fetch_plant_data(
+        self,
+        plant_id: str,
+        since: Optional[datetime] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Hole Daten für eine spezifische Pflanze.
+
+        Gleichzeitige Aufrufe für dieselbe Pflanze (z.B. geplanter Refresh,
+        manueller Refresh und Config-Flow-Prüfung) teilen sich einen Request,
+        sofern sie dieselben Messwerte ``fields`` anfordern (None = alle).
+
+        Ist ``since`` gesetzt und der Messwert laut Quell-Zeitstempel nicht
+        neuer, wird er vor Normalisierung und Validierung verworfen und
+        None zurückgegeben.
+        """
+        if self._transport is None:
             raise PlantHubConnectionError("Webhook-Session nicht initialisiert")
 
-        # URL ohne plant_id - plant_id wird im Body übertragen
-        url = f"{self._base_url}{WEBHOOK_ENDPOINT}"
-        
-        # Request-Body mit plant_id
+        key = plant_id if fields is None else f"{plant_id}:{','.join(sorted(fields))}"
+        plant_data = await self._single_flight.run(
+            key, lambda: self._request_plant_payload(plant_id, fields)
+        )
+
+        source_time = parse_source_timestamp(plant_data)
+        if since is not None and source_time is not None and source_time <= since:
+            _LOGGER.debug(
+                "Kein neuer Messwert für Pflanze %s (Quelle: %s, bekannt: %s)",
+                plant_id,
+                source_time,
+                since,
+            )
+            return None
+
+        with stage(self._profiler, "normalize"), span("normalize"):
+            return self._normalize_plant_data(plant_data, plant_id, source_time)
+
+    async def _request_plant_payload(
+        self, plant_id: str, fields: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, Any]:
+        """Sende den POST-Request und gib die rohen Pflanzendaten zurück."""
+        # plant_id wird im Body übertragen
+        # Nur die Felder anfordern, die die gewählten Sensoren auswerten
         request_body = {
-            "plant_id": plant_id
+            "plant_id": plant_id,
+            "fields": list(_NORMALIZER.projection_for(fields)),
         }
         
         # Detailliertes Logging vor dem Request
         _LOGGER.debug("=== PLANT HUB API REQUEST DEBUG ===")
         _LOGGER.debug("Plant ID: %s", plant_id)
-        _LOGGER.debug("Base URL: %s", self._base_url)
+        _LOGGER.debug("Backends: %s", self._backends.urls)
         _LOGGER.debug("Webhook Endpoint: %s", WEBHOOK_ENDPOINT)
-        _LOGGER.debug("Final URL: %s", url)
         _LOGGER.debug("Request Body: %s", request_body)
         _LOGGER.debug("API Token: %s...", self.token[:10] + "..." if len(self.token) > 10 else "***")
         _LOGGER.debug("Headers: %s", {k: v for k, v in self._headers.items() if k != "Authorization"})
-        _LOGGER.debug("Authorization: Bearer %s...", self.token[:10] + "..." if len(self.token) > 10 else "***")
         _LOGGER.debug("Timeout: %d Sekunden", self._timeout)
         _LOGGER.debug("==================================")
+
+        data = await self._post_hedged(WEBHOOK_ENDPOINT, request_body, plant_id)
+        _LOGGER.debug("API-Antwort für Pflanze %s: %s", plant_id, data)
         
+        # Extrahiere das erste Element aus der Liste, falls es eine Liste ist
+        if isinstance(data, list) and len(data) > 0:
+            plant_data = data[0]
+            _LOGGER.debug("Extrahiertes Pflanzendaten aus Liste: %s", plant_data)
+        elif isinstance(data, dict):
+            plant_data = data
+            _LOGGER.debug("Pflanzendaten als Dictionary: %s", plant_data)
+        else:
+            _LOGGER.error("Unerwartetes Datenformat: %s (Typ: %s)", data, type(data))
+            raise PlantHubWebhookError(f"Unerwartetes Datenformat: {type(data)}")
+        
+        return plant_data
+
+    async def _post_hedged(
+        self, endpoint: str, request_body: Dict[str, Any], context: str
+    ) -> Any:
+        """Sende einen POST-Request, bei Verzögerung zusätzlich ein Duplikat.
+
+        Kommt bis zur adaptiven p95-Frist keine Antwort, wird die Anfrage
+        ein zweites Mal gesendet (sofern das Hedge-Budget reicht). Die erste
+        erfolgreiche Antwort gewinnt, die andere Anfrage wird abgebrochen.
+        """
+        hedge = self._hedge
+        if hedge is None:
+            return await self._post(endpoint, request_body, context)
+
+        hedge.note_request()
+        delay = hedge.delay()
+        if delay is None:
+            return await self._post(endpoint, request_body, context)
+
+        primary = asyncio.ensure_future(self._post(endpoint, request_body, context))
+        # Wird der Aufruf abgebrochen oder endet er mit einem Fehler, dürfen
+        # keine Anfragen im Hintergrund weiterlaufen
+        pending = {primary}
         try:
-            _LOGGER.debug("Rufe PlantHub API für Pflanze %s auf: %s mit Body: %s", plant_id, url, request_body)
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not hedge.try_acquire():
+                return await primary
+
+            _LOGGER.debug("Keine Antwort für %s nach %.2f s, sende Hedge-Anfrage", context, delay)
+            annotate(hedged=True, hedge_delay_ms=round(delay * 1000, 3))
+            secondary = asyncio.ensure_future(self._post(endpoint, request_body, context))
+            pending = {primary, secondary}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (error := task.exception()) is None:
+                        if task is secondary:
+                            hedge.hedge_wins += 1
+                        return task.result()
+            raise error
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+
+    async def _post(self, endpoint: str, request_body: Dict[str, Any], context: str) -> Any:
+        """Sende einen POST-Request mit Failover über alle Backends.
+
+        Verbindungsfehler, Timeouts, Server-Fehler und Rate Limits führen
+        sofort zum nächsten Backend. Authentifizierungs- und Datenfehler
+        werden direkt weitergereicht, da ein anderes Backend sie nicht löst.
+        """
+        tried: List[str] = []
+        last_error: Optional[PlantHubWebhookError] = None
+
+        while (backend := self._backends.select(exclude=tried)) is not None:
+            tried.append(backend.url)
+            started = time.monotonic()
+            backend.inflight += 1
+            try:
+                with span("request", backend=backend.url, attempt=len(tried)):
+                    data = await self._post_once(
+                        f"{backend.url}{endpoint}", request_body, context
+                    )
+            except PlantHubRateLimitError as e:
+                last_error = e
+                continue
+            except PlantHubConnectionError as e:
+                self._backends.record_failure(backend)
+                last_error = e
+                if len(tried) < len(self._backends.backends):
+                    _LOGGER.warning("Backend %s fehlgeschlagen, wechsle Backend: %s", backend.url, e)
+                continue
+            finally:
+                backend.inflight -= 1
+
+            latency = time.monotonic() - started
+            self._backends.record_success(backend, latency)
+            if self._hedge is not None:
+                self._hedge.record(latency)
+            return data
+
+        raise last_error or PlantHubConnectionError("Kein PlantHub Backend verfügbar")
+
+    async def _post_once(self, url: str, request_body: Dict[str, Any], context: str) -> Any:
+        """Sende einen POST-Request an genau ein Backend."""
+        try:
+            _LOGGER.debug("Rufe PlantHub API für %s auf: %s mit Body: %s", context, url, request_body)
             
-            if self._http_client:
-                # Für Mock-Tests - POST mit Body
-                response = await self._http_client.post(url, json=request_body)
-                # Mock-Response verarbeiten
-                data = response.json() if hasattr(response, 'json') else response
-                _LOGGER.debug("Mock-API-Antwort für Pflanze %s: %s", plant_id, data)
-                
-                # Extrahiere das erste Element aus der Liste, falls es eine Liste ist
-                if isinstance(data, list) and len(data) > 0:
-                    plant_data = data[0]
-                    _LOGGER.debug("Extrahiertes Pflanzendaten aus Liste: %s", plant_data)
-                elif isinstance(data, dict):
-                    plant_data = data
-                    _LOGGER.debug("Pflanzendaten als Dictionary: %s", plant_data)
-                else:
-                    _LOGGER.error("Unerwartetes Datenformat: %s (Typ: %s)", data, type(data))
-                    raise PlantHubWebhookError(f"Unerwartetes Datenformat: {type(data)}")
-                
-                normalized_data = self._normalize_plant_data(plant_data, plant_id)
-                return normalized_data
-            else:
-                # POST-Request mit plant_id im Body
-                async with self.session.post(url, json=request_body) as response:
-                    # Response-Logging
-                    _LOGGER.debug("=== PLANT HUB API RESPONSE DEBUG ===")
-                    _LOGGER.debug("Plant ID: %s", plant_id)
-                    _LOGGER.debug("HTTP Status: %d", response.status)
-                    _LOGGER.debug("Response Headers: %s", dict(response.headers))
-                    _LOGGER.debug("=====================================")
-                    
-                    await self._handle_response_status(response, plant_id)
-                    data = await response.json()
-                    _LOGGER.debug("API-Antwort für Pflanze %s: %s", plant_id, data)
-                    
-                    # Extrahiere das erste Element aus der Liste, falls es eine Liste ist
-                    if isinstance(data, list) and len(data) > 0:
-                        plant_data = data[0]
-                        _LOGGER.debug("Extrahiertes Pflanzendaten aus Liste: %s", plant_data)
-                    elif isinstance(data, dict):
-                        plant_data = data
-                        _LOGGER.debug("Pflanzendaten als Dictionary: %s", plant_data)
-                    else:
-                        _LOGGER.error("Unerwartetes Datenformat: %s (Typ: %s)", data, type(data))
-                        raise PlantHubWebhookError(f"Unerwartetes Datenformat: {type(data)}")
-                    
-                    normalized_data = self._normalize_plant_data(plant_data, plant_id)
-                    return normalized_data
+            with stage(self._profiler, "network"), span("network"):
+                response = await self._transport.post(url, request_body)
+            annotate(status=response.status, bytes=len(response.body))
+
+            # Response-Logging
+            _LOGGER.debug("=== PLANT HUB API RESPONSE DEBUG ===")
+            _LOGGER.debug("Context: %s", context)
+            _LOGGER.debug("HTTP Status: %d", response.status)
+            _LOGGER.debug("Response Headers: %s", dict(response.headers))
+            _LOGGER.debug("=====================================")
+            
+            await self._handle_response_status(response, context)
+
+            with stage(self._profiler, "decode"), span("decode"):
+                return json.loads(response.body)
                 
+        except PlantHubWebhookError:
+            raise
+
         except asyncio.TimeoutError:
             _LOGGER.error("=== PLANT HUB API TIMEOUT ERROR ===")
-            _LOGGER.error("Plant ID: %s", plant_id)
+            _LOGGER.error("Context: %s", context)
             _LOGGER.error("URL: %s", url)
             _LOGGER.error("Timeout nach %d Sekunden", self._timeout)
             _LOGGER.error("=====================================")
-            raise PlantHubConnectionError(f"Timeout für Pflanze {plant_id} nach {self._timeout} Sekunden")
+            raise PlantHubConnectionError(f"Timeout für {context} nach {self._timeout} Sekunden")
             
         except aiohttp.ClientError as e:
             _LOGGER.error("=== PLANT HUB API CLIENT ERROR ===")
-            _LOGGER.error("Plant ID: %s", plant_id)
+            _LOGGER.error("Context: %s", context)
             _LOGGER.error("URL: %s", url)
             _LOGGER.error("Client Error: %s", e)
             _LOGGER.error("===================================")
-            raise PlantHubConnectionError(f"Verbindungsfehler für Pflanze {plant_id}: {e}")
+            raise PlantHubConnectionError(f"Verbindungsfehler für {context}: {e}")
             
         except Exception as e:
             _LOGGER.error("=== PLANT HUB API UNEXPECTED ERROR ===")
-            _LOGGER.error("Plant ID: %s", plant_id)
+            _LOGGER.error("Context: %s", context)
             _LOGGER.error("URL: %s", url)
             _LOGGER.error("Unexpected Error: %s", e)
             _LOGGER.error("======================================")
-            raise PlantHubWebhookError(f"Unerwarteter Fehler für Pflanze {plant_id}: {e}")
+            raise PlantHubWebhookError(f"Unerwarteter Fehler für {context}: {e}")
+
+    async def stream_plant_updates(
+        self,
+        plant_ids: List[str],
+        cursor: Optional[str] = None,
+        on_open: Optional[Callable[[], None]] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> AsyncIterator[Tuple[Optional[str], Dict[str, Any]]]:
+        """Abonniere Push-Updates der Pflanzen per Server-Sent Events.
+
+        Liefert (cursor, normalisierte Pflanzendaten) je Messwert, bis die
+        Verbindung endet. Mit ``cursor`` setzt das Backend nach dem zuletzt
+        gesehenen Ereignis fort; kann es das nicht mehr, wird
+        ``PlantHubStreamReset`` geworfen. ``on_open`` wird aufgerufen,
+        sobald das Backend den Stream angenommen hat.
+        """
+        if self.session is None:
+            # Die Wiedergabe kennt nur einzelne Requests
+            raise PlantHubConnectionError("Streaming ohne HTTP-Session nicht verfügbar")
+
+        backend = self._backends.select()
+        if backend is None:
+            raise PlantHubConnectionError("Kein PlantHub Backend verfügbar")
+
+        url = f"{backend.url}{WEBHOOK_STREAM_ENDPOINT}"
+        params = {
+            "plants": ",".join(plant_ids),
+            "fields": ",".join(_NORMALIZER.projection_for(fields)),
+        }
+        headers = {"Accept": "text/event-stream"}
+        if cursor is not None:
+            headers["Last-Event-ID"] = cursor
+        _LOGGER.debug("Öffne PlantHub Stream %s für %d Pflanzen (Cursor %s)", url, len(plant_ids), cursor)
 
-    async def _handle_response_status(self, response: aiohttp.ClientResponse, context: str) -> None:
+        try:
+            async with self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=STREAM_IDLE_TIMEOUT),
+            ) as response:
+                await self._handle_response_status(
+                    TransportResponse(response.status, b"", dict(response.headers)), url
+                )
+                if on_open is not None:
+                    on_open()
+
+                async for event_id, event_type, data in _iter_sse_events(response.content):
+                    if event_type == "reset":
+                        raise PlantHubStreamReset(f"Cursor {cursor} nicht mehr verfügbar")
+                    if event_type != "reading":
+                        continue
+                    try:
+                        raw_data = json.loads(data)
+                        plant_id = raw_data["plant_id"]
+                    except (ValueError, TypeError, KeyError) as e:
+                        _LOGGER.warning("Ungültiges Stream-Ereignis %s: %s", event_id, e)
+                        continue
+                    cursor = event_id
+                    yield event_id, self._normalize_plant_data(raw_data, plant_id)
+        except asyncio.TimeoutError:
+            self._backends.record_failure(backend)
+            raise PlantHubConnectionError(
+                f"Keine Daten im Stream seit {STREAM_IDLE_TIMEOUT} Sekunden"
+            )
+        except aiohttp.ClientError as e:
+            self._backends.record_failure(backend)
+            raise PlantHubConnectionError(f"Stream-Verbindung unterbrochen: {e}")
+
+    async def fetch_plant_history(
+        self,
+        plant_id: str,
+        start: datetime,
+        end: datetime,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Hole alle Messwerte einer Pflanze in einem Zeitraum.
+
+        Messwerte ohne Zeitstempel werden verworfen, da sie sich keinem
+        Zeitpunkt der Historie zuordnen lassen.
+        """
+        if self._transport is None:
+            raise PlantHubConnectionError("Webhook-Session nicht initialisiert")
+
+        request_body = {
+            "plant_id": plant_id,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "fields": list(_NORMALIZER.projection_for(fields)),
+        }
+        _LOGGER.debug("Rufe Historie für Pflanze %s ab mit Body: %s", plant_id, request_body)
+
+        data = await self._post(WEBHOOK_HISTORY_ENDPOINT, request_body, plant_id)
+
+        if isinstance(data, dict):
+            data = data.get("readings", [])
+        if not isinstance(data, list):
+            raise PlantHubDataError(f"Unerwartetes Datenformat der Historie: {type(data)}")
+
+        readings = []
+        for raw_reading in data:
+            if not isinstance(raw_reading, dict) or not raw_reading.get("last_updated"):
+                continue
+            readings.append(self._normalize_plant_data(raw_reading, plant_id))
+
+        _LOGGER.debug("Historie für Pflanze %s: %d Messwerte", plant_id, len(readings))
+        return readings
+
+    async def _handle_response_status(self, response: TransportResponse, context: str) -> None:
         """Behandle HTTP-Status-Codes und werfe entsprechende Exceptions."""
         if response.status == HTTP_OK:
             return
@@ -232,96 +600,31 @@ class PlantHubWebhook:
             _LOGGER.error("Unerwarteter HTTP-Status für %s: %d", context, response.status)
             raise PlantHubWebhookError(f"Unerwarteter HTTP-Status: {response.status}")
 
-    def _normalize_plant_data(self, raw_data: Dict[str, Any], plant_id: str) -> Dict[str, Any]:
-        """Normalisiere die rohen API-Daten in das erwartete Format."""
-        try:
-            # Extrahiere und normalisiere die Daten
-            normalized_data = {
-                "plant_id": plant_id,
-                "plant_name": raw_data.get("name", plant_id),
-                "soil_moisture": self._extract_numeric_value(raw_data, "soil_moisture", "moisture"),
-                "air_temperature": self._extract_numeric_value(raw_data, "air_temperature", "temperature"),
-                "air_humidity": self._extract_numeric_value(raw_data, "air_humidity", "humidity"),
-                "illuminance": self._extract_numeric_value(raw_data, "light", "illuminance"),
-                "last_update": raw_data.get("last_updated", datetime.now().isoformat()),
-            }
-            
-            # Validiere die Daten
-            self._validate_plant_data(normalized_data)
-            
-            return normalized_data
-            
-        except Exception as e:
-            _LOGGER.error("Fehler beim Normalisieren der Daten für Pflanze %s: %s", plant_id, e)
-            # Fallback-Daten zurückgeben
-            return self._get_fallback_data(plant_id)
-
-    def _extract_numeric_value(self, data: Dict[str, Any], *keys: str) -> Optional[float]:
-        """Extrahiere einen numerischen Wert aus verschiedenen möglichen Schlüsseln."""
-        for key in keys:
-            value = data.get(key)
-            if value is not None:
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    continue
-        return None
+    def _normalize_plant_data(
+        self,
+        raw_data: Dict[str, Any],
+        plant_id: str,
+        source_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Normalisiere die rohen API-Daten in das erwartete Format.
 
-    def _validate_plant_data(self, data: Dict[str, Any]) -> None:
-        """Validiere die normalisierten Pflanzendaten."""
-        # Überprüfe ob alle erforderlichen Felder vorhanden sind
-        required_fields = ["plant_id", "plant_name"]
-        for field in required_fields:
-            if not data.get(field):
-                _LOGGER.warning("Erforderliches Feld fehlt: %s", field)
-        
-        # Überprüfe numerische Werte auf Plausibilität
-        self._validate_numeric_range(
-            data.get("soil_moisture"), 
-            "Bodenfeuchtigkeit", 
-            MIN_SOIL_MOISTURE, 
-            MAX_SOIL_MOISTURE
-        )
-        
-        self._validate_numeric_range(
-            data.get("air_humidity"), 
-            "Luftfeuchtigkeit", 
-            MIN_AIR_HUMIDITY, 
-            MAX_AIR_HUMIDITY
-        )
-        
-        self._validate_numeric_range(
-            data.get("air_temperature"), 
-            "Lufttemperatur", 
-            MIN_AIR_TEMPERATURE, 
-            MAX_AIR_TEMPERATURE
-        )
-        
-        if data.get("illuminance") is not None and data["illuminance"] < MIN_ILLUMINANCE:
-            _LOGGER.warning("Helligkeit negativ: %s", data["illuminance"])
+        ``last_update`` ist der Zeitpunkt der Messung laut Quelle oder None,
+        wenn die API keinen Zeitstempel liefert. Ungültige Felder werden
+        einzeln verworfen, gültige Felder bleiben erhalten.
+        """
+        if not isinstance(raw_data, dict):
+            _LOGGER.error("Ungültige Daten für Pflanze %s: %r", plant_id, raw_data)
+            return self._get_fallback_data(plant_id)
 
-    def _validate_numeric_range(
-        self, 
-        value: Optional[float], 
-        field_name: str, 
-        min_val: float, 
-        max_val: float
-    ) -> None:
-        """Validiere einen numerischen Wert auf einen Bereich."""
-        if value is not None and not min_val <= value <= max_val:
-            _LOGGER.warning(
-                "%s außerhalb des gültigen Bereichs [%s, %s]: %s", 
-                field_name, min_val, max_val, value
-            )
+        if source_time is None:
+            source_time = parse_source_timestamp(raw_data)
+        return _NORMALIZER.normalize(raw_data, plant_id, source_time)
 
     def _get_fallback_data(self, plant_id: str) -> Dict[str, Any]:
         """Fallback-Daten bei Fehlern."""
         return {
             "plant_id": plant_id,
             "plant_name": plant_id,
-            "soil_moisture": None,
-            "air_temperature": None,
-            "air_humidity": None,
-            "illuminance": None,
-            "last_update": datetime.now().isoformat(),
+            **{spec.key: None for spec in _NORMALIZER.fields},
+            "last_update": None,
         }
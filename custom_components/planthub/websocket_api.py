@@ -0,0 +1,194 @@
+"""WebSocket-Befehle für kompakte Pflanzen-Übersichten (Dashboards)."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import SIGNAL_PLANTS_UPDATED
+from .normalizer import FIELD_TABLE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Spalten des Snapshots; Deltas verwenden dieselben Namen
+SNAPSHOT_COLUMNS: Tuple[str, ...] = (
+    "plant_id",
+    "name",
+    "entry_id",
+    "status",
+    *(spec.key for spec in FIELD_TABLE),
+    "hours_until_critical",
+    "stale",
+    "last_update",
+)
+
+Row = Tuple[Any, ...]
+# Pflanzen werden je Eintrag geführt, die plant_id allein ist nicht eindeutig
+RowKey = Tuple[str, str]
+
+_NAME_INDEX = SNAPSHOT_COLUMNS.index("name")
+
+
+def _plant_row(coordinator: Any, plant_config: Dict[str, Any]) -> Row:
+    """Erstelle die Zeile einer Pflanze in Spaltenreihenfolge."""
+    plant_id = plant_config["plant_id"]
+    plant_data = coordinator.get_plant_data(plant_id) or {}
+    last_update = plant_data.get("last_update")
+    if isinstance(last_update, datetime):
+        last_update = last_update.isoformat()
+    return (
+        plant_id,
+        plant_config["name"],
+        coordinator.config_entry.entry_id,
+        coordinator.status_tracker.status(plant_id),
+        *(plant_data.get(spec.key) for spec in FIELD_TABLE),
+        coordinator.forecaster.hours_until_critical(plant_id),
+        coordinator.is_stale(plant_id),
+        last_update,
+    )
+
+
+def _coordinator_rows(coordinators: List[Any]) -> Dict[RowKey, Row]:
+    """Erstelle die Zeilen aller Pflanzen der Coordinatoren."""
+    return {
+        (coordinator.config_entry.entry_id, plant_config["plant_id"]): _plant_row(
+            coordinator, plant_config
+        )
+        for coordinator in coordinators
+        for plant_config in coordinator.plants
+    }
+
+
+def _updated_rows(coordinator: Any, sent: Dict[RowKey, Row]) -> Dict[RowKey, Row]:
+    """Erstelle nur die Zeilen der Pflanzen, die das letzte Update geändert hat.
+
+    Name und Pflanzen eines Eintrags ändern sich nur mit einem Neuladen;
+    der Name wird daher aus der zuletzt gesendeten Zeile übernommen. Ist
+    eine Pflanze noch unbekannt, werden alle Zeilen neu erstellt.
+    """
+    updated = coordinator.updated_plants()
+    if updated is None:
+        return _coordinator_rows([coordinator])
+    entry_id = coordinator.config_entry.entry_id
+    rows: Dict[RowKey, Row] = {}
+    for plant_id in updated:
+        previous = sent.get((entry_id, plant_id))
+        if previous is None:
+            return _coordinator_rows([coordinator])
+        rows[(entry_id, plant_id)] = _plant_row(
+            coordinator, {"plant_id": plant_id, "name": previous[_NAME_INDEX]}
+        )
+    return rows
+
+
+def _entry_coordinators(hass: HomeAssistant, entry_id: Optional[str]) -> List[Any]:
+    """Gib die Coordinatoren aller bzw. eines Eintrags zurück."""
+    from .services import async_get_coordinators
+
+    return [
+        coordinator
+        for coordinator in async_get_coordinators(hass)
+        if entry_id is None or coordinator.config_entry.entry_id == entry_id
+    ]
+
+
+def _columnar(rows: Dict[RowKey, Row]) -> Dict[str, Any]:
+    """Wandle Zeilen in ein spaltenweises Snapshot-Format um."""
+    return {
+        "plants": len(rows),
+        "columns": {
+            column: [row[index] for row in rows.values()]
+            for index, column in enumerate(SNAPSHOT_COLUMNS)
+        },
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "planthub/snapshot",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Gib alle Pflanzen als eine spaltenweise Nachricht zurück."""
+    rows = _coordinator_rows(_entry_coordinators(hass, msg.get("entry_id")))
+    connection.send_result(msg["id"], _columnar(rows))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "planthub/subscribe",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Sende einen Snapshot und danach nur noch Änderungen je Pflanze.
+
+    Ein Delta enthält je Eintrag und geänderter Pflanze nur die geänderten
+    Spalten (``delta``) sowie je Eintrag die nicht mehr vorhandenen
+    Pflanzen (``removed``). Nach einem Update werden nur die Zeilen der
+    Pflanzen mit neuen Daten neu erstellt.
+    """
+    entry_id = msg.get("entry_id")
+    sent = _coordinator_rows(_entry_coordinators(hass, entry_id))
+
+    @callback
+    def _async_plants_updated(coordinator: Optional[Any]) -> None:
+        """Sende die Änderungen seit der letzten Nachricht."""
+        if coordinator is None:
+            # Eintrag entladen oder neu geladen: alle Pflanzen vergleichen
+            rows = _coordinator_rows(_entry_coordinators(hass, entry_id))
+            removed_keys = [key for key in sent if key not in rows]
+        elif entry_id is None or coordinator.config_entry.entry_id == entry_id:
+            rows = _updated_rows(coordinator, sent)
+            removed_keys = []
+        else:
+            return
+
+        delta: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for key, row in rows.items():
+            previous = sent.get(key)
+            if previous == row:
+                continue
+            delta.setdefault(key[0], {})[key[1]] = {
+                column: row[index]
+                for index, column in enumerate(SNAPSHOT_COLUMNS)
+                if previous is None or previous[index] != row[index]
+            }
+            sent[key] = row
+        removed: Dict[str, List[str]] = {}
+        for key in removed_keys:
+            del sent[key]
+            removed.setdefault(key[0], []).append(key[1])
+
+        if delta or removed:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"delta": delta, "removed": removed})
+            )
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_PLANTS_UPDATED, _async_plants_updated
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"snapshot": _columnar(sent)})
+    )
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Registriere die WebSocket-Befehle."""
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe)
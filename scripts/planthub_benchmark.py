@@ -0,0 +1,246 @@
+"""Microbenchmarks der Normalisierungs- und Validierungs-Pipeline.
+
+Misst Zeit und Speicher pro Messwert für ``PlantDataNormalizer.normalize``
+(inklusive Konvertierung und Bereichsprüfung je Feld) und
+``parse_source_timestamp`` mit realistischen, reproduzierbaren Payloads.
+Die Ergebnisse werden mit ``scripts/benchmark_baseline.json`` verglichen;
+bei einer Regression endet das Skript mit Exit-Code 1.
+
+Start:
+    python scripts/planthub_benchmark.py
+    python scripts/planthub_benchmark.py --update-baseline
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.planthub.normalizer import PlantDataNormalizer  # noqa: E402
+from custom_components.planthub.webhook import parse_source_timestamp  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmark_baseline.json"
+
+# Messwerte je Fall und Wiederholungen der Zeitmessung
+READINGS = 2000
+REPEATS = 7
+
+# Erlaubte Abweichung gegenüber der Baseline
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.1
+
+
+def _canonical(rng: random.Random, index: int) -> Dict[str, Any]:
+    """Payload mit den kanonischen Schlüsseln und Zahlenwerten."""
+    return {
+        "plant_id": f"plant_{index}",
+        "name": f"Pflanze {index}",
+        "soil_moisture": round(rng.uniform(10, 90), 1),
+        "air_temperature": round(rng.uniform(15, 30), 2),
+        "air_humidity": round(rng.uniform(30, 80), 1),
+        "light": round(rng.uniform(0, 30000)),
+        "battery": rng.randint(5, 100),
+        "conductivity": round(rng.uniform(100, 2000)),
+        "last_updated": f"2024-05-{1 + index % 28:02d}T{index % 24:02d}:15:00+00:00",
+    }
+
+
+def _aliases(rng: random.Random, index: int) -> Dict[str, Any]:
+    """Payload mit Alias-Schlüsseln, teils mehreren Aliasen je Feld."""
+    return {
+        "plant_id": f"plant_{index}",
+        "plant_name": f"Pflanze {index}",
+        "moisture": round(rng.uniform(10, 90), 1),
+        "temperature": round(rng.uniform(15, 30), 2),
+        "humidity": round(rng.uniform(30, 80), 1),
+        "illuminance": round(rng.uniform(0, 30000)),
+        "light": round(rng.uniform(0, 30000)),
+        "battery_level": rng.randint(5, 100),
+        "ec": round(rng.uniform(100, 2000)),
+        "last_updated": 1714550400 + index * 300,
+    }
+
+
+def _strings(rng: random.Random, index: int) -> Dict[str, Any]:
+    """Payload, dessen Zahlen als Strings geliefert werden."""
+    payload = _canonical(rng, index)
+    for key in ("soil_moisture", "air_temperature", "air_humidity", "light", "battery", "conductivity"):
+        payload[key] = str(payload[key])
+    return payload
+
+
+def _out_of_range(rng: random.Random, index: int) -> Dict[str, Any]:
+    """Payload mit ungültigen Werten außerhalb der Grenzen oder nicht numerisch."""
+    payload = _canonical(rng, index)
+    payload["soil_moisture"] = rng.choice([-5.0, 140.0, float("nan")])
+    payload["air_temperature"] = rng.choice([-80.0, 95.0])
+    payload["air_humidity"] = "n/a"
+    payload["battery"] = None
+    payload["conductivity"] = rng.choice([-1, 1e9])
+    return payload
+
+
+def _fleet(rng: random.Random, index: int) -> Dict[str, Any]:
+    """Gemischte Payloads wie in der Antwort für viele Pflanzen."""
+    generator = (_canonical, _canonical, _canonical, _aliases, _strings, _out_of_range)[index % 6]
+    payload = generator(rng, index)
+    # Unbekannte Zusatzfelder, wie sie Backends oft mitliefern
+    payload["firmware"] = "1.4.2"
+    payload["rssi"] = rng.randint(-90, -30)
+    return payload
+
+
+CASES: Dict[str, Callable[[random.Random, int], Dict[str, Any]]] = {
+    "canonical": _canonical,
+    "aliases": _aliases,
+    "strings": _strings,
+    "out_of_range": _out_of_range,
+    "fleet": _fleet,
+}
+
+
+def _pipeline(normalizer: PlantDataNormalizer) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Verarbeitung eines Messwerts wie in ``PlantHubWebhook.fetch_plant_data``."""
+
+    def _run(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return normalizer.normalize(payload, payload["plant_id"], parse_source_timestamp(payload))
+
+    return _run
+
+
+def _measure(payloads: List[Dict[str, Any]], run: Callable[[Dict[str, Any]], Any]) -> Dict[str, float]:
+    """Miss Zeit und Speicher pro Messwert."""
+    run(payloads[0])  # Aufwärmen (Caches, Lazy-Imports)
+
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter_ns()
+        for payload in payloads:
+            run(payload)
+        timings.append((time.perf_counter_ns() - started) / len(payloads))
+
+    # Speicher der Ergebnisse (wie sie im Coordinator gehalten werden) und Spitze
+    tracemalloc.start()
+    results = [run(payload) for payload in payloads]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    return {
+        "ns_per_reading": round(min(timings), 1),
+        "ns_median": round(statistics.median(timings), 1),
+        "bytes_per_reading": round(current / len(payloads), 1),
+        "peak_bytes_per_reading": round(peak / len(payloads), 1),
+    }
+
+
+def run_benchmarks(readings: int = READINGS) -> Dict[str, Dict[str, float]]:
+    """Führe alle Fälle aus."""
+    run = _pipeline(PlantDataNormalizer())
+    results = {}
+    for name, generator in CASES.items():
+        rng = random.Random(name)
+        payloads = [generator(rng, index) for index in range(readings)]
+        results[name] = _measure(payloads, run)
+    return results
+
+
+def _compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> List[str]:
+    """Gib alle Regressionen gegenüber der Baseline zurück."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        limit = reference["ns_per_reading"] * (1 + time_tolerance)
+        if result["ns_per_reading"] > limit:
+            regressions.append(
+                f"{name}: {result['ns_per_reading']:.0f} ns/Messwert > {limit:.0f} "
+                f"(Baseline {reference['ns_per_reading']:.0f})"
+            )
+        limit = reference["bytes_per_reading"] * (1 + memory_tolerance)
+        if result["bytes_per_reading"] > limit:
+            regressions.append(
+                f"{name}: {result['bytes_per_reading']:.0f} B/Messwert > {limit:.0f} "
+                f"(Baseline {reference['bytes_per_reading']:.0f})"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Führe die Benchmarks aus und vergleiche mit der Baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readings", type=int, default=READINGS)
+    parser.add_argument("--update-baseline", action="store_true", help="Baseline neu schreiben")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    parser.add_argument("--json", action="store_true", help="Ergebnisse als JSON ausgeben")
+    args = parser.parse_args()
+
+    # Ungültige Werte loggen Warnungen; gemessen wird die Pipeline, nicht die Ausgabe
+    logging.disable(logging.CRITICAL)
+    results = run_benchmarks(args.readings)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Fall':<14}{'ns/Messwert':>13}{'Median':>10}{'B/Messwert':>12}{'Spitze':>10}")
+        for name, result in results.items():
+            print(
+                f"{name:<14}{result['ns_per_reading']:>13.0f}{result['ns_median']:>10.0f}"
+                f"{result['bytes_per_reading']:>12.0f}{result['peak_bytes_per_reading']:>10.0f}"
+            )
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "cases": results,
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"Baseline geschrieben: {BASELINE_PATH}")
+        return 0
+
+    if not BASELINE_PATH.exists():
+        print("Keine Baseline vorhanden, mit --update-baseline anlegen")
+        return 0
+
+    stored = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    if stored.get("python") != platform.python_version():
+        print(f"Hinweis: Baseline mit Python {stored.get('python')} erstellt")
+    regressions = _compare(
+        results, stored["cases"], args.time_tolerance, args.memory_tolerance
+    )
+    if regressions:
+        print("REGRESSION:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("Keine Regression gegenüber der Baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
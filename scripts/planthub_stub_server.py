@@ -0,0 +1,256 @@
+"""Lokaler Stand-in-Server für die PlantHub Webhook-API.
+
+Liefert synthetische, reproduzierbare Messwerte für beliebige Pflanzen,
+damit die Integration ohne n8n-Backend getestet werden kann.
+
+Start:
+    python scripts/planthub_stub_server.py --port 5678 --token test
+
+In Home Assistant anschließend ``http://<host>:5678`` als Backend verwenden.
+Der Stream-Endpunkt liefert alle ``--stream-interval`` Sekunden neue
+Messwerte der abonnierten Pflanzen als Server-Sent Events.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger("planthub_stub_server")
+
+WEBHOOK_ENDPOINT = "/webhook/v1/planthub"
+WEBHOOK_HISTORY_ENDPOINT = "/webhook/v1/planthub/history"
+WEBHOOK_STREAM_ENDPOINT = "/webhook/v1/planthub/stream"
+
+# Abstand zwischen zwei synthetischen Messwerten der Historie
+HISTORY_STEP = timedelta(minutes=5)
+# Obergrenze, damit versehentlich riesige Zeiträume den Server nicht blockieren
+MAX_HISTORY_READINGS = 50_000
+# Gespeicherte Stream-Ereignisse für das Fortsetzen per Last-Event-ID
+STREAM_LOG_SIZE = 1000
+# Abstand der Keepalive-Kommentare im Stream
+STREAM_KEEPALIVE = 15.0
+
+
+def _plant_seed(plant_id: str) -> float:
+    """Leite einen stabilen Phasenversatz aus der plant_id ab."""
+    digest = hashlib.sha256(plant_id.encode()).digest()
+    return digest[0] / 255 * 2 * math.pi
+
+
+def synthetic_reading(plant_id: str, timestamp: datetime) -> Dict[str, Any]:
+    """Erzeuge einen Messwert mit Tagesgang und langsamem Austrocknen."""
+    seed = _plant_seed(plant_id)
+    hours = timestamp.timestamp() / 3600
+    day_phase = 2 * math.pi * (hours % 24) / 24 + seed
+    # Sägezahn: alle 72 Stunden wird gegossen
+    drying = (hours + seed * 10) % 72 / 72
+
+    return {
+        "plant_id": plant_id,
+        "name": plant_id,
+        "soil_moisture": round(85 - 60 * drying, 1),
+        "air_temperature": round(21 + 3 * math.sin(day_phase), 2),
+        "air_humidity": round(55 + 10 * math.cos(day_phase), 1),
+        "light": round(max(0.0, 20000 * math.sin(day_phase)), 0),
+        "last_updated": timestamp.isoformat(),
+    }
+
+
+def _parse_time(value: Any, default: datetime) -> datetime:
+    """Parse einen ISO-Zeitstempel aus dem Request-Body."""
+    if not value:
+        return default
+    parsed = datetime.fromisoformat(str(value))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _project(reading: Dict[str, Any], fields: Any) -> Dict[str, Any]:
+    """Beschränke einen Messwert auf die angefragten Felder."""
+    if not fields:
+        return reading
+    wanted = set(fields) | {"plant_id"}
+    return {key: value for key, value in reading.items() if key in wanted}
+
+
+def _json_response(request: web.Request, data: Any) -> web.Response:
+    """Erzeuge eine JSON-Antwort, komprimiert nach Accept-Encoding."""
+    response = web.json_response(data)
+    if request.headers.get("Accept-Encoding"):
+        response.enable_compression()
+    return response
+
+
+def _check_auth(request: web.Request) -> None:
+    """Prüfe den Bearer-Token, falls einer konfiguriert ist."""
+    token = request.app["token"]
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        raise web.HTTPUnauthorized()
+
+
+async def handle_plant(request: web.Request) -> web.Response:
+    """Beantworte eine Abfrage des aktuellen Messwerts."""
+    _check_auth(request)
+    body = await request.json()
+    plant_id = body.get("plant_id")
+    if not plant_id:
+        raise web.HTTPBadRequest(text="plant_id fehlt")
+
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    reading = _project(synthetic_reading(plant_id, now), body.get("fields"))
+    return _json_response(request, [reading])
+
+
+async def handle_history(request: web.Request) -> web.Response:
+    """Beantworte eine Abfrage der Messwert-Historie."""
+    _check_auth(request)
+    body = await request.json()
+    plant_id = body.get("plant_id")
+    if not plant_id:
+        raise web.HTTPBadRequest(text="plant_id fehlt")
+
+    now = datetime.now(timezone.utc)
+    end = min(_parse_time(body.get("end"), now), now)
+    start = _parse_time(body.get("start"), end - timedelta(days=1))
+
+    readings: List[Dict[str, Any]] = []
+    timestamp = start
+    while timestamp < end and len(readings) < MAX_HISTORY_READINGS:
+        readings.append(_project(synthetic_reading(plant_id, timestamp), body.get("fields")))
+        timestamp += HISTORY_STEP
+
+    _LOGGER.info("Historie für %s: %d Messwerte", plant_id, len(readings))
+    return _json_response(request, {"readings": readings})
+
+
+def _publish(app: web.Application, plant_ids: Any) -> None:
+    """Erzeuge neue Stream-Ereignisse und wecke wartende Verbindungen."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    log: Deque[Tuple[int, str, Dict[str, Any]]] = app["stream_log"]
+    for plant_id in plant_ids:
+        app["stream_seq"] += 1
+        log.append((app["stream_seq"], plant_id, synthetic_reading(plant_id, now)))
+    app["stream_wakeup"].set()
+    app["stream_wakeup"] = asyncio.Event()
+
+
+async def _stream_publisher(app: web.Application) -> AsyncIterator[None]:
+    """Veröffentliche periodisch neue Messwerte aller abonnierten Pflanzen."""
+    app["stream_wakeup"] = asyncio.Event()
+
+    async def _run() -> None:
+        while True:
+            await asyncio.sleep(app["stream_interval"])
+            if app["stream_plants"]:
+                _publish(app, sorted(app["stream_plants"]))
+
+    task = asyncio.create_task(_run())
+    yield
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def handle_stream(request: web.Request) -> web.StreamResponse:
+    """Liefere Messwerte als Server-Sent Events.
+
+    Mit ``Last-Event-ID`` werden verpasste Ereignisse nachgeliefert. Liegt
+    der Cursor außerhalb des gespeicherten Verlaufs, wird ein ``reset``
+    gesendet und die Verbindung beendet.
+    """
+    _check_auth(request)
+    app = request.app
+    wanted = {p for p in request.query.get("plants", "").split(",") if p}
+    if not wanted:
+        raise web.HTTPBadRequest(text="plants fehlt")
+    fields = [f for f in request.query.get("fields", "").split(",") if f]
+
+    response = web.StreamResponse(
+        headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+    )
+    await response.prepare(request)
+    log: Deque[Tuple[int, str, Dict[str, Any]]] = app["stream_log"]
+
+    cursor = request.headers.get("Last-Event-ID")
+    if cursor is None:
+        # Neue Verbindung: zuerst den aktuellen Stand aller Pflanzen
+        last = app["stream_seq"]
+        _publish(app, sorted(wanted))
+    else:
+        try:
+            last = int(cursor)
+        except ValueError:
+            last = -1
+        oldest = log[0][0] if log else app["stream_seq"] + 1
+        if last < oldest - 1 or last > app["stream_seq"]:
+            _LOGGER.info("Stream-Cursor %s nicht fortsetzbar, sende reset", cursor)
+            await response.write(b"event: reset\ndata: {}\n\n")
+            return response
+    app["stream_plants"].update(wanted)
+    _LOGGER.info("Stream für %d Pflanzen ab Ereignis %d", len(wanted), last)
+
+    try:
+        while True:
+            head = app["stream_seq"]
+            for seq, plant_id, reading in [e for e in log if last < e[0] <= head]:
+                if plant_id not in wanted:
+                    continue
+                payload = json.dumps(_project(reading, fields))
+                await response.write(f"id: {seq}\nevent: reading\ndata: {payload}\n\n".encode())
+            last = head
+            if app["stream_seq"] > last:
+                continue
+            try:
+                await asyncio.wait_for(app["stream_wakeup"].wait(), STREAM_KEEPALIVE)
+            except asyncio.TimeoutError:
+                await response.write(b": keepalive\n\n")
+    except ConnectionResetError:
+        _LOGGER.info("Stream-Verbindung vom Client beendet")
+    return response
+
+
+def create_app(token: str | None = None, stream_interval: float = 10.0) -> web.Application:
+    """Erstelle die aiohttp-Anwendung des Stand-in-Servers."""
+    app = web.Application()
+    app["token"] = token
+    app["stream_interval"] = stream_interval
+    app["stream_log"] = deque(maxlen=STREAM_LOG_SIZE)
+    app["stream_seq"] = 0
+    app["stream_plants"] = set()
+    app.cleanup_ctx.append(_stream_publisher)
+    app.router.add_post(WEBHOOK_ENDPOINT, handle_plant)
+    app.router.add_post(WEBHOOK_HISTORY_ENDPOINT, handle_history)
+    app.router.add_get(WEBHOOK_STREAM_ENDPOINT, handle_stream)
+    return app
+
+
+def main() -> None:
+    """Starte den Stand-in-Server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5678)
+    parser.add_argument("--token", default=None, help="Erwarteter Bearer-Token")
+    parser.add_argument(
+        "--stream-interval", type=float, default=10.0, help="Sekunden zwischen Stream-Messwerten"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(
+        create_app(args.token, args.stream_interval), host=args.host, port=args.port
+    )
+
+
+if __name__ == "__main__":
+    main()